@@ -1,15 +1,46 @@
 """Streamlit Webアプリ エントリーポイント."""
 
+import os
+from typing import Dict
+
 import streamlit as st
-import tempfile
 from pathlib import Path
 
-from presentation_feedback.core import transcribe_audio, extract_audio_features
-from presentation_feedback.agents import (
-    create_speech_analyzer,
-    create_content_analyzer,
-    create_orchestrator_agent,
+from presentation_feedback import run_analysis_pipeline
+from presentation_feedback.pipeline import ANALYSIS_MODE, ANALYSIS_MODES
+from presentation_feedback.agents import create_speech_analyzer, get_invocation_metrics, get_response_cache
+from presentation_feedback.agents.speech_analyzer import SPEECH_ANALYSIS_MODE, SPEECH_ANALYSIS_MODES
+from presentation_feedback.core import (
+    transcribe_audio,
+    extract_audio_features,
+    extract_acoustic_features,
+    available_transcribers,
 )
+from presentation_feedback.core.audio_normalizer import NORMALIZE_ENABLED
+from presentation_feedback.core.transcriber import TRANSCRIBE_BACKEND, transcribe_fileobj
+from presentation_feedback.core.uploads import get_peak_rss_mb, save_upload_to_temp
+
+
+# 1: アップロードファイルをローカルに保存せずS3へ直接送る（batch方式のみ）
+UPLOAD_DIRECT_TO_S3 = os.getenv("UPLOAD_DIRECT_TO_S3", "0") == "1"
+
+PRIORITY_MARKS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+def render_strength(index: int, strength: Dict):
+    """よかった点を1件表示."""
+    with st.expander(f"{index}. {strength.get('category', '')}", expanded=True):
+        st.write(strength.get('description', ''))
+        if strength.get('evidence'):
+            st.caption(f"📊 根拠: {strength['evidence']}")
+
+
+def render_improvement(index: int, improvement: Dict):
+    """改善点を1件表示."""
+    priority_mark = PRIORITY_MARKS.get(improvement.get('priority', 'medium'), "🟡")
+    with st.expander(f"{index}. {priority_mark} {improvement.get('category', '')}", expanded=True):
+        st.write(f"**課題:** {improvement.get('issue', '')}")
+        st.write(f"**提案:** {improvement.get('suggestion', '')}")
 
 
 st.set_page_config(
@@ -21,10 +52,46 @@ st.set_page_config(
 st.title("🎤 プレゼンフィードバック")
 st.markdown("音声ファイルをアップロードして、プレゼンテーションのフィードバックを取得")
 
+# 書き起こし方式
+backends = available_transcribers()
+transcribe_backend = st.sidebar.selectbox(
+    "書き起こし方式",
+    backends,
+    index=backends.index(TRANSCRIBE_BACKEND) if TRANSCRIBE_BACKEND in backends else 0,
+    help=(
+        "batch: AWS Transcribe / chunked: 長時間音声を分割して並列に書き起こし / "
+        "streaming: Transcribe Streaming / local: ローカルASR（AWS不要）"
+    )
+)
+normalize_before_transcribe = st.sidebar.checkbox(
+    "音声を正規化してから書き起こす",
+    value=NORMALIZE_ENABLED,
+    help="16kHzモノラルの圧縮音声に変換し、前後の無音を除去してから送信します（要ffmpeg）"
+)
+
+analysis_mode = st.sidebar.selectbox(
+    "分析方式",
+    ANALYSIS_MODES,
+    index=ANALYSIS_MODES.index(ANALYSIS_MODE) if ANALYSIS_MODE in ANALYSIS_MODES else 0,
+    help=(
+        "multi_agent: 話し方・内容・統合の3エージェントで分析 / "
+        "single_pass: 1回の呼び出しでレポートを生成（高速・低コスト）"
+    )
+)
+speech_analysis_mode = st.sidebar.selectbox(
+    "話し方の分析方式（multi_agentのみ）",
+    SPEECH_ANALYSIS_MODES,
+    index=SPEECH_ANALYSIS_MODES.index(SPEECH_ANALYSIS_MODE) if SPEECH_ANALYSIS_MODE in SPEECH_ANALYSIS_MODES else 0,
+    help=(
+        "llm: AIが分析 / rules: ルールベースの採点のみ（AI不要・即時） / "
+        "hybrid: ルールベースで採点し、AIは講評だけを書く"
+    )
+)
+
 # ファイルアップロード
 uploaded_file = st.file_uploader(
     "音声ファイルをアップロード",
-    type=["mp3", "wav", "m4a", "ogg"],
+    type=["mp3", "wav", "m4a", "ogg", "flac"],
     help="プレゼンテーション音声ファイルを選択してください"
 )
 
@@ -34,10 +101,14 @@ if uploaded_file:
 
     # 分析開始ボタン
     if st.button("📊 分析開始", type="primary"):
-        # 一時ファイルとして保存
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_file:
-            tmp_file.write(uploaded_file.read())
-            audio_path = tmp_file.name
+        direct_upload = UPLOAD_DIRECT_TO_S3 and transcribe_backend == "batch" and not normalize_before_transcribe
+        audio_path = None
+        acoustic = None
+        speech_analyzer = create_speech_analyzer(mode=speech_analysis_mode)
+        # 波形の音響特徴量（音声全体のデコードとピッチ推定）は、LLMが話し方を分析する場合のみ使う
+        needs_acoustic = (
+            not direct_upload and analysis_mode == "multi_agent" and speech_analyzer.uses_acoustic_features
+        )
 
         try:
             # プログレス表示
@@ -47,64 +118,119 @@ if uploaded_file:
             # 1. 書き起こし
             status_text.text("🎙️ 音声を書き起こし中...")
             progress_bar.progress(10)
-            transcription = transcribe_audio(audio_path)
+
+            def show_upload_progress(uploaded: int, total: int):
+                # アップロードは書き起こし工程の前半（10〜20%）として表示
+                ratio = uploaded / total if total else 1.0
+                status_text.text(
+                    f"☁️ 音声をアップロード中... {uploaded / 1024 / 1024:.1f} / {total / 1024 / 1024:.1f} MB"
+                )
+                progress_bar.progress(10 + int(10 * ratio))
+                if uploaded >= total:
+                    status_text.text("🎙️ 音声を書き起こし中...")
+
+            if direct_upload:
+                transcription = transcribe_fileobj(
+                    uploaded_file, uploaded_file.name, on_upload_progress=show_upload_progress
+                )
+            else:
+                # 一時ファイルにチャンク単位でコピー（ファイル全体をメモリに読み込まない）
+                audio_path = save_upload_to_temp(uploaded_file, suffix=Path(uploaded_file.name).suffix)
+                if needs_acoustic:
+                    # 正規化の無音除去にも同じ結果を使うため、書き起こしの前に1回だけデコードする
+                    status_text.text("📈 音声の波形を解析中...")
+                    try:
+                        acoustic = extract_acoustic_features(audio_path)
+                    except (RuntimeError, OSError) as e:
+                        # デコードできない場合（ffmpeg未インストール等）は書き起こし由来の特徴量のみで続行
+                        st.warning(f"音響特徴量を抽出できませんでした: {e}")
+                    status_text.text("🎙️ 音声を書き起こし中...")
+                transcription = transcribe_audio(
+                    audio_path,
+                    backend=transcribe_backend,
+                    on_upload_progress=show_upload_progress if transcribe_backend == "batch" else None,
+                    normalize=normalize_before_transcribe,
+                    acoustic=acoustic,
+                )
 
             # 2. 音声特徴量抽出
             status_text.text("📈 音声特徴量を抽出中...")
             progress_bar.progress(25)
             audio_features = extract_audio_features(transcription)
+            if acoustic is not None:
+                audio_features["acoustic"] = acoustic
 
-            # 3. AI分析
-            status_text.text("🤖 話し方を分析中...")
-            progress_bar.progress(40)
-            speech_analyzer = create_speech_analyzer()
-            speech_result = speech_analyzer.analyze_speech(transcription, audio_features)
+            # 3. AI分析（話し方・内容を並列実行 → 統合レポート）
+            stage_messages = {
+                "analysis": ("🤖 話し方と内容を分析中...", 40),
+                "report": ("🤖 総合フィードバックを生成中...", 80),
+            }
 
-            status_text.text("🤖 内容を分析中...")
-            progress_bar.progress(60)
-            content_analyzer = create_content_analyzer()
-            content_result = content_analyzer.analyze_content(transcription)
+            def show_stage(stage: str):
+                message, percent = stage_messages[stage]
+                status_text.text(message)
+                progress_bar.progress(percent)
 
-            status_text.text("🤖 総合フィードバックを生成中...")
-            progress_bar.progress(80)
-            orchestrator = create_orchestrator_agent()
-            final_report = orchestrator.generate_feedback_report(speech_result, content_result)
+            # 結果表示欄（統合レポートは生成されたものから順に表示する）
+            status_area = st.container()
+            st.markdown("---")
+            summary_area = st.container()
+            strengths_area = st.container()
+            improvements_area = st.container()
+            rendered = {"chars": 0, "summary": False, "strengths": 0, "improvements": 0}
 
-            # 4. 完了
-            progress_bar.progress(100)
-            status_text.text("✅ 分析完了！")
+            def show_summary(summary: str):
+                with summary_area:
+                    st.subheader("📝 総合サマリ")
+                    st.write(summary)
+                rendered["summary"] = True
 
-            st.success("分析が完了しました！")
+            def show_strength(strength: Dict):
+                with strengths_area:
+                    if rendered["strengths"] == 0:
+                        st.subheader("✨ よかった点")
+                    rendered["strengths"] += 1
+                    render_strength(rendered["strengths"], strength)
 
-            # 結果表示
-            st.markdown("---")
+            def show_improvement(improvement: Dict):
+                with improvements_area:
+                    if rendered["improvements"] == 0:
+                        st.subheader("💡 改善点")
+                    rendered["improvements"] += 1
+                    render_improvement(rendered["improvements"], improvement)
 
-            # 総合サマリ
-            st.subheader("📝 総合サマリ")
-            st.write(final_report.get("summary", "（サマリなし）"))
-
-            # よかった点
-            st.subheader("✨ よかった点")
-            for i, strength in enumerate(final_report.get("strengths", []), 1):
-                with st.expander(f"{i}. {strength.get('category', '')}", expanded=True):
-                    st.write(strength.get('description', ''))
-                    if strength.get('evidence'):
-                        st.caption(f"📊 根拠: {strength['evidence']}")
-
-            # 改善点
-            st.subheader("💡 改善点")
-            for i, improvement in enumerate(final_report.get("improvements", []), 1):
-                priority = improvement.get('priority', 'medium')
-                priority_map = {
-                    "high": ("🔴", "error"),
-                    "medium": ("🟡", "warning"),
-                    "low": ("🟢", "info")
-                }
-                priority_mark, priority_type = priority_map.get(priority, ("🟡", "warning"))
-
-                with st.expander(f"{i}. {priority_mark} {improvement.get('category', '')}", expanded=True):
-                    st.write(f"**課題:** {improvement.get('issue', '')}")
-                    st.write(f"**提案:** {improvement.get('suggestion', '')}")
+            def show_report_event(event: Dict):
+                if event["type"] == "text":
+                    rendered["chars"] += len(event["text"])
+                    status_text.text(f"🤖 総合フィードバックを生成中...（{rendered['chars']}文字）")
+                elif event["type"] == "field" and event["key"] == "summary":
+                    show_summary(event["value"])
+                elif event["type"] == "item" and event["key"] == "strengths":
+                    show_strength(event["value"])
+                elif event["type"] == "item" and event["key"] == "improvements":
+                    show_improvement(event["value"])
+                else:
+                    return
+                progress_bar.progress(min(95, 80 + 2 * (rendered["strengths"] + rendered["improvements"])))
+
+            pipeline_result = run_analysis_pipeline(
+                transcription,
+                audio_features,
+                speech_analyzer=speech_analyzer,
+                on_stage=show_stage,
+                on_report_event=show_report_event,
+                mode=analysis_mode,
+            )
+            final_report = pipeline_result["report"]
+            timings = pipeline_result["timings"]
+
+            # ストリーミング中に表示できなかった分（JSONとして解釈できなかった場合等）を表示
+            if not rendered["summary"]:
+                show_summary(final_report.get("summary", "（サマリなし）"))
+            for strength in final_report.get("strengths", [])[rendered["strengths"]:]:
+                show_strength(strength)
+            for improvement in final_report.get("improvements", [])[rendered["improvements"]:]:
+                show_improvement(improvement)
 
             # 詳細フィードバック
             with st.expander("📄 詳細フィードバック"):
@@ -112,6 +238,56 @@ if uploaded_file:
                 if detailed:
                     st.write(detailed)
 
+            # 4. 完了
+            progress_bar.progress(100)
+            status_text.text("✅ 分析完了！")
+
+            with status_area:
+                st.success("分析が完了しました！")
+                first_content = timings.get("report_first_content")
+                first_content_text = f"（最初の表示まで {first_content:.1f}秒）" if first_content is not None else ""
+                if pipeline_result["mode"] == "single_pass":
+                    st.caption(
+                        f"⏱ 分析時間: 1回の呼び出し {timings['report']:.1f}秒{first_content_text}"
+                        f" / 合計 {timings['total']:.1f}秒"
+                    )
+                else:
+                    st.caption(
+                        f"⏱ 分析時間: 話し方 {timings['speech_analysis']:.1f}秒 / "
+                        f"内容 {timings['content_analysis']:.1f}秒（並列 {timings['analysis']:.1f}秒） / "
+                        f"統合 {timings['report']:.1f}秒{first_content_text}"
+                        f" / 合計 {timings['total']:.1f}秒"
+                    )
+                normalization = transcription.get("normalization")
+                if normalization:
+                    st.caption(
+                        f"🗜 音声の正規化: {normalization['input_bytes'] / 1024 / 1024:.1f}MB → "
+                        f"{normalization['output_bytes'] / 1024 / 1024:.1f}MB"
+                        f"（{normalization['bytes_saved'] / 1024 / 1024:.1f}MB削減）"
+                    )
+                # Bedrock呼び出しの待ち状況（プロセス全体の累計）
+                for model_id, metrics in get_invocation_metrics().items():
+                    st.caption(
+                        f"🚦 {model_id}: 呼び出し {metrics['calls']}回 / "
+                        f"待ち時間 平均 {metrics['wait_time_avg']:.2f}秒・最大 {metrics['wait_time_max']:.2f}秒 / "
+                        f"待機中 {metrics['queue_depth']}件 / スロットリング {metrics['throttled']}回"
+                    )
+                response_cache = get_response_cache()
+                if response_cache is not None:
+                    cache_stats = response_cache.get_stats()
+                    st.caption(
+                        f"♻ 応答キャッシュ: ヒット率 {cache_stats['hit_rate']:.0%}"
+                        f"（{cache_stats['hits']}/{cache_stats['hits'] + cache_stats['misses']}） / "
+                        f"削減トークン {cache_stats['tokens_saved']:,}"
+                    )
+                # プロセス全体のピーク値（他のセッション・過去の分析も含む）
+                peak_rss_mb = get_peak_rss_mb()
+                if peak_rss_mb is not None:
+                    st.caption(
+                        f"💾 プロセスのピークメモリ（起動以降の最大値、この分析だけの値ではありません）: "
+                        f"{peak_rss_mb:.0f} MB"
+                    )
+
         except NotImplementedError as e:
             st.error(f"⚠ エラー: {e}")
             st.info("実装が完了していません。")
@@ -119,7 +295,8 @@ if uploaded_file:
             st.error(f"❌ エラー: {e}")
         finally:
             # 一時ファイル削除
-            Path(audio_path).unlink(missing_ok=True)
+            if audio_path is not None:
+                Path(audio_path).unlink(missing_ok=True)
 
 else:
     st.info("👆 音声ファイルをアップロードしてください")
@@ -1,22 +1,104 @@
 #!/usr/bin/env python3
-"""CLI エントリーポイント（デモモード専用）."""
+"""CLI エントリーポイント（単一ファイルはデモモード専用、batchサブコマンドは本番/デモ両対応）."""
 
 import sys
 import argparse
 from pathlib import Path
 
 # デモモード専用のインポート
+from presentation_feedback import run_analysis_pipeline
 from presentation_feedback.demo import (
     transcribe_audio_demo as transcribe_audio,
     extract_audio_features_demo as extract_audio_features,
     create_speech_analyzer_demo as create_speech_analyzer,
     create_content_analyzer_demo as create_content_analyzer,
     create_orchestrator_agent_demo as create_orchestrator_agent,
+    create_single_pass_analyzer_demo as create_single_pass_analyzer,
 )
+from presentation_feedback.pipeline import ANALYSIS_MODE, ANALYSIS_MODES
+
+
+def batch_main(argv):
+    """
+    batchサブコマンド: ディレクトリまたはglobに一致する音声ファイルをまとめて分析.
+
+    Args:
+        argv: サブコマンド以降の引数
+    """
+    from presentation_feedback.batch import collect_audio_files, run_batch
+
+    parser = argparse.ArgumentParser(
+        prog="cli.py batch",
+        description="プレゼンテーション音声分析 - バッチ処理（ファイルごとのJSON + 集計JSONLを出力）"
+    )
+    parser.add_argument("target", help="音声ファイルのディレクトリまたはglobパターン（例: 'recordings/**/*.mp3'）")
+    parser.add_argument(
+        "--output-dir", default="batch_output", help="出力ディレクトリ（デフォルト: batch_output）"
+    )
+    parser.add_argument(
+        "--language", default="ja-JP", help="言語コード（デフォルト: ja-JP）"
+    )
+    parser.add_argument(
+        "--transcribe-concurrency", type=int, default=4,
+        help="Transcribeジョブの最大同時実行数（デフォルト: 4）"
+    )
+    parser.add_argument(
+        "--bedrock-concurrency", type=int, default=4,
+        help="モデルごとのBedrock呼び出しの最大同時実行数（デフォルト: 4）"
+    )
+    parser.add_argument(
+        "--backend", default=None,
+        help="書き起こし方式（batch / chunked / streaming / local、デフォルト: 環境変数TRANSCRIBE_BACKEND）"
+    )
+    parser.add_argument(
+        "--mode", choices=ANALYSIS_MODES, default=ANALYSIS_MODE,
+        help=f"分析方式（multi_agent: 3エージェント / single_pass: 1回の呼び出し、デフォルト: {ANALYSIS_MODE}）"
+    )
+    parser.add_argument(
+        "--speech-mode", choices=("llm", "rules", "hybrid"), default=None,
+        help="話し方分析のモード（llm: AIが分析 / rules: ルールベースの採点のみ / hybrid: 採点はルール、講評のみAI、"
+             "デフォルト: 環境変数SPEECH_ANALYSIS_MODE、未設定ならllm）"
+    )
+    parser.add_argument("--demo", action="store_true", help="ダミーデータで実行")
+    args = parser.parse_args(argv)
+
+    audio_files = collect_audio_files(args.target)
+    if not audio_files:
+        print(f"❌ 音声ファイルが見つかりません: {args.target}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"📦 バッチ分析: {len(audio_files)}ファイル → {args.output_dir}")
+    print("=" * 60)
+
+    summary = run_batch(
+        audio_files,
+        args.output_dir,
+        language_code=args.language,
+        transcribe_concurrency=args.transcribe_concurrency,
+        bedrock_concurrency=args.bedrock_concurrency,
+        demo=args.demo,
+        backend=args.backend,
+        analysis_mode=args.mode,
+        speech_mode=args.speech_mode,
+    )
+
+    print("\n" + "=" * 60)
+    print(
+        f"✅ 完了: {summary['completed']}件 / スキップ: {summary['skipped']}件 / "
+        f"失敗: {summary['failed']}件（全{summary['total']}件）"
+    )
+    print("=" * 60)
+    if summary["failed"]:
+        sys.exit(1)
 
 
 def main():
     """メイン処理（デモモード専用）."""
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        batch_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="プレゼンテーション音声分析 - フィードバック生成（デモモード）"
     )
@@ -24,6 +106,10 @@ def main():
     parser.add_argument(
         "--language", default="ja-JP", help="言語コード（デフォルト: ja-JP）"
     )
+    parser.add_argument(
+        "--mode", choices=ANALYSIS_MODES, default=ANALYSIS_MODE,
+        help=f"分析方式（multi_agent: 3エージェント / single_pass: 1回の呼び出し、デフォルト: {ANALYSIS_MODE}）"
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -47,22 +133,32 @@ def main():
         # 3. エージェント分析
         print("\n[3/4] AI分析中...")
 
-        # 音声特徴分析エージェント
-        print("  - 話し方を分析中...")
-        speech_analyzer = create_speech_analyzer()
-        speech_result = speech_analyzer.analyze_speech(transcription, audio_features)
-
-        # 内容分析エージェント
-        print("  - 内容を分析中...")
-        content_analyzer = create_content_analyzer()
-        content_result = content_analyzer.analyze_content(transcription)
-
-        # 監督者エージェント
-        print("  - 総合フィードバックを生成中...")
-        orchestrator = create_orchestrator_agent()
-        final_report = orchestrator.generate_feedback_report(speech_result, content_result)
-
-        print("✓ AI分析完了")
+        # 話し方分析・内容分析を並列実行し、監督者エージェントで統合
+        stage_messages = {
+            "analysis": "  - 話し方と内容を分析中...",
+            "report": "  - 総合フィードバックを生成中...",
+        }
+        pipeline_result = run_analysis_pipeline(
+            transcription,
+            audio_features,
+            speech_analyzer=create_speech_analyzer(),
+            content_analyzer=create_content_analyzer(),
+            orchestrator=create_orchestrator_agent(),
+            on_stage=lambda stage: print(stage_messages[stage]),
+            mode=args.mode,
+            single_pass_analyzer=create_single_pass_analyzer(),
+        )
+        final_report = pipeline_result["report"]
+        timings = pipeline_result["timings"]
+
+        if pipeline_result["mode"] == "single_pass":
+            print(f"✓ AI分析完了 (1回の呼び出し / 合計 {timings['total']:.2f}秒)")
+        else:
+            print(
+                f"✓ AI分析完了 (話し方 {timings['speech_analysis']:.2f}秒 / "
+                f"内容 {timings['content_analysis']:.2f}秒 / "
+                f"統合 {timings['report']:.2f}秒 / 合計 {timings['total']:.2f}秒)"
+            )
 
         # 4. 結果表示
         print("\n" + "=" * 60)
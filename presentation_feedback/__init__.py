@@ -1,3 +1,7 @@
 """Prezentation Feedback Agent - プレゼンテーション音声分析システム."""
 
+from .pipeline import run_analysis_pipeline, run_analysis_pipeline_async
+
 __version__ = "0.1.0"
+
+__all__ = ["run_analysis_pipeline", "run_analysis_pipeline_async"]
@@ -3,9 +3,22 @@
 from .speech_analyzer import create_speech_analyzer
 from .content_analyzer import create_content_analyzer
 from .orchestrator import create_orchestrator_agent
+from .single_pass import create_single_pass_analyzer
+from .model_pool import get_bedrock_model, run_agent, run_agent_async, stream_agent
+from .invoker import configure_model_limits, get_invocation_metrics
+from .response_cache import ResponseCache, get_response_cache
 
 __all__ = [
     "create_speech_analyzer",
     "create_content_analyzer",
     "create_orchestrator_agent",
+    "create_single_pass_analyzer",
+    "get_bedrock_model",
+    "run_agent",
+    "run_agent_async",
+    "stream_agent",
+    "configure_model_limits",
+    "get_invocation_metrics",
+    "ResponseCache",
+    "get_response_cache",
 ]
@@ -1,11 +1,18 @@
 """内容分析エージェント"""
 
+import json
 import os
-from strands import Agent
-from strands.models import BedrockModel
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
-from .utils import parse_agent_response
+from ..core.transcript_condenser import (
+    CONTENT_TOKEN_BUDGET,
+    condense_transcript,
+    estimate_tokens,
+    format_timestamp,
+)
+from .model_pool import run_agent
+from .utils import get_response_text, merge_usage, parse_agent_response
 
 
 # オレゴンリージョン（us-west-2）
@@ -15,6 +22,16 @@ AWS_REGION = "us-west-2"
 # CLAUDE_MODEL_ID = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
 CLAUDE_MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
 
+# 分析モード（"single": 1回の呼び出し / "map_reduce": 時間区間ごとに分析して統合 /
+# "auto": 書き起こしが長い場合のみmap_reduce）
+CONTENT_ANALYSIS_MODE = os.getenv("CONTENT_ANALYSIS_MODE", "auto")
+CONTENT_ANALYSIS_MODES = ("single", "map_reduce", "auto")
+# autoでmap_reduceに切り替える書き起こしの推定トークン数
+MAP_REDUCE_THRESHOLD_TOKENS = int(os.getenv("CONTENT_MAP_REDUCE_THRESHOLD_TOKENS", "12000"))
+# 1区間の長さ（秒）と、区間を同時に分析する数
+MAP_WINDOW_SEC = float(os.getenv("CONTENT_MAP_WINDOW_SEC", "600"))
+MAP_CONCURRENCY = int(os.getenv("CONTENT_MAP_CONCURRENCY", "4"))
+
 SYSTEM_PROMPT = """あなたはプレゼンテーション内容の分析専門家です。
 書き起こしテキストから、発表の構成と言葉遣いを評価してください。
 
@@ -47,19 +64,111 @@ JSON形式で以下の構造で出力してください:
 """
 
 
+MAP_SYSTEM_PROMPT = """あなたはプレゼンテーション内容の分析専門家です。
+長い発表の一部区間の書き起こしが与えられます。後で全区間の分析を統合するため、
+この区間について分かることを簡潔にまとめてください。
+日本語で出力してください。
+
+【出力形式】
+JSON形式で以下の構造で出力してください:
+{
+  "summary": "この区間で話している内容の要約（2〜3文）",
+  "topics": ["話題1", "話題2", ...],
+  "intro_elements": "導入・テーマ紹介にあたる発言（なければ空文字）",
+  "conclusion_elements": "結論・総括にあたる発言（なければ空文字）",
+  "transitions": "話題の転換の仕方についての所見",
+  "language_feedback": "言葉遣い（わかりやすさ・専門用語）についての所見",
+  "strengths": ["強み1", ...],
+  "improvements": ["改善点1", ...]
+}
+"""
+
+
+def _split_windows(transcription: Dict, window_sec: float) -> List[Dict]:
+    """
+    書き起こしを一定時間ごとの区間に分割（区間はセグメントの境界で区切る）.
+
+    Args:
+        transcription: 書き起こし結果
+        window_sec: 1区間の長さ（秒、正の値）
+
+    Returns:
+        list: 区間ごとの書き起こし結果（transcribe_audio()と同じ形式、時刻は元のまま。
+            セグメントがなければ空のリスト）。発話のない区間は含めない
+
+    Raises:
+        ValueError: window_secが正の値でない場合
+    """
+    if window_sec <= 0:
+        raise ValueError(f"区間の長さは正の値で指定してください: {window_sec}")
+    windows: List[Dict] = []
+    current: List[Dict] = []
+    window_end = window_sec
+    for seg in transcription["segments"]:
+        if seg["start_time"] >= window_end:
+            if current:
+                windows.append(current)
+                current = []
+            # 発話のない時間が1区間より長くても、セグメントを含む区間の終わりまで一度に進める
+            window_end = (seg["start_time"] // window_sec + 1) * window_sec
+        current.append(seg)
+    if current:
+        windows.append(current)
+    return [
+        {
+            "text": "".join(seg["text"] for seg in segments),
+            "segments": segments,
+            "duration": segments[-1]["end_time"] - segments[0]["start_time"],
+        }
+        for segments in windows
+    ]
+
+
+def _content_fallback(result) -> Dict:
+    """JSONとしてパースできなかった場合の分析結果."""
+    return {
+        "structure": {
+            "has_intro": True,
+            "has_conclusion": True,
+            "feedback": get_response_text(result)[:200]
+        },
+        "language": {
+            "clarity": "medium",
+            "feedback": ""
+        },
+        "strengths": [],
+        "improvements": []
+    }
+
+
 class ContentAnalyzer:
     """内容分析エージェント."""
 
-    def __init__(self):
-        """初期化."""
-        # model = BedrockModel(model_id=NOVA_LITE_MODEL_ID, region_name=AWS_REGION)  # 元のモデル
-        model = BedrockModel(model_id=CLAUDE_MODEL_ID, region_name=AWS_REGION)  # 一時的にClaude 4.5 Sonnet使用
-        self.agent = Agent(model=model, system_prompt=SYSTEM_PROMPT)
+    def __init__(self, mode: Optional[str] = None):
+        """
+        初期化.
+
+        Args:
+            mode: 分析モード（"single", "map_reduce", "auto"、省略時はCONTENT_ANALYSIS_MODE）
+
+        Raises:
+            ValueError: 未対応のモードの場合
+        """
+        # self.model_id = NOVA_LITE_MODEL_ID  # 元のモデル
+        self.model_id = CLAUDE_MODEL_ID  # 一時的にClaude 4.5 Sonnet使用
+        self.mode = mode or CONTENT_ANALYSIS_MODE
+        if self.mode not in CONTENT_ANALYSIS_MODES:
+            raise ValueError(
+                f"未対応の内容分析モードです: {self.mode}（{' / '.join(CONTENT_ANALYSIS_MODES)}）"
+            )
 
     def analyze_content(self, transcription: Dict) -> Dict:
         """
         プレゼン内容を分析
 
+        長い発表（modeが"map_reduce"、または"auto"で閾値を超える場合）は、
+        時間区間ごとの分析を並列に行い、1回の統合呼び出しでまとめる。
+
         Args:
             transcription: 書き起こし結果
 
@@ -72,10 +181,25 @@ class ContentAnalyzer:
                     "improvements": [...],
                     "usage": {
                         "input_tokens": int,
-                        "output_tokens": int
+                        "output_tokens": int,
+                        "calls": int,
+                        "cached_calls": int
                     }
                 }
         """
+        if self._use_map_reduce(transcription):
+            return self._analyze_map_reduce(transcription)
+
+        # 書き起こしをトークン予算内に収める（長い発表は導入・転換・まとめを中心に抜粋）
+        condensed = condense_transcript(transcription, CONTENT_TOKEN_BUDGET)
+        if condensed["is_condensed"]:
+            text_label = (
+                f"書き起こしテキスト（抜粋: {condensed['kept_segments']}/{condensed['total_segments']}文、"
+                "[mm:ss]は発話の開始時刻）"
+            )
+        else:
+            text_label = "書き起こしテキスト"
+
         # プロンプト構築
         prompt = f"""
 以下のプレゼンテーション書き起こしを分析してください。
@@ -83,39 +207,99 @@ class ContentAnalyzer:
 【総時間】
 {transcription['duration']:.1f}秒 ({transcription['duration'] / 60:.1f}分)
 
-【書き起こしテキスト】
-{transcription['text']}
+【{text_label}】
+{condensed['text']}
 
 上記のプレゼンテーション内容について、構成・言葉遣い・論理性を評価してください。
 """
 
         # エージェント実行
-        result = self.agent(prompt)
+        result = run_agent(self.model_id, SYSTEM_PROMPT, prompt, region_name=AWS_REGION)
 
         # 結果をパースして使用量を追加
-        fallback = {
-            "structure": {
-                "has_intro": True,
-                "has_conclusion": True,
-                "feedback": result.message['content'][0]['text'][:200]
-            },
-            "language": {
-                "clarity": "medium",
-                "feedback": ""
-            },
-            "strengths": [],
-            "improvements": []
-        }
+        analysis = parse_agent_response(result, fallback_value=_content_fallback(result))
+
+        return analysis
+
+    def _use_map_reduce(self, transcription: Dict) -> bool:
+        """map-reduceで分析するか判定（区間に分けるセグメントがなければ1回の呼び出し）."""
+        if not transcription.get("segments"):
+            return False
+        if self.mode == "map_reduce":
+            return True
+        if self.mode == "auto":
+            return estimate_tokens(transcription["text"]) > MAP_REDUCE_THRESHOLD_TOKENS
+        return False
+
+    def _analyze_window(self, window: Dict, index: int, total: int) -> Dict:
+        """1区間を分析（map）."""
+        start = window["segments"][0]["start_time"]
+        end = window["segments"][-1]["end_time"]
+        condensed = condense_transcript(window, CONTENT_TOKEN_BUDGET)
+        prompt = f"""
+以下は発表全体を{total}区間に分けたうちの第{index + 1}区間（{format_timestamp(start)}〜{format_timestamp(end)}）の書き起こしです。
+
+【書き起こしテキスト】
+{condensed['text']}
+
+この区間の内容を分析してください。
+"""
+        result = run_agent(self.model_id, MAP_SYSTEM_PROMPT, prompt, region_name=AWS_REGION)
+        fallback = {"summary": get_response_text(result)[:300]}
         analysis = parse_agent_response(result, fallback_value=fallback)
+        analysis["window"] = f"{format_timestamp(start)}〜{format_timestamp(end)}"
+        return analysis
+
+    def _analyze_map_reduce(self, transcription: Dict) -> Dict:
+        """
+        時間区間ごとに並列に分析し（map）、1回の呼び出しで統合（reduce）.
+
+        Args:
+            transcription: 書き起こし結果
+
+        Returns:
+            dict: analyze_content()と同じ形式（usageは全呼び出しの合計、
+                cached_callsは応答キャッシュから返した区間・統合の呼び出し数）
+        """
+        windows = _split_windows(transcription, MAP_WINDOW_SEC)
+        print(f"⏳ 内容分析: {len(windows)}区間を並列に分析中...")
+        # Bedrockの同時実行数はrun_agent()がモデルごとに制限する（バッチ処理の上限も含む）
+        with ThreadPoolExecutor(max_workers=MAP_CONCURRENCY) as executor:
+            window_results = list(executor.map(
+                lambda args: self._analyze_window(args[1], args[0], len(windows)),
+                enumerate(windows),
+            ))
+
+        window_usages = [window_result.pop("usage") for window_result in window_results]
+
+        prompt = f"""
+以下は、あるプレゼンテーションを時間区間ごとに分析した結果です（時刻順）。
+
+【総時間】
+{transcription['duration']:.1f}秒 ({transcription['duration'] / 60:.1f}分)
+
+【区間ごとの分析結果】
+{json.dumps(window_results, ensure_ascii=False, indent=2)}
+
+区間ごとの分析を統合し、発表全体の構成・言葉遣い・論理性を評価してください。
+導入は最初の区間、まとめは最後の区間の内容から判断してください。
+"""
+        result = run_agent(self.model_id, SYSTEM_PROMPT, prompt, region_name=AWS_REGION)
+
+        analysis = parse_agent_response(result, fallback_value=_content_fallback(result))
+        analysis["usage"] = merge_usage([*window_usages, analysis["usage"]])
 
         return analysis
 
 
-def create_content_analyzer() -> ContentAnalyzer:
+def create_content_analyzer(mode: Optional[str] = None) -> ContentAnalyzer:
     """
     内容分析エージェントを作成.
 
+    Args:
+        mode: 分析モード（"single", "map_reduce", "auto"、省略時はCONTENT_ANALYSIS_MODE）
+
     Returns:
         ContentAnalyzer: 内容分析エージェント
     """
-    return ContentAnalyzer()
+    return ContentAnalyzer(mode=mode)
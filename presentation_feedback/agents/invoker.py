@@ -0,0 +1,325 @@
+"""Bedrock呼び出しの共通制御（モデルごとの同時実行数・レート制限・スロットリング時の再試行）.
+
+Streamlitの各セッションやバッチ処理はそれぞれ別スレッド・別イベントループで動くため、
+制限はプロセス全体で共有するスレッド用のプリミティブで行い、非同期版は
+スレッドに逃がして待つ。
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+from botocore.exceptions import ClientError
+
+
+# 環境変数またはデフォルト設定（モデルごと、アカウントのクォータに合わせて設定する）
+MAX_CONCURRENCY_PER_MODEL = int(os.getenv("BEDROCK_MAX_CONCURRENCY", "8"))
+REQUESTS_PER_MINUTE = float(os.getenv("BEDROCK_REQUESTS_PER_MINUTE", "100"))
+TOKENS_PER_MINUTE = float(os.getenv("BEDROCK_TOKENS_PER_MINUTE", "200000"))
+# strands側の再試行は無効にしているため（model_pool._new_agent()）、
+# 1回の呼び出しでBedrockを呼ぶのは最大 MAX_RETRIES + 1 回
+MAX_RETRIES = int(os.getenv("BEDROCK_MAX_RETRIES", "4"))
+
+# 再試行の待ち時間（指数バックオフ + full jitter）
+RETRY_BASE_DELAY_SEC = 1.0
+RETRY_MAX_DELAY_SEC = 30.0
+
+# レート制限で見込む1回あたりの出力トークン数（実行後に実際の使用量で補正する）
+EXPECTED_OUTPUT_TOKENS = 1000
+
+# スロットリングとみなすエラーコード
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+}
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """トークンバケット（1分あたりの上限を一定の速度で補充、スレッドセーフ）."""
+
+    def __init__(self, per_minute: float):
+        """
+        初期化.
+
+        Args:
+            per_minute: 1分あたりの上限（バケットの容量）
+        """
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self._tokens = per_minute
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """
+        指定量を取得（足りない場合は補充されるまで待つ）.
+
+        Args:
+            amount: 取得する量（容量を超える場合は容量に切り詰める）
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def adjust(self, amount: float) -> None:
+        """見込みとの差分を反映（正: 追加で消費、負: 返却）。残量は負になりうる."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+
+class ModelLimiter:
+    """1つのモデルIDに対する同時実行数・レート制限と計測値."""
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY_PER_MODEL,
+        requests_per_minute: float = REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = TOKENS_PER_MINUTE,
+    ):
+        """
+        初期化.
+
+        Args:
+            max_concurrency: 同時実行数の上限
+            requests_per_minute: 1分あたりのリクエスト数の上限
+            tokens_per_minute: 1分あたりのトークン数（入力+出力）の上限
+        """
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self._metrics = {
+            "queue_depth": 0,
+            "in_flight": 0,
+            "calls": 0,
+            "throttled": 0,
+            "retries": 0,
+            "failures": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+
+    def _update(self, **deltas) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                self._metrics[key] += delta
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """
+        実行枠を取得（同時実行数の空きを待ってから、レート制限の空きを待つ）.
+
+        レート制限の分は実行できる直前に消費する（同時実行数の空きを待つ間に
+        消費すると、その間に補充された分が容量で切り捨てられて無駄になる）。
+
+        Args:
+            estimated_tokens: この呼び出しで見込むトークン数
+
+        Returns:
+            float: 待った秒数
+        """
+        start = time.monotonic()
+        self._update(queue_depth=1)
+        try:
+            self._semaphore.acquire()
+            try:
+                self._requests.acquire(1)
+                self._tokens.acquire(estimated_tokens)
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self._update(queue_depth=-1)
+        wait = time.monotonic() - start
+        with self._lock:
+            self._metrics["in_flight"] += 1
+            self._metrics["calls"] += 1
+            self._metrics["wait_time_total"] += wait
+            self._metrics["wait_time_max"] = max(self._metrics["wait_time_max"], wait)
+        return wait
+
+    def release(self, estimated_tokens: int, actual_tokens: Optional[int] = None) -> None:
+        """
+        実行枠を返却し、実際のトークン使用量でレート制限を補正.
+
+        Args:
+            estimated_tokens: acquire()で見込んだトークン数
+            actual_tokens: 実際の使用量（不明な場合はNone）
+        """
+        self._semaphore.release()
+        self._update(in_flight=-1)
+        if actual_tokens is not None:
+            self._tokens.adjust(actual_tokens - estimated_tokens)
+
+    def record(self, name: str) -> None:
+        """計測値（throttled, retries, failures）を1増やす."""
+        self._update(**{name: 1})
+
+    def metrics(self) -> Dict:
+        """計測値のスナップショット."""
+        with self._lock:
+            snapshot = dict(self._metrics)
+        snapshot["wait_time_avg"] = (
+            snapshot["wait_time_total"] / snapshot["calls"] if snapshot["calls"] else 0.0
+        )
+        return snapshot
+
+
+_limiters: Dict[str, ModelLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def configure_model_limits(
+    model_id: str,
+    max_concurrency: int = MAX_CONCURRENCY_PER_MODEL,
+    requests_per_minute: float = REQUESTS_PER_MINUTE,
+    tokens_per_minute: float = TOKENS_PER_MINUTE,
+) -> None:
+    """
+    モデルごとの制限を設定（クォータがモデルによって異なる場合に使用）.
+
+    Args:
+        model_id: BedrockのモデルID
+        max_concurrency: 同時実行数の上限
+        requests_per_minute: 1分あたりのリクエスト数の上限
+        tokens_per_minute: 1分あたりのトークン数の上限
+    """
+    with _limiters_lock:
+        _limiters[model_id] = ModelLimiter(max_concurrency, requests_per_minute, tokens_per_minute)
+
+
+def get_model_limiter(model_id: str) -> ModelLimiter:
+    """モデルIDの制限を取得（未設定の場合はデフォルト値で作成）."""
+    with _limiters_lock:
+        limiter = _limiters.get(model_id)
+        if limiter is None:
+            limiter = ModelLimiter()
+            _limiters[model_id] = limiter
+        return limiter
+
+
+def get_invocation_metrics() -> Dict[str, Dict]:
+    """
+    モデルごとの呼び出し状況を取得.
+
+    Returns:
+        dict: {model_id: {
+            "queue_depth": 実行枠を待っている呼び出し数,
+            "in_flight": 実行中の呼び出し数,
+            "calls": 累計の呼び出し数（再試行を含む）,
+            "throttled": スロットリングされた回数,
+            "retries": 再試行した回数,
+            "failures": 再試行しても失敗した回数,
+            "wait_time_total": 実行枠の待ち時間の合計（秒）,
+            "wait_time_max": 待ち時間の最大（秒）,
+            "wait_time_avg": 待ち時間の平均（秒）
+        }}
+    """
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {model_id: limiter.metrics() for model_id, limiter in limiters.items()}
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Bedrockのスロットリング（一時的な過負荷）によるエラーか判定."""
+    try:
+        from strands.types.exceptions import ModelThrottledException
+
+        if isinstance(error, ModelThrottledException):
+            return True
+    except ImportError:
+        pass
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+    return False
+
+
+def retry_delay(attempt: int) -> float:
+    """attempt回目（0始まり）の再試行までの待ち時間（指数バックオフ + full jitter）."""
+    return random.uniform(0, min(RETRY_MAX_DELAY_SEC, RETRY_BASE_DELAY_SEC * 2 ** attempt))
+
+
+def invoke(
+    model_id: str,
+    call: Callable[[], T],
+    estimated_tokens: int,
+    usage_tokens: Optional[Callable[[T], Optional[int]]] = None,
+) -> T:
+    """
+    モデルごとの制限の下で呼び出しを実行し、スロットリング時は待って再試行.
+
+    Args:
+        model_id: BedrockのモデルID
+        call: 実行する処理
+        estimated_tokens: 見込みのトークン数（入力+出力）
+        usage_tokens: 結果から実際のトークン数を取り出す関数（レート制限の補正に使用）
+
+    Returns:
+        callの返り値
+    """
+    limiter = get_model_limiter(model_id)
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire(estimated_tokens)
+        actual = None
+        try:
+            result = call()
+            actual = usage_tokens(result) if usage_tokens else None
+            return result
+        except Exception as e:
+            if not is_throttling_error(e):
+                raise
+            limiter.record("throttled")
+            if attempt == MAX_RETRIES:
+                limiter.record("failures")
+                raise
+        finally:
+            limiter.release(estimated_tokens, actual)
+
+        delay = retry_delay(attempt)
+        limiter.record("retries")
+        logger.warning(
+            "Bedrockがスロットリング中のため%.1f秒後に再試行（%d/%d）: %s", delay, attempt + 1, MAX_RETRIES, model_id
+        )
+        time.sleep(delay)
+
+
+async def invoke_async(
+    model_id: str,
+    call: Callable[[], T],
+    estimated_tokens: int,
+    usage_tokens: Optional[Callable[[T], Optional[int]]] = None,
+) -> T:
+    """
+    invoke() の非同期版（待機・実行はスレッドで行い、イベントループを止めない）.
+
+    Args:
+        model_id: BedrockのモデルID
+        call: 実行する処理
+        estimated_tokens: 見込みのトークン数（入力+出力）
+        usage_tokens: 結果から実際のトークン数を取り出す関数
+
+    Returns:
+        callの返り値
+    """
+    return await asyncio.to_thread(invoke, model_id, call, estimated_tokens, usage_tokens)
@@ -0,0 +1,135 @@
+"""ストリーミング中のJSONレスポンスを逐次パース（確定したフィールド・配列要素から返す）."""
+
+import json
+from typing import Dict, List, Optional
+
+
+class IncrementalJSONParser:
+    """
+    トップレベルがオブジェクトのJSONを、テキストの断片を受け取りながらパース.
+
+    トップレベルのフィールドの値が確定するたびに
+    {"type": "field", "key": キー, "value": 値} を、
+    トップレベルの配列の要素が確定するたびに
+    {"type": "item", "key": 配列のキー, "index": 要素番号, "value": 要素} を返す。
+    最初の "{" より前（```json 等）は読み飛ばす。
+    """
+
+    def __init__(self):
+        """初期化."""
+        self._text = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._expect_key = False
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None  # トップレベルの値の開始位置
+        self._item_start: Optional[int] = None  # 配列要素の開始位置
+        self._item_index = 0
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """
+        テキストの断片を追加し、新たに確定した値を返す.
+
+        Args:
+            chunk: モデル出力の断片
+
+        Returns:
+            list: 確定したイベントのリスト
+        """
+        self._text += chunk
+        events: List[Dict] = []
+        text = self._text
+        while self._pos < len(text) and not self.done:
+            i = self._pos
+            char = text[i]
+            self._pos += 1
+            depth = len(self._stack)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._on_string_end(i, depth, events)
+                continue
+
+            if depth == 0:
+                if char == "{":
+                    self._stack.append("{")
+                    self._expect_key = True
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+                if depth == 1 and not self._expect_key:
+                    self._value_start = i
+                elif depth == 2 and self._stack[1] == "[":
+                    self._item_start = i
+            elif char in "{[":
+                if depth == 1:
+                    self._value_start = i
+                    self._item_index = 0
+                elif depth == 2 and self._stack[1] == "[":
+                    self._item_start = i
+                self._stack.append(char)
+            elif char in "}]":
+                self._close_scalar(i, depth, events)
+                self._stack.pop()
+                depth -= 1
+                if depth == 0:
+                    self.done = True
+                elif depth == 1:
+                    self._emit_field(text[self._value_start:i + 1], events)
+                elif depth == 2 and self._stack[1] == "[":
+                    self._emit_item(text[self._item_start:i + 1], events)
+            elif char == ",":
+                self._close_scalar(i, depth, events)
+                if depth == 1:
+                    self._expect_key = True
+            elif char in " \t\r\n:":
+                continue
+            elif depth == 1 and self._value_start is None:
+                self._value_start = i  # 数値・true/false/null
+            elif depth == 2 and self._stack[1] == "[" and self._item_start is None:
+                self._item_start = i
+        return events
+
+    def _on_string_end(self, end: int, depth: int, events: List[Dict]) -> None:
+        if depth == 1:
+            if self._expect_key:
+                self._key = json.loads(self._text[self._string_start:end + 1])
+                self._expect_key = False
+            else:
+                self._emit_field(self._text[self._value_start:end + 1], events)
+        elif depth == 2 and self._stack[1] == "[":
+            self._emit_item(self._text[self._item_start:end + 1], events)
+
+    def _close_scalar(self, end: int, depth: int, events: List[Dict]) -> None:
+        """文字列以外のスカラー値（区切り文字で確定する）を処理."""
+        if depth == 1 and self._value_start is not None:
+            self._emit_field(self._text[self._value_start:end], events)
+        elif depth == 2 and self._stack[1] == "[" and self._item_start is not None:
+            self._emit_item(self._text[self._item_start:end], events)
+
+    def _emit_field(self, raw: str, events: List[Dict]) -> None:
+        self._value_start = None
+        try:
+            events.append({"type": "field", "key": self._key, "value": json.loads(raw)})
+        except json.JSONDecodeError:
+            pass
+
+    def _emit_item(self, raw: str, events: List[Dict]) -> None:
+        self._item_start = None
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        events.append({"type": "item", "key": self._key, "index": self._item_index, "value": value})
+        self._item_index += 1
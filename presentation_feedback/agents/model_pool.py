@@ -0,0 +1,245 @@
+"""BedrockModelの共有プールとエージェント実行."""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from botocore.config import Config
+from strands import Agent, ModelRetryStrategy
+from strands.models import BedrockModel
+
+from ..core.transcript_condenser import estimate_tokens
+from .invoker import (
+    EXPECTED_OUTPUT_TOKENS,
+    MAX_RETRIES,
+    ModelLimiter,
+    get_model_limiter,
+    invoke,
+    is_throttling_error,
+    retry_delay,
+)
+from .response_cache import get_response_cache
+
+
+# オレゴンリージョン（us-west-2）
+AWS_REGION = "us-west-2"
+
+# Bedrockクライアントの同時接続数
+MAX_POOL_CONNECTIONS = int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "50"))
+
+logger = logging.getLogger(__name__)
+
+_models: Dict[Tuple[str, str], BedrockModel] = {}
+_lock = threading.Lock()
+
+
+def get_bedrock_model(model_id: str, region_name: str = AWS_REGION) -> BedrockModel:
+    """
+    BedrockModelを取得（model_id・リージョンごとに1度だけ作成して再利用）.
+
+    BedrockModelは会話履歴を持たず、内部のboto3クライアントはスレッドセーフなので
+    複数のリクエストで共有できる。
+
+    Args:
+        model_id: BedrockのモデルID
+        region_name: リージョン
+
+    Returns:
+        BedrockModel: 共有モデル
+    """
+    key = (model_id, region_name)
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _lock:
+        model = _models.get(key)
+        if model is None:
+            model = BedrockModel(
+                model_id=model_id,
+                region_name=region_name,
+                boto_client_config=Config(max_pool_connections=MAX_POOL_CONNECTIONS),
+            )
+            _models[key] = model
+        return model
+
+
+def _new_agent(model: BedrockModel, system_prompt: str, **kwargs) -> Agent:
+    """
+    会話履歴のない新しいエージェントを作成（strands側のスロットリング再試行は無効）.
+
+    strandsは既定でModelThrottledExceptionの際に最大6回まで（間に4秒〜64秒待って）
+    呼び出すが、その間もinvokerの実行枠を握ったままになり、invokerの再試行と
+    掛け合わされる（最悪 6 × (MAX_RETRIES + 1) 回）。再試行はinvokerだけで行い、
+    待つ間は実行枠を返す。
+    """
+    return Agent(
+        model=model,
+        system_prompt=system_prompt,
+        retry_strategy=ModelRetryStrategy(max_attempts=1),
+        **kwargs,
+    )
+
+
+def _estimate_call_tokens(system_prompt: str, prompt: str) -> int:
+    """レート制限のために1回の呼び出しのトークン数（入力+出力）を見込む."""
+    return estimate_tokens(system_prompt) + estimate_tokens(prompt) + EXPECTED_OUTPUT_TOKENS
+
+
+def _result_tokens(result) -> Optional[int]:
+    """AgentResultから実際のトークン数（入力+出力）を取り出す."""
+    try:
+        usage = result.metrics.accumulated_usage
+    except AttributeError:
+        return None
+    return usage.get("inputTokens", 0) + usage.get("outputTokens", 0)
+
+
+def run_agent(model_id: str, system_prompt: str, prompt: str, region_name: str = AWS_REGION):
+    """
+    共有モデルを使い、会話履歴のない新しいエージェントでプロンプトを実行.
+
+    Agentは会話履歴を保持するため再利用せず、呼び出しごとに作成する
+    （作成コストの大きいモデル・クライアントは共有）。
+    呼び出しはinvokerを通し、モデルごとの同時実行数・レート制限の下で実行して
+    スロットリング時は再試行する。同じプロンプトの応答がキャッシュにあれば
+    Bedrockを呼ばずにそれを返す。
+
+    Args:
+        model_id: BedrockのモデルID
+        system_prompt: システムプロンプト
+        prompt: ユーザープロンプト
+        region_name: リージョン
+
+    Returns:
+        AgentResult or CachedAgentResult: エージェント実行結果（strands Agentの返り値）
+    """
+    cache = get_response_cache()
+    if cache is not None:
+        cached = cache.get(model_id, system_prompt, prompt)
+        if cached is not None:
+            return cached
+
+    model = get_bedrock_model(model_id, region_name)
+
+    def call():
+        agent = _new_agent(model, system_prompt)
+        return agent(prompt)
+
+    result = invoke(model_id, call, _estimate_call_tokens(system_prompt, prompt), _result_tokens)
+    if cache is not None:
+        cache.put(model_id, system_prompt, prompt, result)
+    return result
+
+
+async def run_agent_async(
+    model_id: str,
+    system_prompt: str,
+    prompt: str,
+    region_name: str = AWS_REGION,
+):
+    """
+    run_agent() の非同期版（実行枠の待機・実行はスレッドで行う）.
+
+    Args:
+        model_id: BedrockのモデルID
+        system_prompt: システムプロンプト
+        prompt: ユーザープロンプト
+        region_name: リージョン
+
+    Returns:
+        AgentResult: エージェント実行結果
+    """
+    return await asyncio.to_thread(run_agent, model_id, system_prompt, prompt, region_name)
+
+
+async def _acquire_async(limiter: ModelLimiter, estimated_tokens: int) -> None:
+    """
+    実行枠をスレッドで待って取得.
+
+    待っている間にキャンセルされても、スレッドでの取得は止められないため、
+    取得できた時点で返却する（実行枠が失われないように）。
+    """
+    def release_if_acquired(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            limiter.release(estimated_tokens)
+
+    acquire = asyncio.ensure_future(asyncio.to_thread(limiter.acquire, estimated_tokens))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        acquire.add_done_callback(release_if_acquired)
+        raise
+
+
+async def stream_agent(
+    model_id: str,
+    system_prompt: str,
+    prompt: str,
+    region_name: str = AWS_REGION,
+) -> AsyncIterator[Dict]:
+    """
+    run_agent() のストリーミング版（生成されたテキストを逐次返す）.
+
+    run_agent() と同じ実行枠を使う。スロットリング時の再試行は、
+    まだテキスト（"data"イベント）を返していない場合のみ行う
+    （途中まで返したテキストは取り消せないため）。
+    キャッシュにある場合は応答全体を1つの断片として返す。
+
+    Args:
+        model_id: BedrockのモデルID
+        system_prompt: システムプロンプト
+        prompt: ユーザープロンプト
+        region_name: リージョン
+
+    Yields:
+        dict: strandsのストリームイベント（"data": テキストの断片、最後に "result": AgentResult）
+    """
+    cache = get_response_cache()
+    if cache is not None:
+        cached = cache.get(model_id, system_prompt, prompt)
+        if cached is not None:
+            yield {"data": str(cached)}
+            yield {"result": cached}
+            return
+
+    model = get_bedrock_model(model_id, region_name)
+    limiter = get_model_limiter(model_id)
+    estimated = _estimate_call_tokens(system_prompt, prompt)
+
+    for attempt in range(MAX_RETRIES + 1):
+        actual = None
+        started = False
+        acquired = False
+        try:
+            await _acquire_async(limiter, estimated)
+            acquired = True
+            agent = _new_agent(model, system_prompt, callback_handler=None)
+            async for event in agent.stream_async(prompt):
+                if "data" in event:
+                    started = True
+                elif "result" in event:
+                    actual = _result_tokens(event["result"])
+                    if cache is not None:
+                        cache.put(model_id, system_prompt, prompt, event["result"])
+                yield event
+            return
+        except Exception as e:
+            if started or not is_throttling_error(e):
+                raise
+            limiter.record("throttled")
+            if attempt == MAX_RETRIES:
+                limiter.record("failures")
+                raise
+        finally:
+            if acquired:
+                limiter.release(estimated, actual)
+
+        delay = retry_delay(attempt)
+        limiter.record("retries")
+        logger.warning(
+            "Bedrockがスロットリング中のため%.1f秒後に再試行（%d/%d）: %s", delay, attempt + 1, MAX_RETRIES, model_id
+        )
+        await asyncio.sleep(delay)
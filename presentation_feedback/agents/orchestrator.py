@@ -2,11 +2,11 @@
 
 import json
 import os
-from strands import Agent
-from strands.models import BedrockModel
-from typing import Dict
+from typing import AsyncIterator, Dict
 
-from .utils import parse_agent_response
+from .json_stream import IncrementalJSONParser
+from .model_pool import run_agent, stream_agent
+from .utils import get_response_text, parse_agent_response
 
 # オレゴンリージョン
 AWS_REGION = "us-west-2"
@@ -15,6 +15,23 @@ AWS_REGION = "us-west-2"
 # DEFAULT_MODEL_ID = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
 DEFAULT_MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
 
+# 最終レポートの出力形式（単一呼び出しモードと共通）
+REPORT_OUTPUT_FORMAT = """
+【出力形式】
+JSON形式で以下の構造で出力してください:
+{
+  "summary": "総合サマリ",
+  "strengths": [
+    {"category": "カテゴリ", "description": "説明", "evidence": "根拠"},
+    ...
+  ],
+  "improvements": [
+    {"category": "カテゴリ", "issue": "問題点", "suggestion": "改善提案", "priority": "high/medium/low"},
+    ...
+  ],
+  "detailed_feedback": "詳細なフィードバック（段落形式）"
+}
+"""
 
 SYSTEM_PROMPT = """あなたはプレゼンテーション指導の専門家です。
 音声特徴分析と内容分析の結果を統合し、発表者に役立つフィードバックレポートを作成してください。
@@ -29,24 +46,55 @@ SYSTEM_PROMPT = """あなたはプレゼンテーション指導の専門家で
    - どう改善すればよいか（具体的な提案）
 4. 詳細フィードバック
 
+よかった点・改善点は、音声特徴分析と内容分析の両方から重要なものを選んで絞り込み、
+重要度の高い順に並べてください。
+
 トーン: 建設的でポジティブ。批判的にならず、成長をサポートする姿勢で。
 日本語で出力してください。
+""" + REPORT_OUTPUT_FORMAT
 
-【出力形式】
-JSON形式で以下の構造で出力してください:
-{
-  "summary": "総合サマリ",
-  "strengths": [
-    {"category": "カテゴリ", "description": "説明", "evidence": "根拠"},
-    ...
-  ],
-  "improvements": [
-    {"category": "カテゴリ", "issue": "問題点", "suggestion": "改善提案", "priority": "high/medium/low"},
-    ...
-  ],
-  "detailed_feedback": "詳細なフィードバック（段落形式）"
-}
-"""
+
+def parse_report(result) -> Dict:
+    """エージェント実行結果を最終レポートにパース（使用量付き）."""
+    text = get_response_text(result)
+    fallback = {
+        "summary": text[:200],
+        "strengths": [],
+        "improvements": [],
+        "detailed_feedback": text
+    }
+    return parse_agent_response(result, fallback_value=fallback)
+
+
+async def stream_report_events(model_id: str, system_prompt: str, prompt: str) -> AsyncIterator[Dict]:
+    """
+    最終レポートをストリーミング生成し、確定した値から順にイベントとして返す.
+
+    Args:
+        model_id: BedrockのモデルID
+        system_prompt: 最終レポートの出力形式を指定したシステムプロンプト
+        prompt: ユーザープロンプト
+
+    Yields:
+        dict: OrchestratorAgent.stream_feedback_report()と同じイベント
+
+    Raises:
+        RuntimeError: ストリームが "result" イベントを返さずに終了した場合
+    """
+    parser = IncrementalJSONParser()
+    result = None
+
+    async for event in stream_agent(model_id, system_prompt, prompt, region_name=AWS_REGION):
+        if "data" in event:
+            yield {"type": "text", "text": event["data"]}
+            for parsed in parser.feed(event["data"]):
+                yield parsed
+        elif "result" in event:
+            result = event["result"]
+
+    if result is None:
+        raise RuntimeError(f"レポート生成のストリームが結果を返さずに終了しました: {model_id}")
+    yield {"type": "report", "report": parse_report(result)}
 
 
 class OrchestratorAgent:
@@ -55,11 +103,8 @@ class OrchestratorAgent:
     def __init__(self):
         """初期化."""
         # 環境変数で明示的に指定されている場合はそれを使用、なければデフォルト
-        model_id = os.getenv("ORCHESTRATOR_MODEL_ID", DEFAULT_MODEL_ID)
-        print(f"使用モデル: {model_id}")
-
-        model = BedrockModel(model_id=model_id, region_name=AWS_REGION)
-        self.agent = Agent(model=model, system_prompt=SYSTEM_PROMPT)
+        self.model_id = os.getenv("ORCHESTRATOR_MODEL_ID", DEFAULT_MODEL_ID)
+        print(f"使用モデル: {self.model_id}")
 
     def generate_feedback_report(self, speech_result: Dict, content_result: Dict) -> Dict:
         """
@@ -78,10 +123,47 @@ class OrchestratorAgent:
                     "detailed_feedback": str,
                     "usage": {
                         "input_tokens": int,
-                        "output_tokens": int
+                        "output_tokens": int,
+                        "calls": int,
+                        "cached_calls": int
                     }
                 }
         """
+        # プロンプト構築
+        prompt = self._build_prompt(speech_result, content_result)
+
+        # エージェント実行
+        result = run_agent(self.model_id, SYSTEM_PROMPT, prompt, region_name=AWS_REGION)
+
+        # 結果をパースして使用量を追加
+        return parse_report(result)
+
+    async def stream_feedback_report(
+        self, speech_result: Dict, content_result: Dict
+    ) -> AsyncIterator[Dict]:
+        """
+        最終フィードバックレポートをストリーミング生成.
+
+        モデルの出力を逐次パースし、summaryや strengths / improvements の各要素が
+        確定した時点でイベントとして返す。
+
+        Args:
+            speech_result: 音声特徴分析結果
+            content_result: 内容分析結果
+
+        Yields:
+            dict: 以下のいずれか
+                {"type": "text", "text": 出力テキストの断片}
+                {"type": "field", "key": "summary"等, "value": 値}
+                {"type": "item", "key": "strengths"/"improvements", "index": 番号, "value": 要素}
+                {"type": "report", "report": generate_feedback_report()と同じ形式}（最後）
+        """
+        prompt = self._build_prompt(speech_result, content_result)
+        async for event in stream_report_events(self.model_id, SYSTEM_PROMPT, prompt):
+            yield event
+
+    def _build_prompt(self, speech_result: Dict, content_result: Dict) -> str:
+        """分析結果からプロンプトを構築."""
         # 分析結果を整形
         speech_summary = {
             "feedback": speech_result.get("feedback", ""),
@@ -96,8 +178,7 @@ class OrchestratorAgent:
             "improvements": content_result.get("improvements", [])
         }
 
-        # プロンプト構築
-        prompt = f"""
+        return f"""
 以下の分析結果を統合して、最終フィードバックレポートを作成してください。
 
 【音声特徴分析】
@@ -107,23 +188,8 @@ class OrchestratorAgent:
 {json.dumps(content_summary, ensure_ascii=False, indent=2)}
 
 上記の分析結果をもとに、総合的なフィードバックレポートを生成してください。
-よかった点と改善点をそれぞれ3-5個に絞り込み、優先順位をつけてください。
 """
 
-        # エージェント実行
-        result = self.agent(prompt)
-
-        # 結果をパースして使用量を追加
-        fallback = {
-            "summary": result.message['content'][0]['text'][:200],
-            "strengths": [],
-            "improvements": [],
-            "detailed_feedback": result.message['content'][0]['text']
-        }
-        report = parse_agent_response(result, fallback_value=fallback)
-
-        return report
-
 
 def create_orchestrator_agent() -> OrchestratorAgent:
     """
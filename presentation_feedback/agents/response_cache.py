@@ -0,0 +1,256 @@
+"""エージェント応答のキャッシュ（モデルID・システムプロンプト・正規化したプロンプトをキーにする）."""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional
+
+from .utils import extract_json_from_response, get_response_text
+
+
+# 環境変数またはデフォルト設定
+RESPONSE_CACHE_ENABLED = os.getenv("AGENT_RESPONSE_CACHE", "1") != "0"
+RESPONSE_CACHE_PATH = os.getenv(
+    "AGENT_RESPONSE_CACHE_PATH",
+    str(Path.home() / ".cache" / "presentation_feedback" / "agent_responses.sqlite3"),
+)
+RESPONSE_CACHE_TTL_SEC = float(os.getenv("AGENT_RESPONSE_CACHE_TTL_SEC", str(7 * 24 * 3600)))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("AGENT_RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    キャッシュキー用にプロンプトを正規化（意味の変わらない空白・改行・文字幅の違いを吸収）.
+
+    Args:
+        prompt: プロンプト
+
+    Returns:
+        str: 正規化したプロンプト
+    """
+    text = unicodedata.normalize("NFKC", prompt).replace("\r\n", "\n")
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.split("\n")]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class _CachedMetrics:
+    def __init__(self, usage: Dict):
+        self.accumulated_usage = usage
+
+
+class CachedAgentResult:
+    """キャッシュから復元した応答（parse_agent_response() ではAgentResultと同じく扱える）."""
+
+    cached = True
+
+    def __init__(self, text: str, usage: Dict):
+        """
+        初期化.
+
+        Args:
+            text: 応答テキスト
+            usage: 元の呼び出しのトークン使用量（strandsのaccumulated_usage形式）
+        """
+        self.message = {"role": "assistant", "content": [{"text": text}]}
+        self.metrics = _CachedMetrics(usage)
+        self.stop_reason = "end_turn"
+
+    def __str__(self) -> str:
+        return get_response_text(self)
+
+
+def _cacheable_text(result) -> Optional[str]:
+    """
+    キャッシュしてよい応答ならそのテキストを返す.
+
+    途中で打ち切られた応答（stop_reasonが"end_turn"以外）や、JSONとして読めない応答は
+    キャッシュすると同じプロンプトで失敗し続けるため対象外。テキスト以外のブロック
+    （ツール呼び出し等）は無視する。
+    """
+    if getattr(result, "stop_reason", None) != "end_turn":
+        return None
+    text = get_response_text(result)
+    if not text:
+        return None
+    try:
+        json.loads(extract_json_from_response(text))
+    except json.JSONDecodeError:
+        return None
+    return text
+
+
+class ResponseCache:
+    """SQLiteに保存する応答キャッシュ（有効期限とLRUによる件数上限付き）."""
+
+    def __init__(
+        self,
+        path: str = RESPONSE_CACHE_PATH,
+        ttl_sec: float = RESPONSE_CACHE_TTL_SEC,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        """
+        初期化.
+
+        Args:
+            path: SQLiteファイルのパス（":memory:" でメモリ上）
+            ttl_sec: 有効期限（秒）
+            max_entries: 保存する最大件数（超えたら最終アクセスが古いものから削除）
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model_id TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    usage TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(model_id: str, system_prompt: str, prompt: str) -> str:
+        """キャッシュキー（モデルID, システムプロンプトのハッシュ, 正規化したプロンプトのハッシュ）を生成."""
+        return f"{model_id}:{_sha256(system_prompt)}:{_sha256(normalize_prompt(prompt))}"
+
+    def get(self, model_id: str, system_prompt: str, prompt: str) -> Optional[CachedAgentResult]:
+        """
+        キャッシュから応答を取得（期限切れは削除してNone）.
+
+        Args:
+            model_id: BedrockのモデルID
+            system_prompt: システムプロンプト
+            prompt: ユーザープロンプト
+
+        Returns:
+            CachedAgentResult or None
+        """
+        key = self.make_key(model_id, system_prompt, prompt)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT text, usage, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[2] > self.ttl_sec:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            usage = json.loads(row[1])
+            self.hits += 1
+            self.tokens_saved += usage.get("inputTokens", 0) + usage.get("outputTokens", 0)
+        return CachedAgentResult(row[0], usage)
+
+    def put(self, model_id: str, system_prompt: str, prompt: str, result) -> None:
+        """
+        応答を保存し、上限件数を超えていれば最終アクセスが古いものから削除.
+
+        最後まで生成されたJSONの応答だけを保存する（それ以外は何もしない）。
+
+        Args:
+            model_id: BedrockのモデルID
+            system_prompt: システムプロンプト
+            prompt: ユーザープロンプト
+            result: エージェント実行結果（strands Agentの返り値）
+        """
+        if getattr(result, "cached", False):
+            return
+        text = _cacheable_text(result)
+        if text is None:
+            return
+        usage = dict(result.metrics.accumulated_usage)
+        key = self.make_key(model_id, system_prompt, prompt)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model_id, text, json.dumps(usage), now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_sec,)
+            )
+            self._conn.execute(
+                """
+                DELETE FROM responses WHERE key NOT IN (
+                    SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """全エントリを削除."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def get_stats(self) -> Dict:
+        """
+        ヒット率などの統計を取得.
+
+        Returns:
+            dict: {
+                "hits": int,
+                "misses": int,
+                "hit_rate": float,
+                "tokens_saved": ヒットにより呼び出さずに済んだトークン数（入力+出力）,
+                "entries": 保存件数
+            }
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "tokens_saved": self.tokens_saved,
+                "entries": entries,
+            }
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    プロセス共通の応答キャッシュを取得（AGENT_RESPONSE_CACHE=0 の場合はNone）.
+
+    Returns:
+        ResponseCache or None
+    """
+    global _default_cache
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
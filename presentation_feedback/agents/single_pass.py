@@ -0,0 +1,144 @@
+"""単一呼び出し分析エージェント（話し方・内容の分析と最終レポートの生成を1回の呼び出しで行う）"""
+
+import json
+import os
+from typing import AsyncIterator, Dict
+
+from ..core.scoring import score_speech
+from ..core.transcript_condenser import CONTENT_TOKEN_BUDGET, condense_transcript
+from .model_pool import run_agent
+from .orchestrator import REPORT_OUTPUT_FORMAT, parse_report, stream_report_events
+
+# オレゴンリージョン
+AWS_REGION = "us-west-2"
+
+# デフォルトモデル（環境変数で上書き可能）
+DEFAULT_MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
+
+SYSTEM_PROMPT = """あなたはプレゼンテーション指導の専門家です。
+発表の音声特徴量（ルールベースの採点結果を含む）と書き起こしから、
+話し方と内容の両面を分析し、発表者に役立つフィードバックレポートを作成してください。
+
+【分析観点】
+1. 話し方: 話すスピード、フィラーワード、間（ポーズ）
+   - 採点結果の数値を根拠として使い、数値を変更しないでください
+2. 構成: イントロ→本題→まとめの流れがあるか
+   - イントロ: 最初の10%以内に導入・テーマ紹介があるか
+   - まとめ: 最後の10%に結論・総括があるか
+3. 論理性: 話の繋がりが自然か、トピック遷移がスムーズか
+4. 言葉遣い: わかりやすい表現か、専門用語は適切か
+
+【レポート構成】
+1. 総合サマリ（2-3文）
+2. よかった点 Top 3-5
+   - 具体的に何が良かったか
+   - 数値的根拠や発言の時刻があれば記載
+3. 改善点 Top 3-5
+   - 何が課題か
+   - どう改善すればよいか（具体的な提案）
+4. 詳細フィードバック
+
+よかった点・改善点は、話し方と内容の両方から重要なものを選んで絞り込み、
+重要度の高い順に並べてください。
+
+トーン: 建設的でポジティブ。批判的にならず、成長をサポートする姿勢で。
+日本語で出力してください。
+""" + REPORT_OUTPUT_FORMAT
+
+
+class SinglePassAnalyzer:
+    """単一呼び出し分析エージェント（話し方分析・内容分析・監督者エージェントの代わり）."""
+
+    def __init__(self, language_code: str = "ja-JP"):
+        """
+        初期化.
+
+        Args:
+            language_code: 発表の言語コード（採点の閾値の選択に使用）
+        """
+        self.model_id = os.getenv("SINGLE_PASS_MODEL_ID", DEFAULT_MODEL_ID)
+        self.language_code = language_code
+
+    def generate_feedback_report(self, transcription: Dict, audio_features: Dict) -> Dict:
+        """
+        書き起こしと音声特徴量から最終フィードバックレポートを生成
+
+        Args:
+            transcription: 書き起こし結果
+            audio_features: 音声特徴量
+
+        Returns:
+            dict: 最終レポート（OrchestratorAgent.generate_feedback_report()と同じ形式）
+        """
+        prompt = self._build_prompt(transcription, audio_features)
+        result = run_agent(self.model_id, SYSTEM_PROMPT, prompt, region_name=AWS_REGION)
+        return parse_report(result)
+
+    async def stream_feedback_report(
+        self, transcription: Dict, audio_features: Dict
+    ) -> AsyncIterator[Dict]:
+        """
+        最終フィードバックレポートをストリーミング生成.
+
+        Args:
+            transcription: 書き起こし結果
+            audio_features: 音声特徴量
+
+        Yields:
+            dict: OrchestratorAgent.stream_feedback_report()と同じイベント
+        """
+        prompt = self._build_prompt(transcription, audio_features)
+        async for event in stream_report_events(self.model_id, SYSTEM_PROMPT, prompt):
+            yield event
+
+    def _build_prompt(self, transcription: Dict, audio_features: Dict) -> str:
+        """音声特徴量・採点結果・書き起こしの抜粋からプロンプトを構築."""
+        scoring = score_speech(audio_features, transcription["duration"], self.language_code)
+        filler_words = audio_features.get('filler_words', {})
+        features = {
+            "speaking_rate": round(audio_features.get('speaking_rate', 0), 1),
+            "filler_words": {word: data['count'] for word, data in filler_words.items()},
+            "pauses": {
+                "total": audio_features.get('pauses', {}).get('total', 0),
+                "avg_duration": round(audio_features.get('pauses', {}).get('avg_duration', 0), 2),
+                "long_pauses": len(audio_features.get('pauses', {}).get('long_pauses', [])),
+            },
+            "scores": scoring["scores"],
+            "strengths": scoring["strengths"],
+            "improvements": scoring["improvements"],
+        }
+
+        condensed = condense_transcript(transcription, CONTENT_TOKEN_BUDGET)
+        if condensed["is_condensed"]:
+            text_label = (
+                f"書き起こしテキスト（抜粋: {condensed['kept_segments']}/{condensed['total_segments']}文、"
+                "[mm:ss]は発話の開始時刻）"
+            )
+        else:
+            text_label = "書き起こしテキスト"
+
+        return f"""
+以下のプレゼンテーションを分析し、最終フィードバックレポートを作成してください。
+
+【総時間】
+{transcription['duration']:.1f}秒 ({transcription['duration'] / 60:.1f}分)
+
+【音声特徴量と話し方の採点結果】（話速は文字/分、スコアは0〜1）
+{json.dumps(features, ensure_ascii=False, indent=2)}
+
+【{text_label}】
+{condensed['text']}
+"""
+
+
+def create_single_pass_analyzer(language_code: str = "ja-JP") -> SinglePassAnalyzer:
+    """
+    単一呼び出し分析エージェントを作成.
+
+    Args:
+        language_code: 発表の言語コード
+
+    Returns:
+        SinglePassAnalyzer: 単一呼び出し分析エージェント
+    """
+    return SinglePassAnalyzer(language_code=language_code)
@@ -1,11 +1,13 @@
 """音声特徴分析エージェント"""
 
+import json
 import os
-from strands import Agent
-from strands.models import BedrockModel
-from typing import Dict
+from typing import Dict, Optional
 
-from .utils import parse_agent_response
+from ..core.scoring import score_speech
+from ..core.transcript_condenser import SPEECH_TOKEN_BUDGET, condense_transcript
+from .model_pool import run_agent
+from .utils import get_response_text, merge_usage, parse_agent_response
 
 
 # オレゴンリージョン（us-west-2）
@@ -15,6 +17,12 @@ AWS_REGION = "us-west-2"
 # CLAUDE_MODEL_ID = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
 CLAUDE_MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
 
+# 分析モード（"llm": LLMが分析 / "rules": ルールベースの採点のみ（LLMを呼ばない） /
+# "hybrid": ルールベースで採点し、LLMは短い講評だけを書く）
+# 出力の性質が変わるため、デフォルトは従来どおり"llm"（"rules"・"hybrid"は明示的に選ぶ）
+SPEECH_ANALYSIS_MODE = os.getenv("SPEECH_ANALYSIS_MODE", "llm")
+SPEECH_ANALYSIS_MODES = ("llm", "rules", "hybrid")
+
 SYSTEM_PROMPT = """あなたは音声特徴分析の専門家です。
 与えられた書き起こしデータと音声特徴量から、発表者の話し方について分析してください。
 
@@ -36,19 +44,58 @@ JSON形式で以下の構造で出力してください:
 """
 
 
+NARRATIVE_SYSTEM_PROMPT = """あなたはプレゼンテーションの話し方のコーチです。
+ルールベースで算出した話し方の採点結果（スコア・強み・改善点）が与えられます。
+それをもとに、発表者への講評を200字程度の1段落で書いてください。
+
+- 採点結果の数値や強み・改善点を変更したり、新たな指摘を加えたりしないでください
+- 良い点を認めたうえで、最も重要な改善点を1つ強調してください
+- 日本語で出力してください
+
+【出力形式】
+JSON形式で以下の構造で出力してください:
+{
+  "feedback": "講評（1段落）"
+}
+"""
+
+
 class SpeechAnalyzer:
     """音声特徴分析エージェント."""
 
-    def __init__(self):
-        """初期化."""
-        # model = BedrockModel(model_id=NOVA_LITE_MODEL_ID, region_name=AWS_REGION)  # 元のモデル
-        model = BedrockModel(model_id=CLAUDE_MODEL_ID, region_name=AWS_REGION)  # 一時的にClaude使用
-        self.agent = Agent(model=model, system_prompt=SYSTEM_PROMPT)
+    def __init__(self, mode: Optional[str] = None, language_code: str = "ja-JP"):
+        """
+        初期化.
+
+        Args:
+            mode: 分析モード（"llm", "rules", "hybrid"、省略時はSPEECH_ANALYSIS_MODE）
+            language_code: 発表の言語コード（採点の閾値の選択に使用）
+
+        Raises:
+            ValueError: 未対応のモードの場合
+        """
+        # self.model_id = NOVA_LITE_MODEL_ID  # 元のモデル
+        self.model_id = CLAUDE_MODEL_ID  # 一時的にClaude使用
+        self.mode = mode or SPEECH_ANALYSIS_MODE
+        if self.mode not in SPEECH_ANALYSIS_MODES:
+            raise ValueError(
+                f"未対応の話し方分析モードです: {self.mode}（{' / '.join(SPEECH_ANALYSIS_MODES)}）"
+            )
+        self.language_code = language_code
+
+    @property
+    def uses_acoustic_features(self) -> bool:
+        """波形の音響特徴量（audio_features["acoustic"]）を分析に使うか（"llm"モードのみ）."""
+        return self.mode == "llm"
 
     def analyze_speech(self, transcription: Dict, audio_features: Dict) -> Dict:
         """
         音声特徴を分析
 
+        modeが"rules"の場合はLLMを呼ばず、ルールベースの採点結果を返す。
+        "hybrid"の場合は採点結果をもとにLLMが短い講評だけを書く。
+        いずれのモードでもルールベースのスコアを含める。
+
         Args:
             transcription: 書き起こし結果
             audio_features: 音声特徴量（話速、ポーズ等）
@@ -59,18 +106,44 @@ class SpeechAnalyzer:
                     "feedback": "分析結果テキスト",
                     "strengths": [...],
                     "improvements": [...],
+                    "scores": {"speaking_rate", "filler_words", "pauses", "overall"},
                     "usage": {
                         "input_tokens": int,
-                        "output_tokens": int
+                        "output_tokens": int,
+                        "calls": int,
+                        "cached_calls": int
                     }
                 }
         """
+        scoring = score_speech(audio_features, transcription.get("duration", 0.0), self.language_code)
+        if self.mode == "rules":
+            return {
+                "feedback": scoring["feedback"],
+                "strengths": scoring["strengths"],
+                "improvements": scoring["improvements"],
+                "scores": scoring["scores"],
+                "usage": merge_usage([]),
+            }
+        if self.mode == "hybrid":
+            return self._narrate(scoring)
+
         # フィラーワードの整形
         filler_words = audio_features.get('filler_words', {})
         filler_summary = "\n".join(
             [f"  - {word}: {data['count']}回" for word, data in filler_words.items()]
         ) if filler_words else "  なし"
 
+        # 音響特徴量（波形から計算した場合のみ）の整形
+        acoustic = audio_features.get('acoustic')
+        acoustic_summary = f"""
+- 音響特徴（波形解析）:
+  - 平均音量: {acoustic['energy']['mean_db']:.1f} dBFS（ばらつき: {acoustic['energy']['variation_db']:.1f} dB）
+  - 無音区間: {acoustic['silences']['total']}回（3秒以上: {len(acoustic['silences']['long_silences'])}回）
+  - 声の高さ: 平均 {acoustic['pitch']['mean_hz']:.0f} Hz（ばらつき: {acoustic['pitch']['std_hz']:.0f} Hz）""" if acoustic else ""
+
+        # 書き起こしの抜粋（発表全体から時刻付きで抜き出し、トークン数を一定に保つ）
+        transcript_excerpt = condense_transcript(transcription, SPEECH_TOKEN_BUDGET)["text"]
+
         # プロンプト構築
         prompt = f"""
 以下の音声特徴量を分析してください。
@@ -82,35 +155,61 @@ class SpeechAnalyzer:
 - ポーズ統計:
   - 総ポーズ数: {audio_features.get('pauses', {}).get('total', 0)}
   - 平均ポーズ時間: {audio_features.get('pauses', {}).get('avg_duration', 0):.2f}秒
-  - 長すぎるポーズ: {len(audio_features.get('pauses', {}).get('long_pauses', []))}回
+  - 長すぎるポーズ: {len(audio_features.get('pauses', {}).get('long_pauses', []))}回{acoustic_summary}
 
 【書き起こしテキスト（抜粋）】
-{transcription['text'][:500]}...
+{transcript_excerpt}
 
 上記の情報をもとに、音声特徴についてフィードバックしてください。
 """
 
         # エージェント実行
-        result = self.agent(prompt)
+        result = run_agent(self.model_id, SYSTEM_PROMPT, prompt, region_name=AWS_REGION)
 
         # 結果をパースして使用量を追加
         fallback = {
-            "feedback": result.message['content'][0]['text'],
+            "feedback": get_response_text(result),
             "strengths": [],
             "improvements": []
         }
         analysis = parse_agent_response(result, fallback_value=fallback)
+        analysis["scores"] = scoring["scores"]
 
         return analysis
 
+    def _narrate(self, scoring: Dict) -> Dict:
+        """ルールベースの採点結果をもとに、LLMに講評だけを書かせる."""
+        prompt = f"""
+以下は発表者の話し方の採点結果です（スコアは0〜1）。
 
-def create_speech_analyzer() -> SpeechAnalyzer:
+【採点結果】
+{json.dumps({key: scoring[key] for key in ("scores", "strengths", "improvements")}, ensure_ascii=False, indent=2)}
+
+この採点結果をもとに、発表者への講評を書いてください。
+"""
+        result = run_agent(self.model_id, NARRATIVE_SYSTEM_PROMPT, prompt, region_name=AWS_REGION)
+        narrative = parse_agent_response(result, fallback_value={"feedback": scoring["feedback"]})
+
+        return {
+            "feedback": narrative.get("feedback") or scoring["feedback"],
+            "strengths": scoring["strengths"],
+            "improvements": scoring["improvements"],
+            "scores": scoring["scores"],
+            "usage": narrative["usage"],
+        }
+
+
+def create_speech_analyzer(mode: Optional[str] = None, language_code: str = "ja-JP") -> SpeechAnalyzer:
     """
     音声特徴分析エージェントを作成.
 
+    Args:
+        mode: 分析モード（"llm", "rules", "hybrid"、省略時はSPEECH_ANALYSIS_MODE）
+        language_code: 発表の言語コード
+
     Returns:
         SpeechAnalyzer: 音声特徴分析エージェント
     """
-    return SpeechAnalyzer()
+    return SpeechAnalyzer(mode=mode, language_code=language_code)
 
 
@@ -2,7 +2,13 @@
 
 import json
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
+
+
+# extract_usage_metrics()が返すトークン数のキー（複数回の呼び出しを合算する場合に使用）
+USAGE_TOKEN_KEYS = ("input_tokens", "output_tokens")
+# 呼び出し回数のキー（全体の回数と、そのうち応答キャッシュから返した回数）
+USAGE_COUNT_KEYS = ("calls", "cached_calls")
 
 
 def extract_json_from_response(response_text: str) -> str:
@@ -24,23 +30,66 @@ def extract_json_from_response(response_text: str) -> str:
     return response_text
 
 
-def extract_usage_metrics(result) -> Dict[str, int]:
+def extract_usage_metrics(result) -> Dict[str, Any]:
     """
     エージェント実行結果からトークン使用量を抽出
 
+    応答キャッシュから返した応答の場合は元の呼び出しの使用量を返し、cached_callsを1にする
+    （実際にはBedrockを呼んでいないため、コスト計算では除外する）
+
     Args:
         result: エージェント実行結果（strands Agentの返り値）
 
     Returns:
-        dict: {"input_tokens": int, "output_tokens": int}
+        dict: {
+            "input_tokens": int,
+            "output_tokens": int,
+            "calls": 1,
+            "cached_calls": 応答キャッシュから返した場合は1、それ以外は0
+        }
     """
     usage = result.metrics.accumulated_usage
     return {
         "input_tokens": usage.get('inputTokens', 0),
-        "output_tokens": usage.get('outputTokens', 0)
+        "output_tokens": usage.get('outputTokens', 0),
+        "calls": 1,
+        "cached_calls": int(getattr(result, "cached", False))
     }
 
 
+def merge_usage(usages: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    複数回の呼び出しの使用量を合算
+
+    Args:
+        usages: extract_usage_metrics()（またはこの関数）の返り値の列
+
+    Returns:
+        dict: extract_usage_metrics()と同じキーの合計（呼び出しがなければすべて0）
+    """
+    merged = {key: 0 for key in USAGE_TOKEN_KEYS + USAGE_COUNT_KEYS}
+    for usage in usages:
+        for key in merged:
+            merged[key] += usage.get(key, 0)
+    return merged
+
+
+def get_response_text(result) -> str:
+    """
+    エージェント実行結果から応答テキストを取り出す
+
+    テキストのブロックをすべて連結する（先頭のブロックがテキストとは限らないため。
+    推論内容・ツール呼び出し等のテキスト以外のブロックは無視する）
+
+    Args:
+        result: エージェント実行結果（strands Agentの返り値）
+
+    Returns:
+        str: 応答テキスト（テキストのブロックがなければ空文字）
+    """
+    return "".join(block["text"] for block in result.message["content"] if "text" in block)
+
+
 def parse_agent_response(
     result,
     fallback_value: Optional[Dict[str, Any]] = None
@@ -56,7 +105,7 @@ def parse_agent_response(
         dict: パース済みレスポンス（usageフィールド付き）
     """
     # レスポンステキストを取得
-    output_text = result.message['content'][0]['text']
+    output_text = get_response_text(result)
 
     # JSONを抽出
     json_text = extract_json_from_response(output_text)
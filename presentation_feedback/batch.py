@@ -0,0 +1,274 @@
+"""バッチ分析（複数の音声ファイルを並列数を制限して分析）."""
+
+import asyncio
+import functools
+import glob
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .pipeline import run_analysis_pipeline_async
+
+
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".ogg", ".flac"}
+AGGREGATE_FILE_NAME = "results.jsonl"
+
+
+def collect_audio_files(target: str) -> List[Path]:
+    """
+    分析対象の音声ファイルを収集.
+
+    Args:
+        target: ディレクトリ（再帰的に探索）またはglobパターン
+
+    Returns:
+        list: 音声ファイルのパス（ソート済み）
+    """
+    path = Path(target)
+    if path.is_dir():
+        candidates = path.rglob("*")
+    else:
+        candidates = (Path(p) for p in glob.glob(target, recursive=True))
+    return sorted(p for p in candidates if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS)
+
+
+def _report_path(audio_path: Path, root: Path, output_dir: Path) -> Path:
+    """音声ファイルに対応するレポートのパス（入力のディレクトリ構造を保つ）."""
+    relative = audio_path.resolve().relative_to(root)
+    return output_dir / relative.parent / f"{relative.name}.json"
+
+
+def _write_json_atomic(path: Path, data: Dict) -> None:
+    """一時ファイルに書いてからリネーム（途中で落ちても壊れたファイルを残さない）."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _limit_bedrock_concurrency(agents: List, max_concurrency: int) -> None:
+    """
+    エージェントが使うモデルごとに、Bedrock呼び出しの同時実行数を設定.
+
+    制限はinvokerが呼び出し1回ごとにかけるため、内容分析のmap-reduceのように
+    エージェント内部で並列に行う呼び出しも含めて上限を超えない。
+    model_idを持たないエージェント（デモ）は対象外。
+    """
+    model_ids = {getattr(agent, "model_id", None) for agent in agents} - {None}
+    if not model_ids:
+        return
+
+    from .agents import configure_model_limits
+
+    for model_id in sorted(model_ids):
+        configure_model_limits(model_id, max_concurrency=max_concurrency)
+
+
+def _load_components(
+    demo: bool,
+    backend: Optional[str] = None,
+    language_code: str = "ja-JP",
+    speech_mode: Optional[str] = None,
+) -> Dict[str, Callable]:
+    """書き起こし・特徴量抽出・エージェントのファクトリを取得."""
+    if demo:
+        from .demo import (
+            transcribe_audio_demo,
+            extract_audio_features_demo,
+            create_speech_analyzer_demo,
+            create_content_analyzer_demo,
+            create_orchestrator_agent_demo,
+            create_single_pass_analyzer_demo,
+        )
+
+        return {
+            "transcribe": transcribe_audio_demo,
+            "extract_features": extract_audio_features_demo,
+            "speech": create_speech_analyzer_demo,
+            "content": create_content_analyzer_demo,
+            "orchestrator": create_orchestrator_agent_demo,
+            "single_pass": create_single_pass_analyzer_demo,
+        }
+
+    from .core import transcribe_audio, extract_audio_features
+    from .agents import (
+        create_speech_analyzer,
+        create_content_analyzer,
+        create_orchestrator_agent,
+        create_single_pass_analyzer,
+    )
+
+    return {
+        "transcribe": functools.partial(transcribe_audio, backend=backend),
+        "extract_features": extract_audio_features,
+        "speech": functools.partial(create_speech_analyzer, mode=speech_mode, language_code=language_code),
+        "content": create_content_analyzer,
+        "orchestrator": create_orchestrator_agent,
+        "single_pass": functools.partial(create_single_pass_analyzer, language_code=language_code),
+    }
+
+
+async def run_batch_async(
+    audio_files: List[Path],
+    output_dir: str,
+    language_code: str = "ja-JP",
+    transcribe_concurrency: int = 4,
+    bedrock_concurrency: int = 4,
+    demo: bool = False,
+    backend: Optional[str] = None,
+    analysis_mode: Optional[str] = None,
+    speech_mode: Optional[str] = None,
+) -> Dict:
+    """
+    複数の音声ファイルを分析し、ファイルごとのJSONと集計JSONLを出力.
+
+    レポートJSONが既に存在するファイルはスキップするため、
+    途中で中断しても同じコマンドで再開できる。
+
+    Args:
+        audio_files: 音声ファイルのパス
+        output_dir: 出力ディレクトリ
+        language_code: 言語コード
+        transcribe_concurrency: Transcribeジョブの最大同時実行数
+        bedrock_concurrency: モデルごとのBedrock呼び出しの最大同時実行数
+        demo: Trueの場合はダミーデータで実行
+        backend: 書き起こし方式（省略時はTRANSCRIBE_BACKEND）
+        analysis_mode: 分析方式（"multi_agent", "single_pass"、省略時はANALYSIS_MODE）
+        speech_mode: 話し方分析のモード（"llm", "rules", "hybrid"、省略時はSPEECH_ANALYSIS_MODE）
+
+    Returns:
+        dict: {"total": int, "completed": int, "skipped": int, "failed": int}
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    aggregate_path = output_path / AGGREGATE_FILE_NAME
+
+    resolved = [p.resolve() for p in audio_files]
+    root = Path(os.path.commonpath([p.parent for p in resolved])) if resolved else output_path
+    targets = [(p, _report_path(p, root, output_path)) for p in resolved]
+
+    # 完了済みレポートから集計JSONLを作り直す（再開時の整合性のため）
+    pending = []
+    with open(aggregate_path, "w", encoding="utf-8") as f:
+        for audio_path, report_path in targets:
+            if report_path.exists():
+                record = json.loads(report_path.read_text(encoding="utf-8"))
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                pending.append((audio_path, report_path))
+    skipped = len(targets) - len(pending)
+    if skipped:
+        print(f"✓ 完了済み {skipped}件をスキップ")
+
+    components = _load_components(demo, backend, language_code, speech_mode)
+    speech_analyzer = components["speech"]()
+    content_analyzer = components["content"]()
+    orchestrator = components["orchestrator"]()
+    single_pass_analyzer = components["single_pass"]()
+    _limit_bedrock_concurrency(
+        [speech_analyzer, content_analyzer, orchestrator, single_pass_analyzer], bedrock_concurrency
+    )
+
+    transcribe_semaphore = asyncio.Semaphore(transcribe_concurrency)
+    aggregate_lock = asyncio.Lock()
+    counts = {"completed": 0, "failed": 0}
+
+    # 待機中のスレッドでプールが埋まらないよう、同時実行数に合わせて確保
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=transcribe_concurrency + 2 * bedrock_concurrency + 4)
+    )
+
+    async def process(audio_path: Path, report_path: Path):
+        start = time.perf_counter()
+        try:
+            async with transcribe_semaphore:
+                transcription = await asyncio.to_thread(
+                    components["transcribe"], str(audio_path), language_code
+                )
+            audio_features = components["extract_features"](transcription)
+            pipeline_result = await run_analysis_pipeline_async(
+                transcription,
+                audio_features,
+                speech_analyzer=speech_analyzer,
+                content_analyzer=content_analyzer,
+                orchestrator=orchestrator,
+                mode=analysis_mode,
+                single_pass_analyzer=single_pass_analyzer,
+            )
+            record = {
+                "file": str(audio_path),
+                "status": "completed",
+                "duration": transcription["duration"],
+                "mode": pipeline_result["mode"],
+                "audio_features": audio_features,
+                "speech_result": pipeline_result["speech_result"],
+                "content_result": pipeline_result["content_result"],
+                "report": pipeline_result["report"],
+                "timings": {
+                    **pipeline_result["timings"],
+                    "total": time.perf_counter() - start,
+                },
+            }
+            _write_json_atomic(report_path, record)
+            counts["completed"] += 1
+            print(f"✓ {audio_path.name}: 完了 ({record['timings']['total']:.1f}秒)")
+        except Exception as e:
+            # 失敗したファイルはレポートを作らず、次回実行時に再処理する
+            record = {"file": str(audio_path), "status": "failed", "error": str(e)}
+            counts["failed"] += 1
+            print(f"❌ {audio_path.name}: {e}")
+
+        async with aggregate_lock:
+            with open(aggregate_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    await asyncio.gather(*[process(a, r) for a, r in pending])
+
+    return {"total": len(targets), "skipped": skipped, **counts}
+
+
+def run_batch(
+    audio_files: List[Path],
+    output_dir: str,
+    language_code: str = "ja-JP",
+    transcribe_concurrency: int = 4,
+    bedrock_concurrency: int = 4,
+    demo: bool = False,
+    backend: Optional[str] = None,
+    analysis_mode: Optional[str] = None,
+    speech_mode: Optional[str] = None,
+) -> Dict:
+    """
+    run_batch_async() の同期ラッパー.
+
+    Args:
+        audio_files: 音声ファイルのパス
+        output_dir: 出力ディレクトリ
+        language_code: 言語コード
+        transcribe_concurrency: Transcribeジョブの最大同時実行数
+        bedrock_concurrency: モデルごとのBedrock呼び出しの最大同時実行数
+        demo: Trueの場合はダミーデータで実行
+        backend: 書き起こし方式（省略時はTRANSCRIBE_BACKEND）
+        analysis_mode: 分析方式（"multi_agent", "single_pass"、省略時はANALYSIS_MODE）
+        speech_mode: 話し方分析のモード（"llm", "rules", "hybrid"、省略時はSPEECH_ANALYSIS_MODE）
+
+    Returns:
+        dict: run_batch_async() と同じ
+    """
+    return asyncio.run(
+        run_batch_async(
+            audio_files,
+            output_dir,
+            language_code=language_code,
+            transcribe_concurrency=transcribe_concurrency,
+            bedrock_concurrency=bedrock_concurrency,
+            demo=demo,
+            backend=backend,
+            analysis_mode=analysis_mode,
+            speech_mode=speech_mode,
+        )
+    )
@@ -1,7 +1,43 @@
 """Core processing logic - AWS Transcribe, audio features, cost tracking."""
 
+from .aws_clients import get_client
 from .transcriber import transcribe_audio
+from .media_probe import probe_media
+from .audio_normalizer import normalize_audio
+from .transcriber_registry import (
+    register_transcriber,
+    get_transcriber,
+    get_transcriber_cache_options,
+    available_transcribers,
+)
+from . import local_transcriber  # noqa: F401  "local"バックエンドを登録
+from . import chunked_transcriber  # noqa: F401  "chunked"バックエンドを登録
 from .audio_features import extract_audio_features
+from .filler_words import FillerWordMatcher, detect_filler_words
+from .acoustic_features import extract_acoustic_features, extract_silences
+from .transcript_condenser import condense_transcript
+from .scoring import score_speech
 from .cost_tracker import CostTracker
+from .transcription_cache import TranscriptionCache, LocalDirectoryBackend, S3PrefixBackend
 
-__all__ = ["transcribe_audio", "extract_audio_features", "CostTracker"]
+__all__ = [
+    "get_client",
+    "transcribe_audio",
+    "probe_media",
+    "normalize_audio",
+    "register_transcriber",
+    "get_transcriber",
+    "get_transcriber_cache_options",
+    "available_transcribers",
+    "extract_audio_features",
+    "FillerWordMatcher",
+    "detect_filler_words",
+    "extract_acoustic_features",
+    "extract_silences",
+    "condense_transcript",
+    "score_speech",
+    "CostTracker",
+    "TranscriptionCache",
+    "LocalDirectoryBackend",
+    "S3PrefixBackend",
+]
@@ -0,0 +1,260 @@
+"""波形から直接求める音響特徴量（音量・無音区間・ピッチ）."""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .audio_decoder import DEFAULT_SAMPLE_RATE, SAMPLE_WIDTH, iter_pcm_chunks
+
+
+# フレーム設定（16kHz時: 32msフレーム / 10msホップ）
+FRAME_SEC = 0.032
+HOP_SEC = 0.010
+CHUNK_SEC = 10.0  # 一度にデコード・処理する長さ（メモリ使用量はこれで決まる）
+
+# 無音判定
+SILENCE_THRESHOLD_DB = -40.0  # dBFS
+MIN_SILENCE_SEC = 0.3
+LONG_SILENCE_SEC = 3.0
+
+# ピッチ推定（自己相関法）
+PITCH_MIN_HZ = 60.0
+PITCH_MAX_HZ = 400.0
+VOICING_THRESHOLD = 0.3  # 正規化自己相関のピークがこれ以上なら有声とみなす
+
+
+class _RunningStats:
+    """平均・標準偏差・最小・最大を逐次計算（値を保持しない）."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def update(self, values: np.ndarray) -> None:
+        if values.size == 0:
+            return
+        values = values.astype(np.float64, copy=False)
+        self.count += values.size
+        self.total += float(values.sum())
+        self.total_sq += float(np.square(values).sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def summary(self) -> Dict[str, float]:
+        if self.count == 0:
+            return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0}
+        mean = self.total / self.count
+        variance = max(self.total_sq / self.count - mean * mean, 0.0)
+        return {"mean": mean, "std": variance ** 0.5, "min": self.min, "max": self.max}
+
+
+def _estimate_pitch(frames: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    フレームごとの基本周波数を自己相関法で推定（無声フレームは除外）.
+
+    Args:
+        frames: (フレーム数, フレーム長) の配列
+        sample_rate: サンプリングレート
+
+    Returns:
+        np.ndarray: 有声フレームのピッチ（Hz）
+    """
+    if frames.shape[0] == 0:
+        return np.empty(0)
+    frame_len = frames.shape[1]
+    windowed = frames * np.hanning(frame_len).astype(np.float32)
+    # FFTで全フレームの自己相関をまとめて計算
+    spectrum = np.fft.rfft(windowed, n=2 * frame_len, axis=1)
+    autocorr = np.fft.irfft(np.abs(spectrum) ** 2, axis=1)[:, :frame_len]
+
+    min_lag = int(sample_rate / PITCH_MAX_HZ)
+    max_lag = min(int(sample_rate / PITCH_MIN_HZ), frame_len - 1)
+    energy = autocorr[:, 0]
+    valid = energy > 0
+    lags = autocorr[valid, min_lag:max_lag + 1] / energy[valid, None]
+
+    best = lags.argmax(axis=1)
+    peak = lags[np.arange(lags.shape[0]), best]
+    voiced = peak >= VOICING_THRESHOLD
+    return sample_rate / (best[voiced] + min_lag)
+
+
+def analyze_pcm_chunks(
+    chunks: Iterable[np.ndarray],
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    with_pitch: bool = True,
+) -> Dict:
+    """
+    int16 PCMのチャンク列から音響特徴量を計算.
+
+    チャンク境界をまたぐフレームは前チャンクの末尾を持ち越して処理するため、
+    結果はチャンクサイズに依存しない。フレーム化はストライドビューで行いコピーしない。
+
+    Args:
+        chunks: int16モノラルPCMのNumPy配列の列
+        sample_rate: サンプリングレート
+        with_pitch: ピッチも推定するか（Falseの場合、結果に"pitch"を含めない）
+
+    Returns:
+        dict: extract_acoustic_features()と同じ形式
+    """
+    frame_len = int(FRAME_SEC * sample_rate)
+    hop = int(HOP_SEC * sample_rate)
+    min_silence_frames = int(MIN_SILENCE_SEC / HOP_SEC)
+
+    energy_stats = _RunningStats()
+    pitch_stats = _RunningStats()
+    silences: List[Dict] = []
+    total_samples = 0
+    frame_offset = 0
+    voiced_frames = 0
+    silence_start: Optional[int] = None  # 継続中の無音区間の開始フレーム
+    speech_start: Optional[int] = None
+    speech_end: Optional[int] = None
+    carry = np.empty(0, dtype=np.float32)
+
+    def close_silence(end_frame: int):
+        if end_frame - silence_start >= min_silence_frames:
+            silences.append({
+                "start": silence_start * HOP_SEC,
+                "duration": (end_frame - silence_start) * HOP_SEC,
+            })
+
+    for chunk in chunks:
+        total_samples += chunk.size
+        buffer = np.concatenate([carry, chunk.astype(np.float32) / 32768.0])
+        if buffer.size < frame_len:
+            carry = buffer
+            continue
+
+        frames = sliding_window_view(buffer, frame_len)[::hop]
+        n_frames = frames.shape[0]
+        carry = buffer[n_frames * hop:]
+
+        # 音量（RMS → dBFS）
+        rms = np.sqrt(np.mean(np.square(frames), axis=1))
+        db = 20 * np.log10(rms + 1e-10)
+        is_silent = db < SILENCE_THRESHOLD_DB
+        energy_stats.update(db[~is_silent])
+
+        # 発話の開始・終了フレーム
+        speech_indices = np.flatnonzero(~is_silent)
+        if speech_indices.size:
+            if speech_start is None:
+                speech_start = frame_offset + int(speech_indices[0])
+            speech_end = frame_offset + int(speech_indices[-1]) + 1
+
+        # 無音区間（状態の切り替わり位置をまとめて求める）
+        changes = np.flatnonzero(np.diff(is_silent.astype(np.int8))) + 1
+        boundaries = np.concatenate([[0], changes])
+        for index in boundaries.tolist():
+            frame = frame_offset + index
+            if is_silent[index]:
+                if silence_start is None:
+                    silence_start = frame
+            elif silence_start is not None:
+                close_silence(frame)
+                silence_start = None
+
+        # ピッチ（有音フレームのみ）
+        if with_pitch:
+            pitches = _estimate_pitch(frames[~is_silent], sample_rate)
+            voiced_frames += pitches.size
+            pitch_stats.update(pitches)
+
+        frame_offset += n_frames
+
+    if silence_start is not None:
+        close_silence(frame_offset)
+
+    energy = energy_stats.summary()
+    result = {
+        "duration": total_samples / sample_rate,
+        "speech_start": (speech_start or 0) * HOP_SEC,
+        "speech_end": (speech_end or 0) * HOP_SEC,
+        "energy": {
+            "mean_db": energy["mean"],
+            "max_db": energy["max"] if energy_stats.count else 0.0,
+            "variation_db": energy["std"],
+        },
+        "silences": {
+            "total": len(silences),
+            "total_duration": sum(s["duration"] for s in silences),
+            "long_silences": [s for s in silences if s["duration"] >= LONG_SILENCE_SEC],
+            "segments": silences,
+        },
+    }
+    if with_pitch:
+        pitch = pitch_stats.summary()
+        result["pitch"] = {
+            "mean_hz": pitch["mean"],
+            "std_hz": pitch["std"],
+            "min_hz": pitch["min"],
+            "max_hz": pitch["max"],
+            "voiced_ratio": voiced_frames / frame_offset if frame_offset else 0.0,
+        }
+    return result
+
+
+def _iter_int16_chunks(audio_file_path: str, sample_rate: int) -> Iterator[np.ndarray]:
+    """音声ファイルをCHUNK_SECずつint16モノラルPCMにデコード."""
+    chunk_bytes = int(CHUNK_SEC * sample_rate) * SAMPLE_WIDTH
+    for data in iter_pcm_chunks(audio_file_path, sample_rate, chunk_bytes):
+        yield np.frombuffer(data, dtype=np.int16)
+
+
+def extract_acoustic_features(
+    audio_file_path: str,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> Dict:
+    """
+    音声ファイルを1回デコードし、音響特徴量を計算.
+
+    一定長のチャンクごとにデコード・処理するため、長時間の音声でもメモリ使用量は一定。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        sample_rate: 解析時のサンプリングレート
+
+    Returns:
+        dict: {
+            "duration": 音声の長さ（秒）,
+            "speech_start": 最初の発話の時刻（秒）,
+            "speech_end": 最後の発話の終了時刻（秒）,
+            "energy": {"mean_db": 平均音量, "max_db": 最大音量, "variation_db": 音量のばらつき},
+            "silences": {
+                "total": 無音区間数,
+                "total_duration": 無音の合計秒,
+                "long_silences": [{"start": 秒, "duration": 秒}, ...],  # 3秒以上
+                "segments": [{"start": 秒, "duration": 秒}, ...]
+            },
+            "pitch": {"mean_hz", "std_hz", "min_hz", "max_hz", "voiced_ratio"}
+        }
+    """
+    return analyze_pcm_chunks(_iter_int16_chunks(audio_file_path, sample_rate), sample_rate)
+
+
+def extract_silences(
+    audio_file_path: str,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> Dict:
+    """
+    音量（RMS）だけから無音区間と発話の範囲を求める（ピッチは推定しない）.
+
+    前後の無音の除去や分割位置の決定など、無音区間だけが必要な処理向け。
+    処理時間の大半を占めるピッチ推定（フレームごとのFFT）を行わない。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        sample_rate: 解析時のサンプリングレート
+
+    Returns:
+        dict: extract_acoustic_features()の返り値から"pitch"を除いたもの
+    """
+    return analyze_pcm_chunks(
+        _iter_int16_chunks(audio_file_path, sample_rate), sample_rate, with_pitch=False
+    )
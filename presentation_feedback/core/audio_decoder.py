@@ -0,0 +1,109 @@
+"""音声ファイルをPCMにストリーミングデコード（ffmpeg使用、全体をメモリに載せない）."""
+
+import asyncio
+import subprocess
+from typing import AsyncIterator, Iterator, List
+
+from pydub.utils import get_encoder_name
+
+
+# デコード設定
+DEFAULT_SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # 16bit
+DEFAULT_CHUNK_BYTES = 32 * 1024  # 16kHz/16bit/モノラルで約1秒
+
+
+def _ffmpeg_command(audio_file_path: str, sample_rate: int) -> List[str]:
+    """16bit リトルエンディアン・モノラルPCMを標準出力に書き出すffmpegコマンド."""
+    return [
+        get_encoder_name(),
+        "-nostdin",
+        "-loglevel", "error",
+        "-i", audio_file_path,
+        "-f", "s16le",
+        "-acodec", "pcm_s16le",
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "-",
+    ]
+
+
+def iter_pcm_chunks(
+    audio_file_path: str,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """
+    音声ファイルを16bitモノラルPCMにデコードし、固定サイズのチャンクで返す.
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        sample_rate: 出力サンプリングレート
+        chunk_bytes: チャンクのバイト数（最後のチャンクのみ短い場合あり）
+
+    Yields:
+        bytes: PCMデータ
+    """
+    process = subprocess.Popen(
+        _ffmpeg_command(audio_file_path, sample_rate),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while True:
+            chunk = process.stdout.read(chunk_bytes)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError(f"音声デコードエラー: {stderr.decode(errors='replace').strip()}")
+
+
+async def aiter_pcm_chunks(
+    audio_file_path: str,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> AsyncIterator[bytes]:
+    """
+    iter_pcm_chunks() の非同期版（デコード待ちの間イベントループを解放する）.
+
+    途中で打ち切る場合は contextlib.aclosing() 等で閉じると、ffmpegのプロセスを終了させる。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        sample_rate: 出力サンプリングレート
+        chunk_bytes: チャンクのバイト数
+
+    Yields:
+        bytes: PCMデータ
+    """
+    process = await asyncio.create_subprocess_exec(
+        *_ffmpeg_command(audio_file_path, sample_rate),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        while True:
+            try:
+                chunk = await process.stdout.readexactly(chunk_bytes)
+            except asyncio.IncompleteReadError as e:
+                chunk = e.partial
+            if not chunk:
+                break
+            yield chunk
+            if len(chunk) < chunk_bytes:
+                break
+        stderr = await process.stderr.read()
+        if await process.wait() != 0:
+            raise RuntimeError(f"音声デコードエラー: {stderr.decode(errors='replace').strip()}")
+    finally:
+        # 送信側のエラー等で途中で打ち切られた場合もffmpegを残さない
+        if process.returncode is None:
+            process.kill()
+            # 読み残した出力を捨てる（バッファが一杯のままだとwait()が終わらない）
+            await process.communicate()
@@ -1,55 +1,110 @@
 """音声特徴量の抽出."""
 
-from typing import Dict, List
+from operator import itemgetter
+from typing import Dict, List, Union
 
+import numpy as np
 
-def calculate_speaking_rate(segments: List[Dict]) -> float:
+from .filler_words import detect_filler_words
+
+
+# ポーズ判定の閾値
+PAUSE_THRESHOLD_SEC = 0.5  # 0.5秒以上をポーズと認定
+LONG_PAUSE_THRESHOLD_SEC = 3.0  # 3秒以上を長すぎるポーズ
+
+# セグメントのリスト、またはsegments_to_arrays()の返り値
+Segments = Union[List[Dict], Dict[str, np.ndarray]]
+
+_START_TIME = itemgetter("start_time")
+_END_TIME = itemgetter("end_time")
+_TEXT = itemgetter("text")
+
+
+def segments_to_arrays(segments: List[Dict]) -> Dict[str, np.ndarray]:
     """
-    話速を計算（文字/分）.
+    セグメントのリストを列ごとのNumPy配列に変換（特徴量計算の前に1度だけ行う）.
+
+    変換のコストはセグメントごとのPythonの処理が大半を占めるため、各列は
+    operator.itemgetter と map でC実装のまま取り出し、np.fromiter で直接配列にする
+    （Pythonのループで1回走査して3列を作るより速い）。
 
     Args:
         segments: 書き起こしセグメントのリスト
 
+    Returns:
+        dict: {
+            "start": 開始時刻の配列,
+            "end": 終了時刻の配列,
+            "chars": 文字数の配列
+        }
+    """
+    n = len(segments)
+    return {
+        "start": np.fromiter(map(_START_TIME, segments), dtype=np.float64, count=n),
+        "end": np.fromiter(map(_END_TIME, segments), dtype=np.float64, count=n),
+        "chars": np.fromiter(map(len, map(_TEXT, segments)), dtype=np.int64, count=n),
+    }
+
+
+def _as_arrays(segments: Segments) -> Dict[str, np.ndarray]:
+    return segments if isinstance(segments, dict) else segments_to_arrays(segments)
+
+
+def calculate_speaking_rate(segments: Segments) -> float:
+    """
+    話速を計算（文字/分）.
+
+    Args:
+        segments: 書き起こしセグメントのリスト（またはsegments_to_arrays()の返り値）
+
     Returns:
         float: 文字/分
     """
-    total_chars = sum(len(seg["text"]) for seg in segments)
-    total_time = sum(seg["end_time"] - seg["start_time"] for seg in segments) / 60
+    arrays = _as_arrays(segments)
+    total_chars = int(arrays["chars"].sum())
+    total_time = float((arrays["end"] - arrays["start"]).sum()) / 60
     return total_chars / total_time if total_time > 0 else 0.0
 
 
-def calculate_pause_stats(segments: List[Dict]) -> Dict:
+def calculate_pause_stats(segments: Segments) -> Dict:
     """
     ポーズ（間）の統計情報を計算.
 
     Args:
-        segments: 書き起こしセグメントのリスト
+        segments: 書き起こしセグメントのリスト（またはsegments_to_arrays()の返り値）
 
     Returns:
         dict: {
             "total": ポーズ総数,
             "avg_duration": 平均ポーズ時間,
-            "long_pauses": [{"time": 時刻, "duration": 長さ}, ...]
+            "long_pauses": [{"time": 時刻, "duration": 長さ}, ...],
+            "percentiles": {"p50": 中央値, "p90": 90パーセンタイル}
         }
     """
-    pauses = []
-    long_pauses = []
-
-    for i in range(len(segments) - 1):
-        pause_duration = segments[i + 1]["start_time"] - segments[i]["end_time"]
-        if pause_duration >= 0.5:  # 0.5秒以上をポーズと認定
-            pauses.append(pause_duration)
-            if pause_duration >= 3.0:  # 3秒以上を長すぎるポーズ
-                long_pauses.append({
-                    "time": segments[i]["end_time"],
-                    "duration": pause_duration
-                })
-
-    avg = sum(pauses) / len(pauses) if pauses else 0.0
+    arrays = _as_arrays(segments)
+    prev_end = arrays["end"][:-1]
+    gaps = arrays["start"][1:] - prev_end
+
+    is_pause = gaps >= PAUSE_THRESHOLD_SEC
+    pauses = gaps[is_pause]
+    is_long = gaps >= LONG_PAUSE_THRESHOLD_SEC
+
+    long_pauses = [
+        {"time": time, "duration": duration}
+        for time, duration in zip(prev_end[is_long].tolist(), gaps[is_long].tolist())
+    ]
+
+    if pauses.size:
+        avg = float(pauses.mean())
+        p50, p90 = (float(v) for v in np.percentile(pauses, [50, 90]))
+    else:
+        avg = p50 = p90 = 0.0
+
     return {
-        "total": len(pauses),
+        "total": int(pauses.size),
         "avg_duration": avg,
-        "long_pauses": long_pauses
+        "long_pauses": long_pauses,
+        "percentiles": {"p50": p50, "p90": p90},
     }
 
 
@@ -63,11 +118,14 @@ def extract_audio_features(transcription: Dict) -> Dict:
     Returns:
         dict: {
             "speaking_rate": 話速（文字/分）,
+            "filler_words": {"えー": {"count": 回数, "timestamps": [...]}, ...},
             "pauses": ポーズ統計
         }
     """
     segments = transcription["segments"]
+    arrays = segments_to_arrays(segments)
     return {
-        "speaking_rate": calculate_speaking_rate(segments),
-        "pauses": calculate_pause_stats(segments)
+        "speaking_rate": calculate_speaking_rate(arrays),
+        "filler_words": detect_filler_words(segments),
+        "pauses": calculate_pause_stats(arrays)
     }
@@ -0,0 +1,187 @@
+"""書き起こし前の音声正規化（16kHzモノラル圧縮・前後の無音除去）."""
+
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydub.utils import get_encoder_name
+
+from .acoustic_features import extract_silences
+from .transcription_cache import compute_audio_hash
+
+
+# 環境変数またはデフォルト設定
+NORMALIZE_ENABLED = os.getenv("AUDIO_NORMALIZE", "0") == "1"
+NORMALIZE_CODEC = os.getenv("AUDIO_NORMALIZE_CODEC", "flac")  # "flac" または "opus"
+NORMALIZE_DIR = os.getenv(
+    "AUDIO_NORMALIZE_DIR",
+    str(Path.home() / ".cache" / "presentation_feedback" / "normalized"),
+)
+# 変換結果の保存先全体の上限サイズ（超えたら最終使用が古いものから削除）
+NORMALIZE_MAX_BYTES = int(os.getenv("AUDIO_NORMALIZE_MAX_BYTES", str(2 * 1024 ** 3)))
+
+NORMALIZED_SAMPLE_RATE = 16000
+OPUS_BITRATE = "32k"
+TRIM_PADDING_SEC = 0.25  # 発話の前後に残す余白
+
+# コーデックごとのffmpeg引数と拡張子
+_CODECS = {
+    "flac": (["-c:a", "flac"], ".flac"),
+    "opus": (["-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip"], ".ogg"),
+}
+
+
+def _ffmpeg_command(
+    audio_file_path: str,
+    output_path: str,
+    codec: str,
+    start: float,
+    duration: Optional[float],
+) -> List[str]:
+    """16kHzモノラルに変換し、指定範囲だけを書き出すffmpegコマンド."""
+    codec_args, _ = _CODECS[codec]
+    command = [get_encoder_name(), "-nostdin", "-loglevel", "error", "-y"]
+    if start > 0:
+        command += ["-ss", f"{start:.3f}"]
+    command += ["-i", audio_file_path]
+    if duration is not None:
+        command += ["-t", f"{duration:.3f}"]
+    command += ["-ac", "1", "-ar", str(NORMALIZED_SAMPLE_RATE), *codec_args, output_path]
+    return command
+
+
+def _evict(directory: Path, max_bytes: int, keep: Path) -> None:
+    """
+    最終使用（mtime）が古い順に、変換結果（音声とメタデータ）を上限サイズまで削除.
+
+    メタデータのない音声ファイル（他のプロセスが変換中の一時ファイル）は対象にしない。
+    """
+    extensions = {extension for _, extension in _CODECS.values()}
+    entries = []
+    for path in directory.iterdir():
+        meta_path = path.with_suffix(".json")
+        if path.suffix not in extensions or not meta_path.exists():
+            continue
+        try:
+            stat = path.stat()
+            size = stat.st_size + meta_path.stat().st_size
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, size, path, meta_path))
+
+    total = sum(size for _, size, _, _ in entries)
+    for _, size, path, meta_path in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+        total -= size
+
+
+def _speech_range(acoustic: Dict) -> Optional[Dict[str, float]]:
+    """無音区間の解析結果から残す範囲（前後の無音を除いた区間）を決める."""
+    speech_start = acoustic["speech_start"]
+    speech_end = acoustic["speech_end"]
+    if speech_end <= speech_start:
+        return None  # 発話が検出されない場合は切り詰めない
+    start = max(0.0, speech_start - TRIM_PADDING_SEC)
+    end = min(acoustic["duration"], speech_end + TRIM_PADDING_SEC)
+    return {"start": start, "duration": end - start}
+
+
+def normalize_audio(
+    audio_file_path: str,
+    codec: str = NORMALIZE_CODEC,
+    trim_silence: bool = True,
+    acoustic: Optional[Dict] = None,
+    cache_dir: str = NORMALIZE_DIR,
+    max_bytes: int = NORMALIZE_MAX_BYTES,
+) -> Dict:
+    """
+    音声を16kHzモノラルの圧縮音声に変換し、前後の無音を除去.
+
+    変換はffmpegがファイルからファイルへストリーミングで行うため、音声全体を
+    メモリに載せない。結果は入力のハッシュをキーにcache_dirへ保存し、
+    同じファイルは再変換しない（cache_dir全体がmax_bytesを超えたら古いものから削除）。
+    前後の無音は音量だけの軽い解析（extract_silences()）で求める。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        codec: 出力コーデック（"flac" または "opus"）
+        trim_silence: 前後の無音を除去するか
+        acoustic: 計算済みのextract_acoustic_features()またはextract_silences()の返り値
+            （省略時はtrim_silenceの場合にextract_silences()で計算）
+        cache_dir: 変換結果の保存先
+        max_bytes: 保存先全体の上限サイズ
+
+    Returns:
+        dict: {
+            "path": 変換後のファイルパス,
+            "trim_offset": 先頭から除去した秒数（書き起こしの時刻に加算する）,
+            "input_bytes": 変換前のサイズ,
+            "output_bytes": 変換後のサイズ,
+            "bytes_saved": 削減したバイト数,
+            "cached": 変換済みの結果を再利用したか
+        }
+    """
+    if codec not in _CODECS:
+        raise ValueError(f"未対応のコーデックです: {codec}（利用可能: {', '.join(_CODECS)}）")
+    _, extension = _CODECS[codec]
+
+    key = f"{compute_audio_hash(audio_file_path)}-{codec}{'-trim' if trim_silence else ''}"
+    directory = Path(cache_dir).expanduser()
+    output_path = directory / f"{key}{extension}"
+    meta_path = directory / f"{key}.json"
+
+    if output_path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        # mtimeを最終使用時刻として使う（削除の順序用）
+        os.utime(output_path, None)
+        print(f"✓ 正規化済みの音声を使用: {output_path.name}")
+        return {"path": str(output_path), **meta, "cached": True}
+
+    speech_range = None
+    if trim_silence:
+        if acoustic is None:
+            acoustic = extract_silences(audio_file_path)
+        speech_range = _speech_range(acoustic)
+    start = speech_range["start"] if speech_range else 0.0
+    duration = speech_range["duration"] if speech_range else None
+
+    # 一時ファイルに書き出してから置き換える（変換途中のファイルをキャッシュとして読まない）
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=extension)
+    os.close(fd)
+    try:
+        process = subprocess.run(
+            _ffmpeg_command(audio_file_path, tmp_path, codec, start, duration),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"音声変換エラー: {process.stderr.decode(errors='replace').strip()}")
+        os.replace(tmp_path, output_path)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+    input_bytes = os.path.getsize(audio_file_path)
+    output_bytes = os.path.getsize(output_path)
+    meta = {
+        "trim_offset": start,
+        "input_bytes": input_bytes,
+        "output_bytes": output_bytes,
+        "bytes_saved": input_bytes - output_bytes,
+    }
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    _evict(directory, max_bytes, keep=output_path)
+
+    print(
+        f"✓ 音声を正規化: {input_bytes / 1024 / 1024:.1f}MB → {output_bytes / 1024 / 1024:.1f}MB"
+        f"（{meta['bytes_saved'] / 1024 / 1024:.1f}MB削減, 先頭{start:.1f}秒を除去）"
+    )
+    return {"path": str(output_path), **meta, "cached": False}
@@ -0,0 +1,78 @@
+"""boto3クライアントのプロセス共通レジストリ."""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+
+# 環境変数またはデフォルト設定
+AWS_REGION = os.getenv("AWS_REGION", "us-west-2")
+MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50"))
+MAX_RETRY_ATTEMPTS = int(os.getenv("AWS_MAX_RETRY_ATTEMPTS", "5"))
+RETRY_MODE = os.getenv("AWS_RETRY_MODE", "adaptive")
+
+_clients: Dict[Tuple, object] = {}
+_session: Optional[boto3.session.Session] = None
+_lock = threading.Lock()
+
+
+def _get_session() -> boto3.session.Session:
+    """共有セッションを取得（_lock保持中に呼ぶこと）."""
+    global _session
+    if _session is None:
+        _session = boto3.session.Session()
+    return _session
+
+
+def get_client(
+    service_name: str,
+    region_name: Optional[str] = None,
+    max_pool_connections: int = MAX_POOL_CONNECTIONS,
+    max_attempts: int = MAX_RETRY_ATTEMPTS,
+    retry_mode: str = RETRY_MODE,
+):
+    """
+    boto3クライアントを取得（同じ設定のクライアントは1度だけ作成して再利用）.
+
+    boto3クライアントはスレッドセーフなので、コネクションプールごと
+    プロセス全体で共有する。
+
+    Args:
+        service_name: サービス名（"s3", "transcribe"等）
+        region_name: リージョン（省略時はAWS_REGION）
+        max_pool_connections: コネクションプールの最大接続数
+        max_attempts: 最大試行回数（リトライ含む）
+        retry_mode: リトライモード（"standard" or "adaptive"）
+
+    Returns:
+        boto3クライアント
+    """
+    region_name = region_name or AWS_REGION
+    key = (service_name, region_name, max_pool_connections, max_attempts, retry_mode)
+
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            config = Config(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": max_attempts, "mode": retry_mode},
+            )
+            # Session.client()はスレッドセーフではないためロック内で作成
+            client = _get_session().client(service_name, region_name=region_name, config=config)
+            _clients[key] = client
+        return client
+
+
+def clear_clients() -> None:
+    """キャッシュ済みクライアントを破棄（認証情報の切り替え時など）."""
+    global _session
+    with _lock:
+        _clients.clear()
+        _session = None
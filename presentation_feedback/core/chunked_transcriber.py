@@ -0,0 +1,378 @@
+"""長時間音声の分割書き起こし（無音位置で分割 → 並列Transcribeジョブ → 時間軸の結合）."""
+
+import asyncio
+import math
+import os
+import subprocess
+import tempfile
+import uuid
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from botocore.exceptions import ClientError
+from pydub.utils import get_encoder_name
+
+from .acoustic_features import extract_silences
+from .aws_clients import get_client
+from .job_waiter import wait_for_transcription_jobs_async
+from .media_probe import probe_media
+from .transcriber import (
+    AWS_REGION,
+    S3_BUCKET,
+    content_addressed_key,
+    fetch_transcript_items,
+    start_transcription_job,
+    transcribe_batch,
+    upload_to_s3,
+)
+from .transcriber_registry import register_transcriber
+from .transcription_cache import compute_audio_hash
+from .transcript_segments import iter_transcript_segments, word_separator
+
+
+# 環境変数またはデフォルト設定
+CHUNK_TARGET_SEC = float(os.getenv("TRANSCRIBE_CHUNK_SEC", "600"))  # 1チャンクの目安の長さ
+# 同時に切り出し・アップロードするチャンク数（ジョブ自体はすべて同時に実行される）
+CHUNK_MAX_PARALLEL = int(os.getenv("TRANSCRIBE_CHUNK_MAX_PARALLEL", "8"))
+
+# 目安の長さのこの倍率より短い音声は分割せず1ジョブで書き起こす
+CHUNKING_THRESHOLD_RATIO = 1.5
+# 分割位置を探す範囲（目安の位置の前後）
+CUT_SEARCH_WINDOW_SEC = 60.0
+# 隣のチャンクと重ねる長さ（境界の単語を両方のチャンクで完全に認識させる）
+CHUNK_OVERLAP_SEC = 2.0
+CHUNK_SAMPLE_RATE = 16000
+
+
+def plan_cut_points(
+    duration: float,
+    silences: List[Dict],
+    target_sec: float = CHUNK_TARGET_SEC,
+    search_window: float = CUT_SEARCH_WINDOW_SEC,
+) -> List[float]:
+    """
+    分割位置を決める（目安の位置の近くにある最も長い無音区間の中央）.
+
+    Args:
+        duration: 音声の長さ（秒）
+        silences: [{"start": 秒, "duration": 秒}, ...]（extract_silences()の無音区間）
+        target_sec: 1チャンクの目安の長さ
+        search_window: 目安の位置の前後に無音を探す秒数
+
+    Returns:
+        list: 分割位置（秒、昇順）
+    """
+    n_chunks = max(1, math.ceil(duration / target_sec))
+    cuts: List[float] = []
+    for k in range(1, n_chunks):
+        ideal = k * duration / n_chunks
+        candidates = [
+            s for s in silences
+            if s["start"] + s["duration"] >= ideal - search_window
+            and s["start"] <= ideal + search_window
+        ]
+        if candidates:
+            best = max(
+                candidates,
+                key=lambda s: (s["duration"], -abs(s["start"] + s["duration"] / 2 - ideal)),
+            )
+            cut = best["start"] + best["duration"] / 2
+        else:
+            # 無音が見つからない場合は目安の位置で切る（重なり部分の照合で境界の単語を繋ぐ）
+            cut = ideal
+        if not cuts or cut > cuts[-1] + CHUNK_OVERLAP_SEC * 2:
+            cuts.append(cut)
+    return cuts
+
+
+def plan_chunks(duration: float, cuts: List[float], overlap: float = CHUNK_OVERLAP_SEC) -> List[Dict]:
+    """
+    分割位置から各チャンクの範囲を決める.
+
+    Args:
+        duration: 音声の長さ（秒）
+        cuts: plan_cut_points()の返り値
+        overlap: 隣のチャンクと重ねる秒数
+
+    Returns:
+        list: [{
+            "start": 切り出し開始（秒）,
+            "end": 切り出し終了（秒）,
+            "own_start": このチャンクが担当する範囲の開始,
+            "own_end": 担当範囲の終了
+        }, ...]
+    """
+    bounds = [0.0, *cuts, duration]
+    chunks = []
+    for own_start, own_end in zip(bounds[:-1], bounds[1:]):
+        chunks.append({
+            "start": max(0.0, own_start - overlap),
+            "end": min(duration, own_end + overlap),
+            "own_start": own_start,
+            "own_end": own_end if own_end < duration else float("inf"),
+        })
+    return chunks
+
+
+def _group_words(items: List[Dict], offset: float) -> List[List[Dict]]:
+    """
+    itemsを単語ごと（発音アイテムとそれに続く句読点）にまとめ、時刻を元の音声の時間軸に直す.
+
+    先頭の単語より前にある句読点は時刻を持たないため捨てる。
+    """
+    words: List[List[Dict]] = []
+    for item in items:
+        if item["type"] == "pronunciation":
+            words.append([{
+                **item,
+                "start_time": float(item["start_time"]) + offset,
+                "end_time": float(item["end_time"]) + offset,
+            }])
+        elif words:
+            words[-1].append(item)
+    return words
+
+
+def _word_key(word: List[Dict]) -> str:
+    """重なり部分の照合に使う単語の表記（大文字・小文字は区別しない）."""
+    return word[0]["alternatives"][0]["content"].lower()
+
+
+def _splice_words(
+    merged: List[List[Dict]],
+    words: List[List[Dict]],
+    overlap_start: float,
+    overlap_end: float,
+    cut: float,
+) -> List[List[Dict]]:
+    """
+    前のチャンクまでの単語列と次のチャンクの単語列を、重なり部分で1か所だけ繋ぐ.
+
+    重なり部分の単語列を表記で照合し、一致した単語のうち分割位置に最も近いものを
+    繋ぎ目にする（それより前は前のチャンク、それ以降は次のチャンクの単語を使う）。
+    チャンクごとに時刻が多少ずれていても、同じ単語が重複・欠落しない。
+    一致する単語がない場合は分割位置の時刻で切り替える。
+
+    Args:
+        merged: 前のチャンクまでの単語列
+        words: 次のチャンクの単語列
+        overlap_start: 重なり部分の開始（次のチャンクの切り出し開始、秒）
+        overlap_end: 重なり部分の終了（前のチャンクの切り出し終了、秒）
+        cut: 分割位置（秒）
+
+    Returns:
+        list: 繋いだ単語列
+    """
+    tail_start = len(merged)
+    while tail_start > 0 and merged[tail_start - 1][0]["start_time"] >= overlap_start:
+        tail_start -= 1
+    head_end = 0
+    while head_end < len(words) and words[head_end][0]["start_time"] < overlap_end:
+        head_end += 1
+
+    tail, head = merged[tail_start:], words[:head_end]
+    matcher = SequenceMatcher(
+        None, [_word_key(w) for w in tail], [_word_key(w) for w in head], autojunk=False
+    )
+    best = None
+    for block in matcher.get_matching_blocks():
+        for k in range(block.size):
+            i, j = block.a + k, block.b + k
+            distance = abs((tail[i][0]["start_time"] + head[j][0]["start_time"]) / 2 - cut)
+            if best is None or distance < best[0]:
+                best = (distance, i, j)
+
+    if best is None:
+        kept = [w for w in tail if w[0]["start_time"] < cut]
+        return merged[:tail_start] + kept + [w for w in words if w[0]["start_time"] >= cut]
+    _, i, j = best
+    return merged[:tail_start + i] + words[j:]
+
+
+def stitch_items(chunk_items: List[List[Dict]], chunks: List[Dict]) -> List[Dict]:
+    """
+    チャンクごとのTranscribe itemsを1つの時間軸に結合.
+
+    隣のチャンクとの重なり部分は単語列の照合で繋ぐため（_splice_words()）、
+    チャンク間で単語の時刻がずれていても境界の単語が重複・欠落しない。
+    句読点は直前の単語に従う。
+
+    Args:
+        chunk_items: チャンクごとの結果JSONのitems（時刻はチャンク先頭からの秒）
+        chunks: plan_chunks()の返り値
+
+    Returns:
+        list: 元の音声の時間軸に直したitems
+    """
+    merged: List[List[Dict]] = []
+    previous: Optional[Dict] = None
+    for items, chunk in zip(chunk_items, chunks):
+        words = _group_words(items, chunk["start"])
+        if previous is None:
+            merged = words
+        else:
+            merged = _splice_words(merged, words, chunk["start"], previous["end"], chunk["own_start"])
+        previous = chunk
+    return [item for word in merged for item in word]
+
+
+def _extract_chunk(audio_file_path: str, chunk: Dict, output_path: str) -> None:
+    """チャンクの範囲を16kHzモノラルFLACとして切り出す."""
+    command = [
+        get_encoder_name(), "-nostdin", "-loglevel", "error", "-y",
+        "-ss", f"{chunk['start']:.3f}",
+        "-i", audio_file_path,
+        "-t", f"{chunk['end'] - chunk['start']:.3f}",
+        "-ac", "1", "-ar", str(CHUNK_SAMPLE_RATE), "-c:a", "flac",
+        output_path,
+    ]
+    process = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if process.returncode != 0:
+        raise RuntimeError(f"音声分割エラー: {process.stderr.decode(errors='replace').strip()}")
+
+
+def _cleanup_chunks(transcribe_client, s3_client, job_names: List[str], s3_keys: List[str]) -> None:
+    """
+    失敗時に、開始済みのTranscriptionジョブとアップロード済みのチャンクを削除.
+
+    削除に失敗しても元のエラーを優先するため、例外は送出せず警告だけ出力する。
+
+    Args:
+        transcribe_client: boto3 Transcribeクライアント
+        s3_client: boto3 S3クライアント
+        job_names: 開始済みのジョブ名
+        s3_keys: アップロード済みのS3オブジェクトキー
+    """
+    for job_name in job_names:
+        try:
+            transcribe_client.delete_transcription_job(TranscriptionJobName=job_name)
+        except ClientError as e:
+            print(f"❌ Transcriptionジョブの削除に失敗: {job_name}: {e}")
+    for s3_key in s3_keys:
+        try:
+            s3_client.delete_object(Bucket=S3_BUCKET, Key=s3_key)
+        except ClientError as e:
+            print(f"❌ チャンクの削除に失敗: {s3_key}: {e}")
+    if job_names or s3_keys:
+        print(f"✓ 分割書き起こしの失敗により{len(job_names)}ジョブ・{len(s3_keys)}チャンクを削除")
+
+
+async def _transcribe_chunks_async(
+    audio_file_path: str,
+    chunks: List[Dict],
+    language_code: str,
+    work_dir: str,
+) -> List[List[Dict]]:
+    """
+    各チャンクを切り出し・アップロードしてジョブを開始し、まとめて完了を待つ.
+
+    いずれかのチャンクが失敗した場合は、まだ始めていないチャンクを処理せず、
+    開始済みのジョブとアップロード済みのチャンクを削除してから例外を送出する。
+
+    Returns:
+        list: チャンクごとの結果JSONのitems（chunksと同じ順序）
+    """
+    s3_client = get_client("s3", region_name=AWS_REGION)
+    transcribe_client = get_client("transcribe", region_name=AWS_REGION)
+    semaphore = asyncio.Semaphore(CHUNK_MAX_PARALLEL)
+    batch_id = uuid.uuid4().hex[:8]
+    aborted = asyncio.Event()
+    s3_keys: List[str] = []
+    started_jobs: Dict[int, str] = {}
+
+    async def start(index: int, chunk: Dict) -> None:
+        async with semaphore:
+            if aborted.is_set():
+                return
+            try:
+                chunk_path = str(Path(work_dir) / f"chunk-{index:03d}.flac")
+                await asyncio.to_thread(_extract_chunk, audio_file_path, chunk, chunk_path)
+                s3_key = content_addressed_key(compute_audio_hash(chunk_path), chunk_path)
+                s3_uri = await asyncio.to_thread(
+                    upload_to_s3, chunk_path, s3_client, S3_BUCKET, s3_key,
+                    total_bytes=os.path.getsize(chunk_path),
+                    skip_if_exists=True,
+                )
+                s3_keys.append(s3_key)
+                job_name = f"presentation-feedback-{batch_id}-{index:03d}"
+                media_info = {"media_format": "flac", "sample_rate": CHUNK_SAMPLE_RATE}
+                await asyncio.to_thread(
+                    start_transcription_job, transcribe_client, job_name, s3_uri, language_code, media_info
+                )
+                started_jobs[index] = job_name
+            except Exception:
+                aborted.set()
+                raise
+
+    results = await asyncio.gather(
+        *[start(i, chunk) for i, chunk in enumerate(chunks)], return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        await asyncio.to_thread(
+            _cleanup_chunks, transcribe_client, s3_client, list(started_jobs.values()), s3_keys
+        )
+        raise errors[0]
+
+    job_names = [started_jobs[index] for index in range(len(chunks))]
+    print(f"⏳ {len(job_names)}チャンクを並列に書き起こし中...", flush=True)
+    try:
+        jobs = await wait_for_transcription_jobs_async(
+            transcribe_client,
+            job_names,
+            [chunk["end"] - chunk["start"] for chunk in chunks],
+        )
+    except Exception:
+        await asyncio.to_thread(_cleanup_chunks, transcribe_client, s3_client, job_names, s3_keys)
+        raise
+    return await asyncio.gather(*[asyncio.to_thread(fetch_transcript_items, job) for job in jobs])
+
+
+@register_transcriber("chunked", cache_options={"chunk_sec": CHUNK_TARGET_SEC})
+def transcribe_audio_chunked(
+    audio_file_path: str,
+    language_code: str = "ja-JP",
+    target_sec: Optional[float] = None,
+) -> Dict:
+    """
+    長時間の音声を無音位置で分割し、並列のTranscribeジョブで書き起こして結合.
+
+    短い音声（目安の長さの1.5倍未満）は分割せず通常のバッチジョブで書き起こす。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        language_code: 言語コード（ja-JP, en-US等）
+        target_sec: 1チャンクの目安の長さ（省略時はTRANSCRIBE_CHUNK_SEC）
+
+    Returns:
+        dict: 書き起こし結果（transcribe_audio()と同じ形式）
+    """
+    target_sec = target_sec or CHUNK_TARGET_SEC
+    # 長さはヘッダから求め、分割しない音声はデコードせずに1ジョブで書き起こす
+    duration = probe_media(audio_file_path)["duration"]
+    if duration is not None and duration < target_sec * CHUNKING_THRESHOLD_RATIO:
+        return transcribe_batch(audio_file_path, language_code)
+
+    acoustic = extract_silences(audio_file_path)
+    duration = acoustic["duration"]
+    if duration < target_sec * CHUNKING_THRESHOLD_RATIO:
+        # ヘッダから長さを求められない形式（一部のMP4等）
+        return transcribe_batch(audio_file_path, language_code)
+
+    cuts = plan_cut_points(duration, acoustic["silences"]["segments"], target_sec)
+    chunks = plan_chunks(duration, cuts)
+    print(f"✓ 音声を{len(chunks)}チャンクに分割: " + ", ".join(f"{cut:.1f}秒" for cut in cuts))
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        chunk_items = asyncio.run(
+            _transcribe_chunks_async(audio_file_path, chunks, language_code, work_dir)
+        )
+
+    separator = word_separator(language_code)
+    segments = list(iter_transcript_segments(stitch_items(chunk_items, chunks), separator))
+    return {
+        "text": separator.join(seg["text"] for seg in segments),
+        "segments": segments,
+        "duration": float(segments[-1]["end_time"]) if segments else 0.0,
+    }
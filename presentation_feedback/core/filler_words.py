@@ -0,0 +1,208 @@
+"""フィラーワード検出（Aho-Corasick法による複数パターンの一括照合）."""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 検出対象のフィラーワード（日本語・英語）
+# 英語の "like", "so" は文中の通常の用法（"looks like", "so that"）と書き起こしだけでは
+# 区別できず、誤検出が多いため含めない
+DEFAULT_FILLER_LEXICON = [
+    "えー", "あー", "あのー", "その", "ええと", "まあ",
+    "uh", "um", "you know",
+]
+
+# 通常の語としても使われるため、長音が続く場合（「そのー」）か、単独で使われた場合
+# （前後が句読点・空白・テキストの端）のみフィラーとする語（「その後」「まあまあ」は数えない）
+DEFAULT_STANDALONE_FILLERS = ["その", "まあ"]
+
+# 連続した場合に1文字として扱う長音記号（「えーーー」→「えー」）
+_LONG_VOWEL_MARKS = "ー〜"
+
+
+def _is_word_char(char: str) -> bool:
+    """英単語の一部となる文字か（英語パターンの単語境界判定用）."""
+    return char.isascii() and char.isalnum()
+
+
+def _is_text_char(char: str) -> bool:
+    """句読点・空白以外の文字か（単独使用の判定用、長音記号も含む）."""
+    return char.isalnum()
+
+
+class FillerWordMatcher:
+    """
+    フィラーワード辞書から構築したAho-Corasickオートマトン.
+
+    全パターンを1回の走査で照合するため、辞書の大きさに関わらず
+    テキスト長に比例した時間で検出できる。
+    """
+
+    def __init__(
+        self,
+        lexicon: Iterable[str] = DEFAULT_FILLER_LEXICON,
+        standalone_words: Iterable[str] = DEFAULT_STANDALONE_FILLERS,
+    ):
+        """
+        初期化（オートマトンを構築）.
+
+        Args:
+            lexicon: フィラーワードのリスト（大文字小文字は区別しない）
+            standalone_words: lexiconのうち、長音が続くか前後が句読点・空白・テキストの端の場合のみ
+                一致とする語
+        """
+        self.standalone_words = set(standalone_words)
+        self.words: List[str] = []
+        self._lengths: List[int] = []  # 正規化後のパターン長
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for word in lexicon:
+            self._add_word(word)
+        self._build_failure_links()
+
+    def _add_word(self, word: str) -> None:
+        pattern = self._normalize(word)
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(len(self.words))
+        self.words.append(word)
+        self._lengths.append(len(pattern))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # 失敗先で一致するパターンも出力に含める
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """小文字化し、連続する長音記号を1つにまとめる."""
+        chars = []
+        for char in text.lower():
+            if char in _LONG_VOWEL_MARKS:
+                char = "ー"
+                if chars and chars[-1] == "ー":
+                    continue
+            chars.append(char)
+        return "".join(chars)
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        テキスト中のフィラーワードを検出（重なる場合は左端・最長を優先）.
+
+        Args:
+            text: 対象テキスト
+
+        Returns:
+            list: [(開始位置, 終了位置, フィラーワード), ...]（位置は元テキスト上の文字位置）
+        """
+        # 正規化後の各文字が元テキストのどこに対応するか
+        positions: List[int] = []
+        matches = []
+        state = 0
+        prev = ""
+
+        for index, char in enumerate(text.lower()):
+            if char in _LONG_VOWEL_MARKS:
+                char = "ー"
+                if prev == "ー":
+                    continue
+            prev = char
+            positions.append(index)
+
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for word_index in self._output[state]:
+                start = positions[len(positions) - self._lengths[word_index]]
+                matches.append((start, index + 1, word_index))
+
+        # 左端・最長一致で重なりを解消
+        matches.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        result = []
+        last_end = 0
+        for start, end, word_index in matches:
+            if start < last_end:
+                continue
+            word = self.words[word_index]
+            # 英語のパターンは単語境界でのみ一致とする（"so" が "also" に一致しないように）
+            if word.isascii():
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]):
+                    continue
+            elif word in self.standalone_words:
+                lengthened = end < len(text) and text[end] in _LONG_VOWEL_MARKS
+                if not lengthened and (
+                    (start > 0 and _is_text_char(text[start - 1]))
+                    or (end < len(text) and _is_text_char(text[end]))
+                ):
+                    continue
+            result.append((start, end, word))
+            last_end = end
+        return result
+
+
+_default_matcher: Optional[FillerWordMatcher] = None
+
+
+def detect_filler_words(
+    segments: List[Dict],
+    matcher: Optional[FillerWordMatcher] = None,
+) -> Dict[str, Dict]:
+    """
+    全セグメントを1回走査してフィラーワードを集計.
+
+    タイムスタンプはセグメント内の文字位置から線形補間して求める。
+
+    Args:
+        segments: 書き起こしセグメントのリスト
+        matcher: 使用するマッチャー（省略時はデフォルト辞書）
+
+    Returns:
+        dict: {
+            "えー": {"count": 出現回数, "timestamps": [秒, ...]},
+            ...
+        }
+    """
+    global _default_matcher
+    if matcher is None:
+        if _default_matcher is None:
+            _default_matcher = FillerWordMatcher()
+        matcher = _default_matcher
+
+    results: Dict[str, Dict] = {}
+    for seg in segments:
+        text = seg["text"]
+        if not text:
+            continue
+        seg_duration = seg["end_time"] - seg["start_time"]
+        for start, _, word in matcher.find_all(text):
+            entry = results.setdefault(word, {"count": 0, "timestamps": []})
+            entry["count"] += 1
+            entry["timestamps"].append(
+                round(seg["start_time"] + seg_duration * start / len(text), 2)
+            )
+    return results
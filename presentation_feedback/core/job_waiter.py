@@ -0,0 +1,187 @@
+"""Transcriptionジョブの完了待機（適応的ポーリング・同期/非同期）."""
+
+import asyncio
+import os
+import random
+import time
+from typing import Dict, Iterator, List, Optional
+
+
+# ポーリング設定
+BACKOFF_FACTOR = 1.5
+MIN_INTERVAL_SEC = 1.0
+MAX_INTERVAL_SEC = 30.0
+MIN_TIMEOUT_SEC = float(os.getenv("TRANSCRIBE_MIN_TIMEOUT_SEC", "600"))
+
+
+def _clamp(value: float, lower: float, upper: float) -> float:
+    return max(lower, min(upper, value))
+
+
+def compute_poll_schedule(audio_duration: Optional[float] = None) -> Dict[str, float]:
+    """
+    音声の長さからポーリング設定を決定.
+
+    Transcribeの処理時間はおおよそ「固定オーバーヘッド + 音声長に比例」なので、
+    短い音声は細かく、長い音声は間隔を広げてポーリングする。
+
+    Args:
+        audio_duration: 音声の長さ（秒）。不明な場合はNone
+
+    Returns:
+        dict: {
+            "initial_delay": 初回ポーリングまでの待機秒,
+            "base_interval": 2回目以降の初期間隔,
+            "max_interval": 間隔の上限,
+            "timeout": 全体のタイムアウト秒
+        }
+    """
+    duration = audio_duration if audio_duration and audio_duration > 0 else 300.0
+    expected = 10.0 + 0.25 * duration  # 想定処理時間
+    return {
+        "initial_delay": _clamp(expected * 0.5, MIN_INTERVAL_SEC, MAX_INTERVAL_SEC),
+        "base_interval": _clamp(duration / 60, MIN_INTERVAL_SEC, 10.0),
+        "max_interval": _clamp(duration * 0.05, 5.0, MAX_INTERVAL_SEC),
+        "timeout": max(MIN_TIMEOUT_SEC, duration * 4),
+    }
+
+
+def iter_poll_delays(schedule: Dict[str, float]) -> Iterator[float]:
+    """
+    ポーリング間の待機秒を順に返す（指数バックオフ + ジッター）.
+
+    Args:
+        schedule: compute_poll_schedule()の返り値
+
+    Yields:
+        float: 次のポーリングまでの待機秒
+    """
+    yield schedule["initial_delay"]
+    interval = schedule["base_interval"]
+    while True:
+        # Equal jitter: 間隔の半分は固定、残り半分をランダムにする
+        yield interval / 2 + random.uniform(0, interval / 2)
+        interval = min(interval * BACKOFF_FACTOR, schedule["max_interval"])
+
+
+def _check_status(response: Dict) -> Optional[Dict]:
+    """
+    ジョブの状態を確認し、完了していればジョブ情報を返す（処理中はNone）.
+
+    Raises:
+        RuntimeError: ジョブが失敗した場合
+    """
+    job = response["TranscriptionJob"]
+    status = job["TranscriptionJobStatus"]
+    if status == "COMPLETED":
+        return job
+    if status == "FAILED":
+        failure_reason = job.get("FailureReason", "不明なエラー")
+        raise RuntimeError(f"Transcription失敗: {failure_reason}")
+    return None
+
+
+def wait_for_transcription_job(
+    transcribe_client,
+    job_name: str,
+    audio_duration: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> Dict:
+    """
+    Transcriptionジョブの完了を待機.
+
+    Args:
+        transcribe_client: boto3 Transcribeクライアント
+        job_name: ジョブ名
+        audio_duration: 音声の長さ（秒、ポーリング間隔の決定に使用）
+        timeout: タイムアウト秒（省略時は音声の長さから決定）
+
+    Returns:
+        dict: ジョブステータス情報
+
+    Raises:
+        RuntimeError: ジョブ失敗時
+        TimeoutError: タイムアウト時
+    """
+    schedule = compute_poll_schedule(audio_duration)
+    deadline = time.monotonic() + (timeout or schedule["timeout"])
+
+    for delay in iter_poll_delays(schedule):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Transcriptionジョブがタイムアウトしました: {job_name}")
+        time.sleep(min(delay, remaining))
+
+        response = transcribe_client.get_transcription_job(TranscriptionJobName=job_name)
+        job = _check_status(response)
+        if job is not None:
+            return job
+        print(".", end="", flush=True)
+
+
+async def wait_for_transcription_job_async(
+    transcribe_client,
+    job_name: str,
+    audio_duration: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> Dict:
+    """
+    Transcriptionジョブの完了を非同期に待機.
+
+    待機中はイベントループを解放するため、1プロセスで多数のジョブを同時に待てる。
+    boto3の呼び出し自体はブロッキングなので、その間だけスレッドで実行する。
+
+    Args:
+        transcribe_client: boto3 Transcribeクライアント
+        job_name: ジョブ名
+        audio_duration: 音声の長さ（秒、ポーリング間隔の決定に使用）
+        timeout: タイムアウト秒（省略時は音声の長さから決定）
+
+    Returns:
+        dict: ジョブステータス情報
+
+    Raises:
+        RuntimeError: ジョブ失敗時
+        TimeoutError: タイムアウト時
+    """
+    loop = asyncio.get_running_loop()
+    schedule = compute_poll_schedule(audio_duration)
+    deadline = loop.time() + (timeout or schedule["timeout"])
+
+    for delay in iter_poll_delays(schedule):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(f"Transcriptionジョブがタイムアウトしました: {job_name}")
+        await asyncio.sleep(min(delay, remaining))
+
+        response = await asyncio.to_thread(
+            transcribe_client.get_transcription_job, TranscriptionJobName=job_name
+        )
+        job = _check_status(response)
+        if job is not None:
+            return job
+
+
+async def wait_for_transcription_jobs_async(
+    transcribe_client,
+    job_names: List[str],
+    audio_durations: Optional[List[Optional[float]]] = None,
+    timeout: Optional[float] = None,
+) -> List[Dict]:
+    """
+    複数のTranscriptionジョブの完了を同時に待機.
+
+    Args:
+        transcribe_client: boto3 Transcribeクライアント
+        job_names: ジョブ名のリスト
+        audio_durations: 各ジョブの音声の長さ（秒）
+        timeout: 各ジョブのタイムアウト秒
+
+    Returns:
+        list: ジョブステータス情報（job_namesと同じ順序）
+    """
+    durations = audio_durations or [None] * len(job_names)
+    return await asyncio.gather(*[
+        wait_for_transcription_job_async(transcribe_client, name, duration, timeout)
+        for name, duration in zip(job_names, durations)
+    ])
@@ -0,0 +1,103 @@
+"""ローカルASRによる書き起こし（faster-whisper / CTranslate2、AWS不要）."""
+
+import os
+import threading
+from typing import Dict, Tuple
+
+from .transcriber_registry import register_transcriber
+from .transcript_segments import SegmentBuilder, word_separator
+
+
+# 環境変数またはデフォルト設定
+LOCAL_ASR_MODEL = os.getenv("LOCAL_ASR_MODEL", "small")
+LOCAL_ASR_COMPUTE_TYPE = os.getenv("LOCAL_ASR_COMPUTE_TYPE", "int8")  # CPU向け量子化
+LOCAL_ASR_CPU_THREADS = int(os.getenv("LOCAL_ASR_CPU_THREADS", "0"))  # 0: 自動
+
+# 単語末尾から切り出してセグメント区切りとして扱う句読点
+PUNCTUATION_MARKS = "。、．，！？.,!?"
+
+_models: Dict[Tuple[str, str], object] = {}
+_lock = threading.Lock()
+
+
+def _get_model(model_size: str, compute_type: str):
+    """WhisperModelを取得（読み込みは重いため1度だけ行い再利用）."""
+    key = (model_size, compute_type)
+    with _lock:
+        model = _models.get(key)
+        if model is None:
+            try:
+                from faster_whisper import WhisperModel
+            except ImportError as e:
+                raise RuntimeError(
+                    "ローカル書き起こしには faster-whisper が必要です: uv sync --extra local"
+                ) from e
+            model = WhisperModel(
+                model_size,
+                device="cpu",
+                compute_type=compute_type,
+                cpu_threads=LOCAL_ASR_CPU_THREADS,
+            )
+            _models[key] = model
+        return model
+
+
+def _split_punctuation(word: str) -> Tuple[str, str]:
+    """単語末尾の句読点を分離（例: "です。" → ("です", "。")）."""
+    stripped = word.rstrip()
+    body = stripped.rstrip(PUNCTUATION_MARKS)
+    return body, stripped[len(body):]
+
+
+@register_transcriber(
+    "local", cache_options={"model": LOCAL_ASR_MODEL, "compute_type": LOCAL_ASR_COMPUTE_TYPE}
+)
+def transcribe_audio_local(audio_file_path: str, language_code: str = "ja-JP") -> Dict:
+    """
+    ローカルのWhisperモデルで音声を書き起こし.
+
+    単語単位のタイムスタンプ・確率を取得し、AWS Transcribeと同じ
+    句読点区切りのセグメント形式に変換する。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        language_code: 言語コード（ja-JP, en-US等）
+
+    Returns:
+        dict: 書き起こし結果（transcribe_audio()と同じ形式）
+    """
+    model = _get_model(LOCAL_ASR_MODEL, LOCAL_ASR_COMPUTE_TYPE)
+    language = language_code.split("-")[0]
+
+    print(f"⏳ ローカル書き起こし中（{LOCAL_ASR_MODEL}, {LOCAL_ASR_COMPUTE_TYPE}）...")
+    whisper_segments, _ = model.transcribe(
+        audio_file_path,
+        language=language,
+        word_timestamps=True,
+        vad_filter=True,
+    )
+
+    separator = word_separator(language_code)
+    builder = SegmentBuilder(separator)
+    segments = []
+    # whisper_segmentsはジェネレータなので、デコードしながら順に組み立てる
+    for whisper_segment in whisper_segments:
+        for word in whisper_segment.words or []:
+            body, punctuation = _split_punctuation(word.word)
+            # 英語等の単語は先頭に空白が付くため除き、区切りはSegmentBuilderに任せる
+            if body.strip():
+                builder.add_word(body.strip(), float(word.start), float(word.end), float(word.probability))
+            if punctuation:
+                segment = builder.add_punctuation(punctuation)
+                if segment is not None:
+                    segments.append(segment)
+
+    segment = builder.flush()
+    if segment is not None:
+        segments.append(segment)
+
+    return {
+        "text": separator.join(seg["text"] for seg in segments),
+        "segments": segments,
+        "duration": float(segments[-1]["end_time"]) if segments else 0.0,
+    }
@@ -0,0 +1,414 @@
+"""音声ファイルのヘッダ解析（コンテナ・コーデック・サンプリングレート・長さ）.
+
+ファイル全体はデコードせず、先頭（と必要に応じて末尾）の数KBとボックス/チャンクの
+ヘッダだけを読んで判定する。AWS Transcribeに送る前に、失敗することが分かっている
+ファイルをネットワークI/Oなしで弾くために使う。
+"""
+
+import os
+import struct
+from typing import BinaryIO, Dict, Optional
+
+
+HEADER_BYTES = 64 * 1024  # 先頭から読む量
+TAIL_BYTES = 64 * 1024  # Oggの長さ取得で末尾から読む量
+
+# AWS Transcribe（バッチ）の制約
+MIN_SAMPLE_RATE = 8000
+MAX_SAMPLE_RATE = 48000
+MAX_DURATION_SEC = 4 * 60 * 60
+MAX_FILE_BYTES = 2 * 1024 ** 3
+
+# MP3フレームヘッダの表（MPEG1 / MPEG2 / MPEG2.5）
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG1
+    2: (22050, 24000, 16000),  # MPEG2
+    0: (11025, 12000, 8000),  # MPEG2.5
+}
+_MP3_BITRATES_V1_L3 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2_L3 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# MP4でたどるコンテナボックス
+_MP4_CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+_MP4_CODECS = {b"mp4a": "aac", b"alac": "alac", b"Opus": "opus", b"fLaC": "flac", b"ac-3": "ac3"}
+
+_OPUS_GRANULE_RATE = 48000
+
+
+def _file_size(fileobj: BinaryIO) -> int:
+    size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    return size
+
+
+def _probe_wav(fileobj: BinaryIO, header: bytes, size: int) -> Dict:
+    """RIFF/WAVEのfmt・dataチャンクを解析."""
+    offset = 12
+    fmt = None
+    data_size = None
+    data_offset = None
+    # fmtが先頭64KBより後ろにあることはまれなので、チャンクヘッダをシークでたどる
+    while offset + 8 <= size and (fmt is None or data_size is None):
+        fileobj.seek(offset)
+        chunk_header = fileobj.read(8)
+        if len(chunk_header) < 8:
+            break
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack("<HHIIHH", fileobj.read(16))
+        elif chunk_id == b"data":
+            data_offset = offset + 8
+            data_size = chunk_size
+        offset += 8 + chunk_size + (chunk_size & 1)
+
+    if fmt is None:
+        raise ValueError("WAVファイルにfmtチャンクがありません")
+    audio_format, channels, sample_rate, byte_rate, _, bits = fmt
+    # 1: PCM, 3: IEEE float, 0xFFFE: WAVE_FORMAT_EXTENSIBLE
+    if audio_format not in (1, 3, 0xFFFE):
+        raise ValueError(f"対応していないWAVの符号化方式です（format tag: 0x{audio_format:04x}）")
+
+    duration = None
+    if data_offset is not None and byte_rate:
+        # ストリーミング録音ではdataサイズが未確定（0や0xFFFFFFFF）のことがある
+        if not data_size or data_offset + data_size > size:
+            data_size = size - data_offset
+        duration = data_size / byte_rate
+
+    return {
+        "container": "wav",
+        "codec": "pcm_f32le" if audio_format == 3 else f"pcm_s{bits}le",
+        "media_format": "wav",
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "duration": duration,
+    }
+
+
+def _probe_flac(header: bytes) -> Dict:
+    """FLACのSTREAMINFOブロックを解析."""
+    if len(header) < 8 + 34 or header[4] & 0x7F != 0:
+        raise ValueError("FLACファイルにSTREAMINFOがありません")
+    info = header[8:8 + 34]
+    # 20bit: サンプリングレート / 3bit: チャンネル数-1 / 5bit: ビット深度-1 / 36bit: 総サンプル数
+    packed = int.from_bytes(info[10:18], "big")
+    sample_rate = packed >> 44
+    channels = ((packed >> 41) & 0x7) + 1
+    total_samples = packed & 0xFFFFFFFFF
+    return {
+        "container": "flac",
+        "codec": "flac",
+        "media_format": "flac",
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "duration": total_samples / sample_rate if total_samples and sample_rate else None,
+    }
+
+
+def _last_ogg_granule(fileobj: BinaryIO, size: int) -> Optional[int]:
+    """末尾のOggページからgranule position（最終サンプル位置）を取得."""
+    fileobj.seek(max(0, size - TAIL_BYTES))
+    tail = fileobj.read(TAIL_BYTES)
+    index = tail.rfind(b"OggS")
+    if index < 0 or index + 14 > len(tail):
+        return None
+    granule = struct.unpack("<q", tail[index + 6:index + 14])[0]
+    return granule if granule >= 0 else None
+
+
+def _probe_ogg(fileobj: BinaryIO, header: bytes, size: int) -> Dict:
+    """Oggの先頭パケット（OpusHead / Vorbis識別ヘッダ）を解析."""
+    if len(header) < 27:
+        raise ValueError("Oggページヘッダが不完全です")
+    segment_count = header[26]
+    packet = header[27 + segment_count:]
+
+    if packet.startswith(b"OpusHead"):
+        channels = packet[9]
+        pre_skip, input_sample_rate = struct.unpack("<HI", packet[10:16])
+        # OpusHeadには元の音声のレートが入る（0は不明、デコードは常に48kHz）
+        sample_rate = input_sample_rate or _OPUS_GRANULE_RATE
+        codec = "opus"
+        granule = _last_ogg_granule(fileobj, size)
+        # granule positionは元のレートに関わらず48kHz単位
+        duration = (granule - pre_skip) / _OPUS_GRANULE_RATE if granule else None
+    elif packet.startswith(b"\x01vorbis"):
+        channels = packet[11]
+        sample_rate = struct.unpack("<I", packet[12:16])[0]
+        codec = "vorbis"
+        granule = _last_ogg_granule(fileobj, size)
+        duration = granule / sample_rate if granule and sample_rate else None
+    else:
+        raise ValueError("対応していないOggのコーデックです（Opus・Vorbisのみ対応）")
+
+    return {
+        "container": "ogg",
+        "codec": codec,
+        "media_format": "ogg",
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "duration": duration,
+    }
+
+
+def _parse_mp3_frame_header(frame: bytes) -> Optional[Dict]:
+    """MPEGオーディオのフレームヘッダ（4バイト）を解析（Layer IIIのみ）."""
+    if len(frame) < 4 or frame[0] != 0xFF or frame[1] & 0xE0 != 0xE0:
+        return None
+    version = (frame[1] >> 3) & 0x3
+    layer = (frame[1] >> 1) & 0x3
+    bitrate_index = frame[2] >> 4
+    sample_rate_index = (frame[2] >> 2) & 0x3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    bitrates = _MP3_BITRATES_V1_L3 if version == 3 else _MP3_BITRATES_V2_L3
+    bitrate = bitrates[bitrate_index] * 1000
+    samples_per_frame = 1152 if version == 3 else 576
+    padding = (frame[2] >> 1) & 0x1
+    return {
+        "version": version,
+        "sample_rate": sample_rate,
+        "bitrate": bitrate,
+        "channels": 1 if frame[3] >> 6 == 3 else 2,
+        "samples_per_frame": samples_per_frame,
+        "frame_length": samples_per_frame // 8 * bitrate // sample_rate + padding,
+    }
+
+
+def _probe_mp3(fileobj: BinaryIO, header: bytes, size: int) -> Dict:
+    """MP3のフレームヘッダとXing/Info/VBRIヘッダを解析."""
+    audio_start = 0
+    if header.startswith(b"ID3"):
+        # ID3v2タグ（カバー画像等で大きいことがある）は読まずに読み飛ばす
+        tag_size = 0
+        for byte in header[6:10]:
+            tag_size = (tag_size << 7) | (byte & 0x7F)
+        audio_start = 10 + tag_size + (10 if header[5] & 0x10 else 0)
+        fileobj.seek(audio_start)
+        header = fileobj.read(HEADER_BYTES)
+
+    # 誤検出を避けるため、次のフレームも同期ワードで始まる位置を採用
+    frame = None
+    for index in range(len(header) - 4):
+        if header[index] != 0xFF:
+            continue
+        frame = _parse_mp3_frame_header(header[index:index + 4])
+        if frame is None:
+            continue
+        next_index = index + frame["frame_length"]
+        if next_index + 4 <= len(header) and _parse_mp3_frame_header(header[next_index:next_index + 4]) is None:
+            frame = None
+            continue
+        audio_start += index
+        header = header[index:]
+        break
+    if frame is None:
+        raise ValueError("MP3のフレームヘッダが見つかりません")
+
+    # VBRの場合はXing/Info（またはVBRI）ヘッダに総フレーム数がある
+    frame_count = None
+    if frame["version"] == 3:
+        side_info = 17 if frame["channels"] == 1 else 32
+    else:
+        side_info = 9 if frame["channels"] == 1 else 17
+    xing = 4 + side_info
+    if header[xing:xing + 4] in (b"Xing", b"Info") and header[xing + 7] & 0x1:
+        frame_count = struct.unpack(">I", header[xing + 8:xing + 12])[0]
+    elif header[36:40] == b"VBRI":
+        frame_count = struct.unpack(">I", header[50:54])[0]
+
+    if frame_count:
+        duration = frame_count * frame["samples_per_frame"] / frame["sample_rate"]
+    else:
+        duration = (size - audio_start) * 8 / frame["bitrate"]
+
+    return {
+        "container": "mp3",
+        "codec": "mp3",
+        "media_format": "mp3",
+        "sample_rate": frame["sample_rate"],
+        "channels": frame["channels"],
+        "duration": duration,
+    }
+
+
+def _iter_mp4_boxes(fileobj: BinaryIO, start: int, end: int):
+    """[start, end) の範囲のMP4ボックスを (種類, 本体の開始位置, 終了位置) で列挙."""
+    offset = start
+    while offset + 8 <= end:
+        fileobj.seek(offset)
+        box_header = fileobj.read(16)
+        if len(box_header) < 8:
+            return
+        box_size, box_type = struct.unpack(">I4s", box_header[:8])
+        body = offset + 8
+        if box_size == 1 and len(box_header) == 16:
+            box_size = struct.unpack(">Q", box_header[8:16])[0]
+            body = offset + 16
+        elif box_size == 0:
+            box_size = end - offset
+        if box_size < 8:
+            return
+        yield box_type, body, min(offset + box_size, end)
+        offset += box_size
+
+
+def _probe_mp4(fileobj: BinaryIO, header: bytes, size: int) -> Dict:
+    """MP4/M4Aの音声トラック（mdhd・stsd）を解析（ボックスのヘッダだけを読む）."""
+    major_brand = header[8:12]
+    result = {
+        "container": "mp4",
+        "codec": None,
+        "media_format": "m4a" if major_brand in (b"M4A ", b"M4B ") else "mp4",
+        "sample_rate": None,
+        "channels": None,
+        "duration": None,
+    }
+
+    def walk(start: int, end: int, track: Dict) -> None:
+        for box_type, body, box_end in _iter_mp4_boxes(fileobj, start, end):
+            if box_type == b"trak":
+                track = {}
+                walk(body, box_end, track)
+                # 最初の音声トラックを採用
+                if track.get("handler") == b"soun" and result["codec"] is None:
+                    result.update({
+                        "codec": track.get("codec"),
+                        "sample_rate": track.get("sample_rate"),
+                        "channels": track.get("channels"),
+                        "duration": track.get("duration"),
+                    })
+            elif box_type in _MP4_CONTAINER_BOXES:
+                walk(body, box_end, track)
+            elif box_type == b"mdhd":
+                fileobj.seek(body)
+                data = fileobj.read(32)
+                if data[0] == 1:
+                    timescale, duration = struct.unpack(">IQ", data[20:32])
+                else:
+                    timescale, duration = struct.unpack(">II", data[12:20])
+                if timescale:
+                    track["duration"] = duration / timescale
+            elif box_type == b"hdlr":
+                fileobj.seek(body + 8)
+                track["handler"] = fileobj.read(4)
+            elif box_type == b"stsd":
+                # fullbox(4) + entry_count(4) + sample entry
+                fileobj.seek(body + 8)
+                entry = fileobj.read(52)
+                if len(entry) < 36:
+                    continue
+                codec = entry[4:8]
+                track["codec"] = _MP4_CODECS.get(codec, codec.decode("latin-1").strip())
+                version = struct.unpack(">H", entry[16:18])[0]
+                if version == 2:
+                    # QuickTimeのv2: 固定部分のチャンネル数・レートは無効値で、
+                    # 後ろの64bit浮動小数点のレートと32bitのチャンネル数を使う
+                    if len(entry) < 52:
+                        continue
+                    sample_rate, channels = struct.unpack(">dI", entry[40:52])
+                    track["sample_rate"] = int(sample_rate)
+                    track["channels"] = channels
+                else:
+                    # v0（ISO・QuickTime）とv1（QuickTime、拡張フィールドは後ろに続く）
+                    track["channels"] = struct.unpack(">H", entry[24:26])[0]
+                    # 16.16固定小数点
+                    track["sample_rate"] = struct.unpack(">I", entry[32:36])[0] >> 16
+
+    walk(0, size, {})
+    if result["codec"] is None:
+        raise ValueError("MP4ファイルに音声トラックがありません")
+    return result
+
+
+def probe_fileobj(fileobj: BinaryIO) -> Dict:
+    """
+    ファイルオブジェクトのヘッダを解析（呼び出し後は先頭にシークし直す）.
+
+    Args:
+        fileobj: シーク可能なバイナリファイルオブジェクト
+
+    Returns:
+        dict: probe_media()と同じ形式
+
+    Raises:
+        ValueError: 対応していない形式、またはヘッダが壊れている場合
+    """
+    try:
+        size = _file_size(fileobj)
+        header = fileobj.read(HEADER_BYTES)
+        if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+            info = _probe_wav(fileobj, header, size)
+        elif header[:4] == b"fLaC":
+            info = _probe_flac(header)
+        elif header[:4] == b"OggS":
+            info = _probe_ogg(fileobj, header, size)
+        elif header[4:8] == b"ftyp":
+            info = _probe_mp4(fileobj, header, size)
+        elif header[:3] == b"ID3" or (len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+            info = _probe_mp3(fileobj, header, size)
+        else:
+            raise ValueError("対応していない音声形式です（WAV・MP3・FLAC・OGG・M4Aに対応）")
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"音声ファイルのヘッダが壊れています: {e}") from e
+    finally:
+        fileobj.seek(0)
+
+    info["size_bytes"] = size
+    return info
+
+
+def probe_media(audio_file_path: str) -> Dict:
+    """
+    音声ファイルのヘッダを解析.
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+
+    Returns:
+        dict: {
+            "container": "wav" | "mp3" | "flac" | "ogg" | "mp4",
+            "codec": コーデック名（"pcm_s16le", "mp3", "aac", "opus"等）,
+            "media_format": AWS TranscribeのMediaFormat,
+            "sample_rate": サンプリングレート（Hz）,
+            "channels": チャンネル数,
+            "duration": 長さ（秒、ヘッダから求められない場合はNone）,
+            "size_bytes": ファイルサイズ
+        }
+
+    Raises:
+        ValueError: 対応していない形式、またはヘッダが壊れている場合
+    """
+    with open(audio_file_path, "rb") as f:
+        return probe_fileobj(f)
+
+
+def validate_for_transcribe(info: Dict) -> None:
+    """
+    AWS Transcribe（バッチ）で処理できるか確認.
+
+    Args:
+        info: probe_media()の返り値
+
+    Raises:
+        ValueError: Transcribeで失敗することが分かっている場合
+    """
+    sample_rate = info["sample_rate"]
+    if not sample_rate or not MIN_SAMPLE_RATE <= sample_rate <= MAX_SAMPLE_RATE:
+        raise ValueError(
+            f"サンプリングレート {sample_rate}Hz は対応範囲外です"
+            f"（{MIN_SAMPLE_RATE}〜{MAX_SAMPLE_RATE}Hz）"
+        )
+    if not info["channels"]:
+        raise ValueError("音声のチャンネル数が不明です")
+    if info["duration"] is not None:
+        if info["duration"] <= 0:
+            raise ValueError("音声の長さが0秒です")
+        if info["duration"] > MAX_DURATION_SEC:
+            raise ValueError(
+                f"音声が長すぎます（{info['duration'] / 3600:.1f}時間、上限{MAX_DURATION_SEC // 3600}時間）"
+            )
+    if info["size_bytes"] > MAX_FILE_BYTES:
+        raise ValueError(f"ファイルが大きすぎます（上限{MAX_FILE_BYTES // 1024 ** 3}GB）")
@@ -0,0 +1,180 @@
+"""話し方のルールベース採点（音声特徴量からスコア・強み・改善点を決める）."""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from .audio_features import LONG_PAUSE_THRESHOLD_SEC
+from .transcript_condenser import format_timestamp
+
+
+# 言語ごとの閾値（言語コードの先頭部分で引く）
+# 話速はextract_audio_features()と同じく空白を含まない文字数/分
+SPEECH_THRESHOLDS: Dict[str, Dict] = {
+    "ja": {
+        "rate_min": 300,           # 適切な話速の範囲（文字/分）
+        "rate_max": 350,
+        "rate_tolerance": 100,     # 範囲からこれだけ外れるとスコア0
+        "filler_per_min_good": 1.0,  # 1分あたりのフィラー数（これ以下は満点）
+        "filler_per_min_bad": 6.0,   # これ以上はスコア0
+        "pause_per_min_min": 3.0,  # 適切なポーズ数の範囲（回/分）
+        "pause_per_min_max": 12.0,
+    },
+    "en": {
+        # 130-170語/分 × 平均4.7文字
+        "rate_min": 600,
+        "rate_max": 800,
+        "rate_tolerance": 250,
+        "filler_per_min_good": 1.0,
+        "filler_per_min_bad": 6.0,
+        "pause_per_min_min": 3.0,
+        "pause_per_min_max": 12.0,
+    },
+}
+DEFAULT_SCORING_LANGUAGE = "ja"
+
+# 閾値の上書き（{"ja": {"rate_min": 280, ...}, ...} 形式のJSONファイル）
+THRESHOLDS_FILE = os.getenv("SPEECH_SCORING_THRESHOLDS_FILE")
+
+# 長すぎるポーズ1回あたりの減点
+LONG_PAUSE_PENALTY = 0.15
+
+# 総合スコアの重み
+SCORE_WEIGHTS = {"speaking_rate": 0.4, "filler_words": 0.35, "pauses": 0.25}
+
+
+def get_speech_thresholds(language_code: str = "ja-JP") -> Dict:
+    """
+    言語コードに対応する閾値を取得（SPEECH_SCORING_THRESHOLDS_FILEの上書きを反映）.
+
+    Args:
+        language_code: 言語コード（ja-JP, en-US等、未対応の言語は日本語の閾値）
+
+    Returns:
+        dict: 閾値
+    """
+    language = language_code.split("-")[0].lower()
+    if language not in SPEECH_THRESHOLDS:
+        language = DEFAULT_SCORING_LANGUAGE
+    thresholds = dict(SPEECH_THRESHOLDS[language])
+    if THRESHOLDS_FILE:
+        with open(THRESHOLDS_FILE, encoding="utf-8") as f:
+            thresholds.update(json.load(f).get(language, {}))
+    return thresholds
+
+
+def _band_score(value: float, low: float, high: float, tolerance: float) -> float:
+    """範囲内なら1、範囲から離れるほど下がり、tolerance離れると0."""
+    if low <= value <= high:
+        return 1.0
+    distance = low - value if value < low else value - high
+    return max(0.0, 1.0 - distance / tolerance)
+
+
+def _lower_is_better_score(value: float, good: float, bad: float) -> float:
+    """good以下なら1、badで0になるよう直線的に下がる."""
+    if value <= good:
+        return 1.0
+    return max(0.0, 1.0 - (value - good) / (bad - good))
+
+
+def score_speech(
+    audio_features: Dict,
+    duration: float,
+    language_code: str = "ja-JP",
+    thresholds: Optional[Dict] = None,
+) -> Dict:
+    """
+    音声特徴量から話し方を採点.
+
+    Args:
+        audio_features: extract_audio_features()の返り値
+        duration: 発表の長さ（秒）
+        language_code: 言語コード（閾値の選択に使用）
+        thresholds: 閾値（省略時はget_speech_thresholds(language_code)）
+
+    Returns:
+        dict: {
+            "scores": {"speaking_rate", "filler_words", "pauses", "overall"}（0〜1）,
+            "metrics": {"speaking_rate", "fillers_per_min", "pauses_per_min", "long_pauses"},
+            "strengths": ["強み", ...],
+            "improvements": ["改善点", ...],
+            "feedback": 採点結果をまとめた文章
+        }
+    """
+    t = thresholds or get_speech_thresholds(language_code)
+    minutes = duration / 60 if duration > 0 else 0.0
+    strengths: List[str] = []
+    improvements: List[str] = []
+
+    # 1. 話速
+    rate = audio_features.get("speaking_rate", 0.0)
+    rate_score = _band_score(rate, t["rate_min"], t["rate_max"], t["rate_tolerance"])
+    rate_text = f"{rate:.0f}文字/分、目安 {t['rate_min']}-{t['rate_max']}文字/分"
+    if rate_score == 1.0:
+        strengths.append(f"話すスピードが適切です（{rate_text}）")
+    elif rate > t["rate_max"]:
+        improvements.append(f"話すスピードが速めです（{rate_text}）。要点の前後で少し間を取りましょう")
+    else:
+        improvements.append(f"話すスピードが遅めです（{rate_text}）。テンポを上げると聞き手の集中が続きます")
+
+    # 2. フィラーワード
+    filler_words = audio_features.get("filler_words", {})
+    filler_count = sum(data["count"] for data in filler_words.values())
+    fillers_per_min = filler_count / minutes if minutes else 0.0
+    filler_score = _lower_is_better_score(
+        fillers_per_min, t["filler_per_min_good"], t["filler_per_min_bad"]
+    )
+    if filler_score == 1.0:
+        strengths.append(f"フィラーワードが少なく、すっきりした話し方です（1分あたり{fillers_per_min:.1f}回）")
+    else:
+        top_word, top_data = max(filler_words.items(), key=lambda item: item[1]["count"])
+        improvements.append(
+            f"フィラーワードが1分あたり{fillers_per_min:.1f}回あります（最多: 「{top_word}」{top_data['count']}回）。"
+            "言葉に詰まりそうな所は黙って間を取りましょう"
+        )
+
+    # 3. ポーズ
+    pauses = audio_features.get("pauses", {})
+    pauses_per_min = pauses.get("total", 0) / minutes if minutes else 0.0
+    long_pauses = pauses.get("long_pauses", [])
+    if pauses_per_min < t["pause_per_min_min"]:
+        pause_score = pauses_per_min / t["pause_per_min_min"]
+    else:
+        pause_score = _band_score(
+            pauses_per_min, t["pause_per_min_min"], t["pause_per_min_max"], t["pause_per_min_max"]
+        )
+    pause_score = max(0.0, pause_score - LONG_PAUSE_PENALTY * len(long_pauses))
+    if pauses_per_min < t["pause_per_min_min"]:
+        improvements.append(f"間が少なめです（1分あたり{pauses_per_min:.1f}回）。話の区切りで一呼吸置きましょう")
+    elif pauses_per_min > t["pause_per_min_max"]:
+        improvements.append(f"間が多く、話が途切れがちです（1分あたり{pauses_per_min:.1f}回）")
+    elif not long_pauses:
+        strengths.append(f"適切な間が取れています（1分あたり{pauses_per_min:.1f}回）")
+    if long_pauses:
+        improvements.append(
+            f"{LONG_PAUSE_THRESHOLD_SEC:.0f}秒以上の長い沈黙が{len(long_pauses)}回あります"
+            f"（最初は{format_timestamp(long_pauses[0]['time'])}）。話す内容を事前に整理しておきましょう"
+        )
+
+    scores = {
+        "speaking_rate": rate_score,
+        "filler_words": filler_score,
+        "pauses": pause_score,
+    }
+    scores["overall"] = sum(scores[name] * weight for name, weight in SCORE_WEIGHTS.items())
+    scores = {name: round(score, 2) for name, score in scores.items()}
+
+    feedback = "。".join([f"話し方の総合スコアは{scores['overall']:.2f}です", *strengths, *improvements]) + "。"
+    return {
+        "scores": scores,
+        "metrics": {
+            "speaking_rate": rate,
+            "fillers_per_min": fillers_per_min,
+            "pauses_per_min": pauses_per_min,
+            "long_pauses": len(long_pauses),
+        },
+        "strengths": strengths,
+        "improvements": improvements,
+        "feedback": feedback,
+    }
@@ -0,0 +1,150 @@
+"""AWS Transcribe Streaming連携モジュール（S3アップロード・バッチジョブを使わない書き起こし）."""
+
+import asyncio
+import contextlib
+import os
+from typing import AsyncIterable, Dict, Optional
+
+from .audio_decoder import DEFAULT_SAMPLE_RATE, aiter_pcm_chunks
+from .transcript_segments import SegmentBuilder, word_separator
+
+
+# 環境変数またはデフォルト設定
+AWS_REGION = os.getenv("AWS_REGION", "us-west-2")
+# ローカルのフェイクサーバー等に接続する場合に指定（例: http://localhost:8080）
+STREAMING_ENDPOINT = os.getenv("TRANSCRIBE_STREAMING_ENDPOINT")
+
+
+async def _consume_transcript_events(events: AsyncIterable, language_code: str) -> Dict:
+    """
+    Transcribe Streamingのイベントを受け取り、確定した結果からセグメントを組み立てる.
+
+    Args:
+        events: TranscriptEventの非同期イテラブル
+        language_code: 言語コード
+
+    Returns:
+        dict: 書き起こし結果（transcribe_audio()と同じ形式）
+    """
+    separator = word_separator(language_code)
+    builder = SegmentBuilder(separator)
+    segments = []
+    transcripts = []
+
+    async for event in events:
+        for result in event.transcript.results:
+            # 途中結果は後で確定結果に置き換わるため使わない
+            if result.is_partial or not result.alternatives:
+                continue
+            alternative = result.alternatives[0]
+            transcripts.append(alternative.transcript)
+            for item in alternative.items:
+                if item.item_type == "pronunciation":
+                    builder.add_word(
+                        item.content, float(item.start_time), float(item.end_time), item.confidence
+                    )
+                elif item.item_type == "punctuation":
+                    segment = builder.add_punctuation(item.content)
+                    if segment is not None:
+                        segments.append(segment)
+
+    segment = builder.flush()
+    if segment is not None:
+        segments.append(segment)
+
+    return {
+        "text": separator.join(transcripts),
+        "segments": segments,
+        "duration": float(segments[-1]["end_time"]) if segments else 0.0,
+    }
+
+
+def _create_streaming_client(region: str, endpoint: Optional[str]):
+    """Transcribe Streamingクライアントを作成（endpoint指定時はそのURLに接続）."""
+    try:
+        from amazon_transcribe.client import TranscribeStreamingClient
+        from amazon_transcribe.endpoints import BaseEndpointResolver
+    except ImportError as e:
+        raise RuntimeError(
+            "ストリーミング書き起こしには amazon-transcribe が必要です: uv sync --extra streaming"
+        ) from e
+
+    if endpoint is None:
+        return TranscribeStreamingClient(region=region)
+
+    class _StaticEndpointResolver(BaseEndpointResolver):
+        async def resolve(self, region: str) -> str:
+            return endpoint
+
+    return TranscribeStreamingClient(region=region, endpoint_resolver=_StaticEndpointResolver())
+
+
+async def transcribe_audio_streaming_async(
+    audio_file_path: str,
+    language_code: str = "ja-JP",
+    endpoint: Optional[str] = None,
+    client=None,
+) -> Dict:
+    """
+    Transcribe Streamingで音声を書き起こし.
+
+    音声をPCMにデコードしながら送信し、確定した結果から順にセグメントを組み立てる。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        language_code: 言語コード（ja-JP, en-US等）
+        endpoint: 接続先URL（省略時はTRANSCRIBE_STREAMING_ENDPOINTまたはAWS）
+        client: start_stream_transcription()を持つクライアント（省略時はSDKのクライアントを作成、
+            テストではローカルのフェイクサーバーを渡す）
+
+    Returns:
+        dict: 書き起こし結果（transcribe_audio()と同じ形式）
+    """
+    if client is None:
+        client = _create_streaming_client(AWS_REGION, endpoint or STREAMING_ENDPOINT)
+    stream = await client.start_stream_transcription(
+        language_code=language_code,
+        media_sample_rate_hz=DEFAULT_SAMPLE_RATE,
+        media_encoding="pcm",
+    )
+
+    async def send_audio():
+        # 送信に失敗した場合もデコーダーを閉じてffmpegを終了させる
+        chunks = aiter_pcm_chunks(audio_file_path, DEFAULT_SAMPLE_RATE)
+        async with contextlib.aclosing(chunks):
+            async for chunk in chunks:
+                await stream.input_stream.send_audio_event(audio_chunk=chunk)
+        await stream.input_stream.end_stream()
+
+    print("⏳ ストリーミング書き起こし中...")
+    consumer = asyncio.ensure_future(
+        _consume_transcript_events(stream.output_stream, language_code)
+    )
+    try:
+        await send_audio()
+    except BaseException:
+        # 受信側は終端イベントを待ち続けるため止める
+        consumer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await consumer
+        raise
+    return await consumer
+
+
+def transcribe_audio_streaming(
+    audio_file_path: str,
+    language_code: str = "ja-JP",
+    endpoint: Optional[str] = None,
+) -> Dict:
+    """
+    transcribe_audio_streaming_async() の同期ラッパー.
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        language_code: 言語コード（ja-JP, en-US等）
+        endpoint: 接続先URL（省略時はTRANSCRIBE_STREAMING_ENDPOINTまたはAWS）
+
+    Returns:
+        dict: 書き起こし結果（transcribe_audio()と同じ形式）
+    """
+    return asyncio.run(transcribe_audio_streaming_async(audio_file_path, language_code, endpoint))
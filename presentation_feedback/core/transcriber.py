@@ -1,49 +1,163 @@
 """AWS Transcribe連携モジュール."""
 
 import os
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Dict
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
-import boto3
+from boto3.s3.transfer import ProgressCallbackInvoker, TransferConfig, create_transfer_manager
 from botocore.exceptions import ClientError
 
+from .audio_normalizer import NORMALIZE_CODEC, NORMALIZE_ENABLED, normalize_audio
+from .aws_clients import get_client
+from .job_waiter import wait_for_transcription_job
+from .media_probe import probe_fileobj, probe_media, validate_for_transcribe
+from .transcriber_registry import get_transcriber, get_transcriber_cache_options, register_transcriber
+from .transcript_json import iter_transcript_document, parse_transcript_stream
+from .transcript_segments import offset_transcription
+from .transcription_cache import (
+    TranscriptionCache,
+    compute_audio_hash,
+    compute_fileobj_hash,
+    get_default_cache,
+)
+
 
 # 環境変数またはデフォルト設定
 AWS_REGION = os.getenv("AWS_REGION", "us-west-2")
 S3_BUCKET = os.getenv("TRANSCRIBE_S3_BUCKET", "presentation-feedback")
 S3_PREFIX = "input/"
+# 書き起こし方式（"batch": S3 + バッチジョブ, "chunked": 分割して並列ジョブ,
+# "streaming": Transcribe Streaming, "local": ローカルASR）
+TRANSCRIBE_BACKEND = os.getenv("TRANSCRIBE_BACKEND", "batch")
+
+# S3マルチパートアップロード設定
+S3_UPLOAD_CHUNK_SIZE = int(os.getenv("S3_UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))  # 8MB
+S3_UPLOAD_MAX_CONCURRENCY = int(os.getenv("S3_UPLOAD_MAX_CONCURRENCY", "10"))
+UPLOAD_PROGRESS_INTERVAL_SEC = 0.2
+
+# MediaSampleRateHertzを指定する形式（ヘッダのレートが確実なもの）
+SAMPLE_RATE_MEDIA_FORMATS = ("wav", "flac")
+
+# 結果JSONのダウンロード時に一度に読むバイト数
+TRANSCRIPT_READ_CHUNK_BYTES = 64 * 1024
+
+# (送信済みバイト数, 総バイト数) を受け取るコールバック
+ProgressCallback = Callable[[int, int], None]
+
+
+def _get_transfer_config() -> TransferConfig:
+    """マルチパートアップロードの設定（パートサイズ・並列数）."""
+    return TransferConfig(
+        multipart_threshold=S3_UPLOAD_CHUNK_SIZE,
+        multipart_chunksize=S3_UPLOAD_CHUNK_SIZE,
+        max_concurrency=S3_UPLOAD_MAX_CONCURRENCY,
+    )
+
+
+class _UploadProgress:
+    """転送スレッドから通知される送信済みバイト数を集計."""
+
+    def __init__(self):
+        self.transferred = 0
+        self._lock = threading.Lock()
 
+    def __call__(self, bytes_amount: int) -> None:
+        with self._lock:
+            self.transferred += bytes_amount
 
-def _upload_to_s3(audio_file_path: str, s3_client, bucket: str, key: str) -> str:
+
+def content_addressed_key(audio_hash: str, file_name: str) -> str:
+    """内容のハッシュから決まるS3キー（同じ音声は同じキーになる）."""
+    return f"{S3_PREFIX}sha256/{audio_hash}{Path(file_name).suffix.lower()}"
+
+
+def _object_exists(s3_client, bucket: str, key: str) -> bool:
     """
-    音声ファイルをS3にアップロード.
+    S3オブジェクトが存在するか確認.
 
     Args:
-        audio_file_path: ローカル音声ファイルパス
         s3_client: boto3 S3クライアント
         bucket: S3バケット名
         key: S3オブジェクトキー
 
     Returns:
-        str: S3 URI (s3://bucket/key)
+        bool: 存在すればTrue
     """
     try:
-        s3_client.upload_file(audio_file_path, bucket, key)
-        s3_uri = f"s3://{bucket}/{key}"
-        print(f"✓ S3にアップロード完了: {s3_uri}")
+        s3_client.head_object(Bucket=bucket, Key=key)
+        return True
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise RuntimeError(f"S3オブジェクト確認エラー: {e}") from e
+
+
+def upload_to_s3(
+    source: Union[str, BinaryIO],
+    s3_client,
+    bucket: str,
+    key: str,
+    total_bytes: int,
+    on_progress: Optional[ProgressCallback] = None,
+    skip_if_exists: bool = False,
+) -> str:
+    """
+    音声ファイルをS3にマルチパート・並列アップロード.
+
+    転送はs3transferのワーカースレッドで行い、呼び出し元のスレッドで完了を待ちながら
+    on_progressを呼ぶ（StreamlitのUI更新はスクリプトのスレッドからのみ行えるため）。
+
+    Args:
+        source: ローカル音声ファイルパス、またはシーク可能なファイルオブジェクト
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        key: S3オブジェクトキー
+        total_bytes: アップロードするバイト数（進捗表示用）
+        on_progress: 進捗コールバック (送信済みバイト数, 総バイト数)
+        skip_if_exists: 同じキーのオブジェクトがあればアップロードしない
+
+    Returns:
+        str: S3 URI (s3://bucket/key)
+    """
+    s3_uri = f"s3://{bucket}/{key}"
+    if skip_if_exists and _object_exists(s3_client, bucket, key):
+        print(f"✓ 同じ内容の音声がS3にあるためアップロードをスキップ: {s3_uri}")
+        if on_progress is not None:
+            on_progress(total_bytes, total_bytes)
         return s3_uri
+
+    if not isinstance(source, str):
+        source.seek(0)
+
+    progress = _UploadProgress()
+    try:
+        with create_transfer_manager(s3_client, _get_transfer_config()) as manager:
+            future = manager.upload(
+                source, bucket, key, subscribers=[ProgressCallbackInvoker(progress)]
+            )
+            if on_progress is not None:
+                while not future.done():
+                    on_progress(progress.transferred, total_bytes)
+                    time.sleep(UPLOAD_PROGRESS_INTERVAL_SEC)
+                on_progress(progress.transferred, total_bytes)
+            future.result()
     except ClientError as e:
         raise RuntimeError(f"S3アップロードエラー: {e}") from e
 
+    print(f"✓ S3にアップロード完了: {s3_uri}")
+    return s3_uri
 
-def _start_transcription_job(
+
+def start_transcription_job(
     transcribe_client,
     job_name: str,
     s3_uri: str,
     language_code: str,
+    media_info: Dict,
 ) -> None:
     """
     AWS Transcriptionジョブを開始.
@@ -53,127 +167,293 @@ def _start_transcription_job(
         job_name: ジョブ名
         s3_uri: 音声ファイルのS3 URI
         language_code: 言語コード
+        media_info: probe_media()の返り値（MediaFormat・WAV/FLACのサンプリングレートに使用）
     """
+    params = {
+        "TranscriptionJobName": job_name,
+        "Media": {"MediaFileUri": s3_uri},
+        "MediaFormat": media_info["media_format"],
+        "LanguageCode": language_code,
+        # Phase 1では話者分離なし（Settingsパラメータ不要）
+    }
+    # ヘッダのレートがそのまま実際のレートになる形式のみ指定する（MP4・Opus等で
+    # 実際と異なる値を渡すとジョブが失敗するため、省略してTranscribeの判定に任せる）
+    if media_info["media_format"] in SAMPLE_RATE_MEDIA_FORMATS:
+        params["MediaSampleRateHertz"] = media_info["sample_rate"]
     try:
-        transcribe_client.start_transcription_job(
-            TranscriptionJobName=job_name,
-            Media={"MediaFileUri": s3_uri},
-            MediaFormat="mp3",  # 拡張子から自動判定も可能
-            LanguageCode=language_code,
-            # Phase 1では話者分離なし（Settingsパラメータ不要）
-        )
+        transcribe_client.start_transcription_job(**params)
         print(f"✓ Transcriptionジョブ開始: {job_name}")
     except ClientError as e:
         raise RuntimeError(f"Transcriptionジョブ開始エラー: {e}") from e
 
 
-def _wait_for_job_completion(transcribe_client, job_name: str) -> Dict:
+def _estimate_duration_from_size(size_bytes: int) -> float:
+    """ファイルサイズ（バイト）から音声の長さ（秒）を概算（128kbps想定）."""
+    return size_bytes / (128_000 / 8)
+
+
+def probe_for_transcribe(source: Union[str, BinaryIO]) -> Dict:
+    """
+    ヘッダを解析し、Transcribeで処理できることを確認（ネットワークI/Oの前に呼ぶ）.
+
+    Args:
+        source: 音声ファイルのパス、またはシーク可能なファイルオブジェクト
+
+    Returns:
+        dict: probe_media()の返り値
+
+    Raises:
+        ValueError: 対応していない形式・Transcribeの制約外の場合
+    """
+    media_info = probe_media(source) if isinstance(source, str) else probe_fileobj(source)
+    validate_for_transcribe(media_info)
+    duration = media_info["duration"]
+    print(
+        f"✓ 音声形式: {media_info['container']}/{media_info['codec']}, "
+        f"{media_info['sample_rate']}Hz, {media_info['channels']}ch"
+        + (f", {duration:.1f}秒" if duration is not None else "")
+    )
+    return media_info
+
+
+def _wait_for_job_completion(
+    transcribe_client,
+    job_name: str,
+    audio_duration: Optional[float] = None,
+) -> Dict:
     """
     Transcriptionジョブの完了を待機.
 
     Args:
         transcribe_client: boto3 Transcribeクライアント
         job_name: ジョブ名
+        audio_duration: 音声の長さ（秒、ポーリング間隔の決定に使用）
 
     Returns:
         dict: ジョブステータス情報
     """
     print("⏳ 書き起こし処理中...", end="", flush=True)
-    while True:
-        response = transcribe_client.get_transcription_job(
-            TranscriptionJobName=job_name
-        )
-        status = response["TranscriptionJob"]["TranscriptionJobStatus"]
-
-        if status == "COMPLETED":
-            print(" 完了!")
-            return response["TranscriptionJob"]
-        elif status == "FAILED":
-            failure_reason = response["TranscriptionJob"].get(
-                "FailureReason", "不明なエラー"
-            )
-            raise RuntimeError(f"Transcription失敗: {failure_reason}")
-
-        print(".", end="", flush=True)
-        time.sleep(5)
+    job = wait_for_transcription_job(transcribe_client, job_name, audio_duration)
+    print(" 完了!")
+    return job
 
 
-def _parse_transcription_result(job_result: Dict) -> Dict:
+def _iter_transcript_bytes(job_result: Dict) -> Iterator[bytes]:
     """
-    Transcription結果をパースして必要な形式に変換.
+    Transcription結果JSONをダウンロードしながら断片で返す（全体をメモリに載せない）.
 
     Args:
         job_result: AWS Transcribeのジョブ結果
 
-    Returns:
-        dict: パース済み書き起こし結果
+    Yields:
+        bytes: 結果JSONの断片
     """
     import requests
 
     # 結果JSONのURLを取得
     transcript_uri = job_result["Transcript"]["TranscriptFileUri"]
-    response = requests.get(transcript_uri)
-    response.raise_for_status()
-    transcript_data = response.json()
-
-    # 全文テキスト
-    full_text = transcript_data["results"]["transcripts"][0]["transcript"]
-
-    # セグメント情報を抽出
-    segments = []
-    items = transcript_data["results"]["items"]
-
-    current_segment = {"text": "", "start_time": None, "end_time": None}
-
-    for item in items:
-        if item["type"] == "pronunciation":
-            word = item["alternatives"][0]["content"]
-            start_time = float(item["start_time"])
-            end_time = float(item["end_time"])
-            confidence = float(item["alternatives"][0]["confidence"])
-
-            # セグメント開始
-            if current_segment["start_time"] is None:
-                current_segment["start_time"] = start_time
-
-            current_segment["text"] += word
-            current_segment["end_time"] = end_time
-            current_segment["confidence"] = confidence
-
-        elif item["type"] == "punctuation":
-            # 句読点は直前の単語に追加
-            current_segment["text"] += item["alternatives"][0]["content"]
-
-            # 句読点でセグメント区切り
-            if current_segment["text"]:
-                segments.append(current_segment.copy())
-                current_segment = {
-                    "text": "",
-                    "start_time": None,
-                    "end_time": None,
-                }
-
-    # 最後のセグメントを追加
-    if current_segment["text"]:
-        segments.append(current_segment)
-
-    # 総時間を計算
-    duration = float(segments[-1]["end_time"]) if segments else 0.0
-
-    return {
-        "text": full_text,
-        "segments": segments,
-        "duration": duration,
-    }
+    with requests.get(transcript_uri, stream=True) as response:
+        response.raise_for_status()
+        yield from response.iter_content(chunk_size=TRANSCRIPT_READ_CHUNK_BYTES)
+
+
+def fetch_transcript_items(job_result: Dict) -> List[Dict]:
+    """
+    Transcription結果JSONの単語アイテムだけを読み出す（audio_segments等は読み飛ばす）.
+
+    Args:
+        job_result: AWS Transcribeのジョブ結果
+
+    Returns:
+        list: results.items
+    """
+    return [
+        value for kind, value in iter_transcript_document(_iter_transcript_bytes(job_result))
+        if kind == "item"
+    ]
 
 
-def transcribe_audio(audio_file_path: str, language_code: str = "ja-JP") -> Dict:
+def _parse_transcription_result(job_result: Dict, language_code: str) -> Dict:
     """
-    AWS Transcribeで音声を書き起こし.
+    Transcription結果をダウンロードしながらパースして必要な形式に変換.
+
+    Args:
+        job_result: AWS Transcribeのジョブ結果
+        language_code: 言語コード
+
+    Returns:
+        dict: パース済み書き起こし結果
+    """
+    return parse_transcript_stream(_iter_transcript_bytes(job_result), language_code)
+
+
+def run_transcription_job(
+    transcribe_client,
+    job_name: str,
+    s3_uri: str,
+    language_code: str,
+    media_info: Dict,
+) -> Dict:
+    """
+    S3上の音声に対してTranscriptionジョブを実行し、結果をパース.
+
+    Args:
+        transcribe_client: boto3 Transcribeクライアント
+        job_name: ジョブ名
+        s3_uri: 音声ファイルのS3 URI
+        language_code: 言語コード
+        media_info: probe_media()の返り値
+
+    Returns:
+        dict: 書き起こし結果
+    """
+    # Transcriptionジョブ開始
+    start_transcription_job(transcribe_client, job_name, s3_uri, language_code, media_info)
+
+    # ジョブ完了を待機（長さはポーリング間隔の決定に使用）
+    audio_duration = media_info["duration"]
+    if audio_duration is None:
+        audio_duration = _estimate_duration_from_size(media_info["size_bytes"])
+    job_result = _wait_for_job_completion(transcribe_client, job_name, audio_duration)
+
+    # 結果を取得・パース
+    return _parse_transcription_result(job_result, language_code)
+
+
+@register_transcriber("batch")
+def transcribe_batch(
+    audio_file_path: str,
+    language_code: str,
+    on_upload_progress: Optional[ProgressCallback] = None,
+) -> Dict:
+    """
+    S3アップロード + Transcriptionバッチジョブで書き起こし.
+
+    S3キーは音声内容のハッシュから決めるため、同じ音声を再度分析する場合は
+    アップロードを省略する。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        language_code: 言語コード
+        on_upload_progress: アップロード進捗コールバック (送信済みバイト数, 総バイト数)
+
+    Returns:
+        dict: 書き起こし結果
+
+    Raises:
+        ValueError: Transcribeで処理できない音声の場合（アップロード前に判定）
+    """
+    # 0. 形式の確認（失敗するファイルはアップロード前に弾く）
+    media_info = probe_for_transcribe(audio_file_path)
+
+    # クライアント初期化
+    s3_client = get_client("s3", region_name=AWS_REGION)
+    transcribe_client = get_client("transcribe", region_name=AWS_REGION)
+
+    # ジョブ名生成（ユニーク）
+    job_name = f"presentation-feedback-{uuid.uuid4().hex[:8]}"
+
+    # S3キー生成（内容のハッシュ）
+    s3_key = content_addressed_key(compute_audio_hash(audio_file_path), audio_file_path)
+
+    # 1. S3にアップロード
+    s3_uri = upload_to_s3(
+        audio_file_path, s3_client, S3_BUCKET, s3_key,
+        total_bytes=media_info["size_bytes"],
+        on_progress=on_upload_progress,
+        skip_if_exists=True,
+    )
+
+    # 2. 書き起こし
+    return run_transcription_job(transcribe_client, job_name, s3_uri, language_code, media_info)
+
+
+@register_transcriber("streaming")
+def _transcribe_streaming(audio_file_path: str, language_code: str) -> Dict:
+    """
+    Transcribe Streamingで書き起こし（amazon-transcribeは使用時に読み込む）.
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+        language_code: 言語コード
+
+    Returns:
+        dict: 書き起こし結果
+    """
+    from .streaming_transcriber import transcribe_audio_streaming
+
+    return transcribe_audio_streaming(audio_file_path, language_code)
+
+
+def _transcribe_with_cache(
+    cache: Optional[TranscriptionCache],
+    get_audio_hash: Callable[[], str],
+    language_code: str,
+    backend: str,
+    cache_options: Dict,
+    transcribe: Callable[[], Dict],
+) -> Dict:
+    """
+    キャッシュにあれば返し、なければ書き起こしてキャッシュに保存.
+
+    Args:
+        cache: 書き起こしキャッシュ（Noneの場合はプロセス共通のキャッシュ）
+        get_audio_hash: 音声のハッシュを返す関数（キャッシュが無効な場合は呼ばない）
+        language_code: 言語コード
+        backend: 書き起こし方式
+        cache_options: 書き起こし結果に影響する設定
+        transcribe: キャッシュにない場合に書き起こしを行う関数
+
+    Returns:
+        dict: 書き起こし結果
+    """
+    cache = cache if cache is not None else get_default_cache()
+    audio_hash = None
+
+    # 0. キャッシュ確認（方式・設定ごとに別のエントリ）
+    if cache is not None:
+        audio_hash = get_audio_hash()
+        cached = cache.get(audio_hash, language_code, backend, cache_options)
+        if cached is not None:
+            print(f"✓ 書き起こしキャッシュを使用: {len(cached['segments'])}セグメント, {cached['duration']:.1f}秒")
+            return cached
+
+    result = transcribe()
+    print(f"✓ 書き起こし完了: {len(result['segments'])}セグメント, {result['duration']:.1f}秒")
+
+    # 3. キャッシュに保存
+    if cache is not None:
+        cache.put(audio_hash, language_code, backend, result, cache_options)
+    return result
+
+
+def transcribe_audio(
+    audio_file_path: str,
+    language_code: str = "ja-JP",
+    cache: Optional[TranscriptionCache] = None,
+    backend: Optional[str] = None,
+    on_upload_progress: Optional[ProgressCallback] = None,
+    normalize: Optional[bool] = None,
+    acoustic: Optional[Dict] = None,
+) -> Dict:
+    """
+    音声を書き起こし（デフォルトはAWS Transcribe）.
+
+    同じ音声ファイル・言語コード・書き起こし方式（と結果に影響する設定）の書き起こし結果はキャッシュされ、
+    2回目以降はS3・Transcribeを呼ばずに返す。
+    normalizeを有効にすると、16kHzモノラルの圧縮音声に変換し前後の無音を
+    除去してから書き起こす（時刻は元の音声の時間軸に戻して返す）。
 
     Args:
         audio_file_path: 音声ファイルのパス
         language_code: 言語コード（ja-JP, en-US等）
+        cache: 書き起こしキャッシュ（省略時はプロセス共通のキャッシュ）
+        backend: 書き起こし方式（"batch", "chunked", "streaming", "local"等、省略時はTRANSCRIBE_BACKEND）
+        on_upload_progress: S3アップロードの進捗コールバック
+            (送信済みバイト数, 総バイト数)（batch方式のみ）
+        normalize: 書き起こし前に音声を正規化するか（省略時はAUDIO_NORMALIZE）
+        acoustic: 計算済みのextract_acoustic_features()の返り値（正規化の無音除去に使い、
+            省略時は正規化の中で無音区間だけを解析する）
 
     Returns:
         dict: 書き起こし結果
@@ -189,31 +469,105 @@ def transcribe_audio(audio_file_path: str, language_code: str = "ja-JP") -> Dict
                     ...
                 ],
                 "duration": 512.5  # 総時間（秒）
+                # 正規化した場合のみ "normalization": normalize_audio()の返り値
             }
     """
-    # クライアント初期化
-    s3_client = boto3.client("s3", region_name=AWS_REGION)
-    transcribe_client = boto3.client("transcribe", region_name=AWS_REGION)
-
-    # ジョブ名生成（ユニーク）
-    job_name = f"presentation-feedback-{uuid.uuid4().hex[:8]}"
+    backend = backend or TRANSCRIBE_BACKEND
+    transcriber = get_transcriber(backend)
+    if normalize is None:
+        normalize = NORMALIZE_ENABLED
+    cache_options = get_transcriber_cache_options(backend)
+    if normalize:
+        cache_options["normalize"] = NORMALIZE_CODEC
+
+    normalization = None
+
+    def run() -> Dict:
+        nonlocal normalization
+        # 1. 正規化（16kHzモノラル・前後の無音除去）
+        if normalize:
+            normalization = normalize_audio(audio_file_path, acoustic=acoustic)
+        source_path = normalization["path"] if normalization else audio_file_path
+
+        # 2. 書き起こし
+        if on_upload_progress is not None:
+            result = transcriber(source_path, language_code, on_upload_progress=on_upload_progress)
+        else:
+            result = transcriber(source_path, language_code)
+        if normalization:
+            result = offset_transcription(result, normalization["trim_offset"])
+        return result
+
+    result = _transcribe_with_cache(
+        cache,
+        lambda: compute_audio_hash(audio_file_path),
+        language_code,
+        backend,
+        cache_options,
+        run,
+    )
+    if normalization:
+        return {**result, "normalization": normalization}
+    return result
 
-    # S3キー生成
-    file_name = Path(audio_file_path).name
-    s3_key = f"{S3_PREFIX}{job_name}/{file_name}"
 
-    # 1. S3にアップロード
-    s3_uri = _upload_to_s3(audio_file_path, s3_client, S3_BUCKET, s3_key)
+def transcribe_fileobj(
+    fileobj: BinaryIO,
+    file_name: str,
+    language_code: str = "ja-JP",
+    cache: Optional[TranscriptionCache] = None,
+    on_upload_progress: Optional[ProgressCallback] = None,
+) -> Dict:
+    """
+    ファイルオブジェクトをローカルに保存せず、S3へ直接アップロードして書き起こし.
 
-    # 2. Transcriptionジョブ開始
-    _start_transcription_job(transcribe_client, job_name, s3_uri, language_code)
+    アップロードはマルチパート転送で一定サイズずつ送るため、
+    ファイル全体のコピーをメモリ上に作らない（バッチジョブ方式のみ）。
 
-    # 3. ジョブ完了を待機
-    job_result = _wait_for_job_completion(transcribe_client, job_name)
+    Args:
+        fileobj: シーク可能なファイルオブジェクト（StreamlitのUploadedFile等）
+        file_name: 元のファイル名（S3キーに使用）
+        language_code: 言語コード（ja-JP, en-US等）
+        cache: 書き起こしキャッシュ（省略時はプロセス共通のキャッシュ）
+        on_upload_progress: S3アップロードの進捗コールバック (送信済みバイト数, 総バイト数)
 
-    # 4. 結果を取得・パース
-    result = _parse_transcription_result(job_result)
+    Returns:
+        dict: 書き起こし結果（transcribe_audio()と同じ形式）
 
-    print(f"✓ 書き起こし完了: {len(result['segments'])}セグメント, {result['duration']:.1f}秒")
+    Raises:
+        ValueError: Transcribeで処理できない音声の場合（アップロード前に判定）
+    """
+    # S3キーにも使うため、キャッシュの有無に関わらず計算する
+    audio_hash = compute_fileobj_hash(fileobj)
+
+    def run() -> Dict:
+        # 形式の確認（失敗するファイルはアップロード前に弾く）
+        media_info = probe_for_transcribe(fileobj)
+
+        # クライアント初期化
+        s3_client = get_client("s3", region_name=AWS_REGION)
+        transcribe_client = get_client("transcribe", region_name=AWS_REGION)
+
+        job_name = f"presentation-feedback-{uuid.uuid4().hex[:8]}"
+        s3_key = content_addressed_key(audio_hash, file_name)
+
+        # 1. S3に直接アップロード
+        s3_uri = upload_to_s3(
+            fileobj, s3_client, S3_BUCKET, s3_key,
+            total_bytes=media_info["size_bytes"],
+            on_progress=on_upload_progress,
+            skip_if_exists=True,
+        )
 
-    return result
+        # 2. 書き起こし
+        return run_transcription_job(transcribe_client, job_name, s3_uri, language_code, media_info)
+
+    # batch方式と同じ処理のため、transcribe_audio(backend="batch")とキャッシュを共有する
+    return _transcribe_with_cache(
+        cache,
+        lambda: audio_hash,
+        language_code,
+        "batch",
+        get_transcriber_cache_options("batch"),
+        run,
+    )
@@ -0,0 +1,78 @@
+"""書き起こしバックエンドのレジストリ."""
+
+from typing import Callable, Dict, List, Optional
+
+
+# バックエンド: (audio_file_path, language_code) -> 書き起こし結果
+TranscriberBackend = Callable[[str, str], Dict]
+
+_BACKENDS: Dict[str, TranscriberBackend] = {}
+_CACHE_OPTIONS: Dict[str, Dict] = {}
+
+
+def register_transcriber(
+    name: str,
+    cache_options: Optional[Dict] = None,
+) -> Callable[[TranscriberBackend], TranscriberBackend]:
+    """
+    書き起こしバックエンドを登録するデコレータ.
+
+    登録した関数は transcribe_audio(backend=name) や TRANSCRIBE_BACKEND=name で選択できる。
+
+    Args:
+        name: バックエンド名
+        cache_options: 書き起こし結果に影響する設定（モデル名等、書き起こしキャッシュのキーに含める）
+
+    Returns:
+        デコレータ
+    """
+    def decorator(func: TranscriberBackend) -> TranscriberBackend:
+        _BACKENDS[name] = func
+        _CACHE_OPTIONS[name] = dict(cache_options or {})
+        return func
+
+    return decorator
+
+
+def get_transcriber(name: str) -> TranscriberBackend:
+    """
+    登録済みの書き起こしバックエンドを取得.
+
+    Args:
+        name: バックエンド名
+
+    Returns:
+        TranscriberBackend: 書き起こし関数
+
+    Raises:
+        ValueError: 未登録のバックエンド名の場合
+    """
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"未対応の書き起こし方式です: {name}（利用可能: {', '.join(available_transcribers())}）"
+        ) from None
+
+
+def get_transcriber_cache_options(name: str) -> Dict:
+    """
+    バックエンドの登録時に指定した、書き起こし結果に影響する設定を取得.
+
+    Args:
+        name: バックエンド名
+
+    Returns:
+        dict: 設定（未登録・指定なしの場合は空）
+    """
+    return dict(_CACHE_OPTIONS.get(name, {}))
+
+
+def available_transcribers() -> List[str]:
+    """
+    登録済みのバックエンド名を返す.
+
+    Returns:
+        list: バックエンド名
+    """
+    return list(_BACKENDS)
@@ -0,0 +1,195 @@
+"""書き起こしの抜粋（トークン数の上限内に収まる、時刻付きの抽出要約）."""
+
+import os
+import re
+from typing import Dict, List, Set
+
+
+# 環境変数またはデフォルト設定（推定トークン数）
+CONTENT_TOKEN_BUDGET = int(os.getenv("CONTENT_TRANSCRIPT_TOKEN_BUDGET", "3000"))
+SPEECH_TOKEN_BUDGET = int(os.getenv("SPEECH_TRANSCRIPT_TOKEN_BUDGET", "500"))
+
+# 導入・まとめとみなす範囲（全体に対する割合）と、それぞれに割り当てる予算の割合
+INTRO_RATIO = 0.1
+CONCLUSION_RATIO = 0.1
+INTRO_BUDGET_RATIO = 0.25
+CONCLUSION_BUDGET_RATIO = 0.25
+TRANSITION_BUDGET_RATIO = 0.25
+
+# 句読点のない書き起こしでは1セグメントが長くなるため、1セグメントあたりの上限を設ける
+MAX_SEGMENT_TOKENS = 150
+OMISSION_MARK = "（中略）"
+
+# 話題の転換を示す表現（文頭にあれば転換とみなす）
+TRANSITION_MARKERS = (
+    "まず", "最初に", "次に", "続いて", "つづいて", "では", "それでは", "さて", "ところで",
+    "一方", "また", "さらに", "最後に", "まとめ", "結論", "つまり", "要するに", "以上",
+    "first", "next", "then", "moving on", "another", "finally", "in conclusion",
+    "to summarize", "in summary", "so to", "let's", "now",
+)
+# 文末の記号（直前のセグメントがこれで終わっていれば文頭とみなす。読点の後は文の途中）
+SENTENCE_END_MARKS = ("。", "．", ".", "!", "?", "！", "？")
+# 英語等の表現は単語単位で照合する（"now"が"know"の一部に一致しないように）
+_TRANSITION_PATTERN = re.compile(
+    "|".join(
+        re.escape(marker) + (r"\b" if marker.isascii() else "")
+        for marker in sorted(TRANSITION_MARKERS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    トークン数を概算（日本語は1文字≒1トークン、英数字は4文字≒1トークン）.
+
+    Args:
+        text: 対象テキスト
+
+    Returns:
+        int: 推定トークン数
+    """
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return (len(text) - ascii_chars) + (ascii_chars + 3) // 4
+
+
+def format_timestamp(seconds: float) -> str:
+    """秒を mm:ss 形式の文字列にする."""
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """テキストを先頭からmax_tokens以内に切り詰める."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens - 1:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + "…"
+
+
+def _is_transition(text: str) -> bool:
+    """文頭が話題の転換を示す表現か（先頭の空白・かぎ括弧は無視する）."""
+    return _TRANSITION_PATTERN.match(text.lstrip(" 　「『\"'")) is not None
+
+
+def _starts_sentence(segments: List[Dict], index: int) -> bool:
+    """セグメントが文頭から始まるか（最初のセグメント、または直前が文末で終わる）."""
+    return index == 0 or segments[index - 1]["text"].rstrip().endswith(SENTENCE_END_MARKS)
+
+
+def condense_transcript(transcription: Dict, token_budget: int) -> Dict:
+    """
+    書き起こしをトークン予算内の抜粋にする.
+
+    予算内に収まる場合は全文をそのまま返す。収まらない場合はセグメント単位で、
+    導入（最初の10%）・まとめ（最後の10%）・話題の転換を優先して残し、
+    残りの予算で本題を時間的に均等に抜き出す。各行に開始時刻 [mm:ss] を付け、
+    省略した箇所には中略の印を入れる。
+
+    Args:
+        transcription: transcribe_audio()の返り値
+        token_budget: 抜粋の推定トークン数の上限
+
+    Returns:
+        dict: {
+            "text": プロンプトに入れるテキスト,
+            "is_condensed": 抜粋したか,
+            "original_tokens": 全文の推定トークン数,
+            "tokens": 返すテキストの推定トークン数,
+            "kept_segments": 残したセグメント数,
+            "total_segments": 全セグメント数
+        }
+    """
+    segments = transcription["segments"]
+    full_text = transcription["text"]
+    original_tokens = estimate_tokens(full_text)
+    if original_tokens <= token_budget or not segments:
+        return {
+            "text": full_text,
+            "is_condensed": False,
+            "original_tokens": original_tokens,
+            "tokens": original_tokens,
+            "kept_segments": len(segments),
+            "total_segments": len(segments),
+        }
+
+    start = segments[0]["start_time"]
+    span = max(segments[-1]["end_time"] - start, 1e-9)
+    lines = [
+        f"[{format_timestamp(seg['start_time'])}] {_truncate(seg['text'], MAX_SEGMENT_TOKENS)}"
+        for seg in segments
+    ]
+    # 各行の前に中略の印が入る場合も含めて見積もる（+1は改行）
+    omission_cost = estimate_tokens(OMISSION_MARK) + 1
+    costs = [estimate_tokens(line) + 1 + omission_cost for line in lines]
+    budget = token_budget - omission_cost  # 末尾の中略の印
+    kept: Set[int] = set()
+    used = 0
+
+    def take(index: int, limit: int) -> bool:
+        nonlocal used
+        if index in kept:
+            return True
+        if used + costs[index] > limit:
+            return False
+        kept.add(index)
+        used += costs[index]
+        return True
+
+    def take_spread(indices: List[int], limit: int) -> None:
+        # 区間を半分ずつ細かくしながら中央の要素を選び、時間的に偏らないようにする
+        step = len(indices)
+        while step >= 1 and used < limit:
+            for i in indices[step // 2::step]:
+                take(i, limit)
+            step //= 2
+
+    positions = [(seg["start_time"] - start) / span for seg in segments]
+    intro = [i for i, pos in enumerate(positions) if pos < INTRO_RATIO]
+    conclusion = [i for i, pos in enumerate(positions) if pos >= 1 - CONCLUSION_RATIO]
+
+    # 1. 導入（先頭から順に）
+    intro_limit = int(budget * INTRO_BUDGET_RATIO)
+    for i in intro:
+        if not take(i, intro_limit):
+            break
+    # 2. まとめ（末尾から順に）
+    conclusion_limit = used + int(budget * CONCLUSION_BUDGET_RATIO)
+    for i in reversed(conclusion):
+        if not take(i, conclusion_limit):
+            break
+    # 3. 話題の転換
+    transitions = [
+        i for i, seg in enumerate(segments)
+        if i not in kept and _starts_sentence(segments, i) and _is_transition(seg["text"])
+    ]
+    take_spread(transitions, used + int(budget * TRANSITION_BUDGET_RATIO))
+    # 4. 残りの予算で本題を時間的に均等に
+    take_spread([i for i in range(len(segments)) if i not in kept], budget)
+
+    # 時刻順に並べ、省略箇所に中略の印を入れる
+    output: List[str] = []
+    previous = -1
+    for i in sorted(kept):
+        if i != previous + 1:
+            output.append(OMISSION_MARK)
+        output.append(lines[i])
+        previous = i
+    if previous != len(segments) - 1:
+        output.append(OMISSION_MARK)
+
+    text = "\n".join(output)
+    return {
+        "text": text,
+        "is_condensed": True,
+        "original_tokens": original_tokens,
+        "tokens": estimate_tokens(text),
+        "kept_segments": len(kept),
+        "total_segments": len(segments),
+    }
@@ -0,0 +1,226 @@
+"""Transcribe結果JSONをストリーミングで読む（ドキュメント全体をメモリに載せない）."""
+
+import codecs
+import json
+import re
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from .transcript_segments import iter_transcript_segments, word_separator
+
+
+# 読み終えたテキストを捨てるまでに溜める文字数
+_COMPACT_THRESHOLD = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+# 読み飛ばし時に注目する文字（文字列の中 / 入れ子の中 / 値の先頭の階層）
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NESTED_SPECIAL = re.compile(r'["{}\[\]]')
+_TOP_SPECIAL = re.compile(r'["{}\[\],:\s]')
+
+
+class _JSONStreamReader:
+    """
+    バイト列の断片からJSONを先頭から順に読むリーダー.
+
+    必要な値だけを json.JSONDecoder.raw_decode() で読み、それ以外の値は
+    中身を作らずに読み飛ばす。読み終えたテキストは順次捨てる。
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """次の断片をバッファに追加（終端ならFalse）."""
+        if self._eof:
+            return False
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"書き起こし結果JSONの形式が不正です: {message}")
+
+    def peek(self) -> str:
+        """空白を読み飛ばし、次の文字を返す（消費しない）."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise self._error("予期しない終端")
+
+    def expect(self, chars: str) -> str:
+        """次の文字がcharsのいずれかであることを確認して消費."""
+        char = self.peek()
+        if char not in chars:
+            raise self._error(f"'{chars}' が必要な位置に '{char}' があります")
+        self._pos += 1
+        return char
+
+    def read_value(self):
+        """次の値を読む（読み込み途中で切れていれば断片を追加して読み直す）."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 数値が断片の境界で切れている可能性があるため、値の後ろの文字まで読んでから確定する
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """次の値を、中身を作らずに読み飛ばす."""
+        self.peek()
+        depth = 0
+        in_string = False
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while True:
+                if in_string:
+                    match = _STRING_SPECIAL.search(buffer, pos)
+                    if match is None:
+                        pos = len(buffer)
+                        break
+                    if match.group() == "\\":
+                        if match.end() == len(buffer):
+                            # エスケープが断片の境界で切れている場合は続きを読んでから処理する
+                            pos = match.start()
+                            break
+                        pos = match.end() + 1
+                        continue
+                    pos = match.end()
+                    in_string = False
+                    if depth == 0:
+                        self._pos = pos
+                        return
+                    continue
+                match = (_NESTED_SPECIAL if depth else _TOP_SPECIAL).search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                char = match.group()
+                pos = match.end()
+                if char == '"':
+                    in_string = True
+                elif char in "{[":
+                    depth += 1
+                elif char in "}]":
+                    if depth == 0:
+                        # 数値・true/false/nullの直後の閉じ括弧
+                        self._pos = pos - 1
+                        return
+                    depth -= 1
+                    if depth == 0:
+                        self._pos = pos
+                        return
+                elif depth == 0:
+                    # 数値・true/false/nullの終わり
+                    self._pos = pos - 1
+                    return
+            self._pos = pos
+            if not self._fill():
+                if depth == 0 and not in_string:
+                    return
+                raise self._error("予期しない終端")
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """オブジェクトのキーを順に返す（呼び出し側はキーごとに値を1つ読むこと）."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """配列の要素ごとに制御を返す（呼び出し側は要素ごとに値を1つ読むこと）."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_transcript_document(chunks: Iterable[bytes]) -> Iterator[Tuple[str, Dict]]:
+    """
+    Transcribe結果JSONを読みながら、全文テキストと単語アイテムを順に返す.
+
+    results.transcripts と results.items 以外（audio_segments等）は読み飛ばす。
+
+    Args:
+        chunks: 結果JSONのバイト列の断片（requestsのiter_content()等）
+
+    Yields:
+        tuple: ("transcript", {"transcript": 全文}) または ("item", アイテム)
+    """
+    reader = _JSONStreamReader(chunks)
+    for key in reader.iter_object_keys():
+        if key != "results":
+            reader.skip_value()
+            continue
+        for results_key in reader.iter_object_keys():
+            if results_key == "transcripts":
+                for _ in reader.iter_array():
+                    yield "transcript", reader.read_value()
+            elif results_key == "items":
+                for _ in reader.iter_array():
+                    yield "item", reader.read_value()
+            else:
+                reader.skip_value()
+
+
+def parse_transcript_stream(chunks: Iterable[bytes], language_code: str = "ja-JP") -> Dict:
+    """
+    Transcribe結果JSONを読みながらセグメントを組み立てる.
+
+    Args:
+        chunks: 結果JSONのバイト列の断片
+        language_code: 言語コード（単語間にスペースを入れるかの判定に使用）
+
+    Returns:
+        dict: 書き起こし結果（transcribe_audio()と同じ形式）
+    """
+    full_text: Optional[str] = None
+
+    def items() -> Iterator[Dict]:
+        nonlocal full_text
+        for kind, value in iter_transcript_document(chunks):
+            if kind == "item":
+                yield value
+            elif full_text is None:
+                full_text = value["transcript"]
+
+    segments = list(iter_transcript_segments(items(), word_separator(language_code)))
+    return {
+        "text": full_text or "",
+        "segments": segments,
+        "duration": float(segments[-1]["end_time"]) if segments else 0.0,
+    }
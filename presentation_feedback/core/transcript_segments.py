@@ -0,0 +1,152 @@
+"""Transcribeの単語アイテムから句読点区切りのセグメントを組み立てる."""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+# 単語間にスペースを入れない言語（言語コードの先頭部分）
+NO_SPACE_LANGUAGES = ("ja", "zh", "ko")
+
+
+def word_separator(language_code: str) -> str:
+    """
+    言語コードに応じた単語間の区切り文字を返す.
+
+    Args:
+        language_code: 言語コード（ja-JP, en-US等）
+
+    Returns:
+        str: 日本語・中国語・韓国語は""、それ以外は" "
+    """
+    return "" if language_code.split("-")[0].lower() in NO_SPACE_LANGUAGES else " "
+
+
+class SegmentBuilder:
+    """
+    単語・句読点を順に受け取り、句読点ごとにセグメントを確定させる.
+
+    テキストはリストに溜めて確定時に一度だけ結合する（文字列の繰り返し連結を避ける）。
+    単語の間にはseparatorを入れ、句読点は直前の単語に続けて付ける。
+    """
+
+    def __init__(self, separator: str = ""):
+        """
+        初期化.
+
+        Args:
+            separator: 単語間の区切り文字（word_separator()の返り値、英語等は" "）
+        """
+        self.separator = separator
+        self._parts: List[str] = []
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        self._confidence: Optional[float] = None
+
+    def add_word(self, word: str, start_time: float, end_time: float, confidence: Optional[float]):
+        """
+        単語を追加.
+
+        Args:
+            word: 単語
+            start_time: 開始時刻（秒）
+            end_time: 終了時刻（秒）
+            confidence: 信頼度
+        """
+        if self._start_time is None:
+            self._start_time = start_time
+        elif self.separator:
+            self._parts.append(self.separator)
+        self._parts.append(word)
+        self._end_time = end_time
+        self._confidence = confidence
+
+    def add_punctuation(self, mark: str) -> Optional[Dict]:
+        """
+        句読点を追加し、セグメントを確定.
+
+        Args:
+            mark: 句読点
+
+        Returns:
+            dict or None: 確定したセグメント（単語がまだない場合はNone）
+        """
+        if self._start_time is None:
+            # 単語を伴わない句読点は時刻を持たないため捨てる
+            return None
+        self._parts.append(mark)
+        return self.flush()
+
+    def flush(self) -> Optional[Dict]:
+        """
+        組み立て中のセグメントを確定.
+
+        Returns:
+            dict or None: 確定したセグメント（空の場合はNone）
+        """
+        segment = None
+        if self._parts:
+            segment = {
+                "text": "".join(self._parts).strip(),
+                "start_time": self._start_time,
+                "end_time": self._end_time,
+                "confidence": self._confidence,
+            }
+        self._parts = []
+        self._start_time = None
+        self._end_time = None
+        self._confidence = None
+        return segment
+
+
+def iter_transcript_segments(items: Iterable[Dict], separator: str = "") -> Iterator[Dict]:
+    """
+    AWS Transcribe結果JSONのitemsから、確定したセグメントを順に返す.
+
+    Args:
+        items: transcript_data["results"]["items"]
+        separator: 単語間の区切り文字（word_separator(language_code)）
+
+    Yields:
+        dict: {"text", "start_time", "end_time", "confidence"}
+    """
+    builder = SegmentBuilder(separator)
+    for item in items:
+        alternative = item["alternatives"][0]
+        if item["type"] == "pronunciation":
+            builder.add_word(
+                alternative["content"],
+                float(item["start_time"]),
+                float(item["end_time"]),
+                float(alternative["confidence"]),
+            )
+        elif item["type"] == "punctuation":
+            segment = builder.add_punctuation(alternative["content"])
+            if segment is not None:
+                yield segment
+
+    segment = builder.flush()
+    if segment is not None:
+        yield segment
+
+
+def offset_transcription(transcription: Dict, offset: float) -> Dict:
+    """
+    書き起こし結果の時刻を一律にずらす（切り出した音声の結果を元の時間軸に戻す）.
+
+    Args:
+        transcription: transcribe_audio()と同じ形式の書き起こし結果
+        offset: 加算する秒数
+
+    Returns:
+        dict: 時刻をずらした新しい書き起こし結果
+    """
+    if not offset:
+        return transcription
+    segments = [
+        {**seg, "start_time": seg["start_time"] + offset, "end_time": seg["end_time"] + offset}
+        for seg in transcription["segments"]
+    ]
+    return {
+        **transcription,
+        "segments": segments,
+        "duration": float(segments[-1]["end_time"]) if segments else transcription["duration"],
+    }
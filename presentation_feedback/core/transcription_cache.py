@@ -0,0 +1,345 @@
+"""書き起こし結果のキャッシュ（音声ファイルのハッシュ・言語・書き起こし方式をキーにする）."""
+
+import abc
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+
+# 環境変数またはデフォルト設定
+CACHE_ENABLED = os.getenv("TRANSCRIPTION_CACHE", "1") != "0"
+CACHE_DIR = os.getenv(
+    "TRANSCRIPTION_CACHE_DIR",
+    str(Path.home() / ".cache" / "presentation_feedback" / "transcriptions"),
+)
+CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPTION_CACHE_MAX_BYTES", str(500 * 1024 * 1024)))
+# S3キャッシュの上限サイズ超過分を削除する間隔（秒、プロセスごと）
+S3_SWEEP_INTERVAL_SEC = float(os.getenv("TRANSCRIPTION_CACHE_S3_SWEEP_SEC", "3600"))
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+def compute_audio_hash(audio_file_path: str) -> str:
+    """
+    音声ファイルのSHA-256を計算（チャンク単位で読み込み、全体をメモリに載せない）.
+
+    キャッシュキーとS3キーの両方に使うため、パス・サイズ・更新時刻が同じなら
+    計算結果を再利用する。
+
+    Args:
+        audio_file_path: 音声ファイルのパス
+
+    Returns:
+        str: 16進数のハッシュ値
+    """
+    stat = os.stat(audio_file_path)
+    return _hash_file(os.path.abspath(audio_file_path), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=128)
+def _hash_file(path: str, size: int, mtime_ns: int) -> str:
+    with open(path, "rb") as f:
+        return compute_fileobj_hash(f)
+
+
+def compute_fileobj_hash(fileobj: BinaryIO) -> str:
+    """
+    ファイルオブジェクトのSHA-256をチャンク単位で計算（計算後は先頭に戻す）.
+
+    Args:
+        fileobj: 先頭にシーク可能なファイルオブジェクト
+
+    Returns:
+        str: 16進数のハッシュ値
+    """
+    digest = hashlib.sha256()
+    fileobj.seek(0)
+    for chunk in iter(lambda: fileobj.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+class CacheBackend(abc.ABC):
+    """キャッシュ保存先の基底クラス."""
+
+    # 上限サイズ超過分を削除する間隔（秒）。0なら保存のたびに削除する
+    sweep_interval_sec: float = 0.0
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """キーに対応するデータを取得（なければNone）."""
+
+    @abc.abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """データを保存."""
+
+    @abc.abstractmethod
+    def entries(self) -> List[Tuple[str, int, float]]:
+        """保存済みエントリの一覧 [(キー, サイズ, 最終アクセスまたは保存時刻), ...] を返す."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """エントリを削除."""
+
+
+class LocalDirectoryBackend(CacheBackend):
+    """ローカルディレクトリに1エントリ1ファイルで保存するバックエンド."""
+
+    def __init__(self, directory: str = CACHE_DIR):
+        """
+        初期化.
+
+        Args:
+            directory: キャッシュディレクトリ
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # mtimeを最終アクセス時刻として使う（LRU用）
+        os.utime(path, None)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def entries(self) -> List[Tuple[str, int, float]]:
+        result = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            result.append((path.stem, stat.st_size, stat.st_mtime))
+        return result
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class S3PrefixBackend(CacheBackend):
+    """
+    S3の指定プレフィックス配下に保存するバックエンド.
+
+    取得のたびにオブジェクトを書き換えるとリクエスト数が倍になるため、
+    最終アクセス時刻は記録しない（古さはLastModified = 保存時刻で判断する）。
+    一覧の取得も保存のたびには行わず、sweep_interval_sec ごとにまとめて削除する。
+    期限で消せばよい場合は、プレフィックスにS3のライフサイクルルール（有効期限）を
+    設定し、TRANSCRIPTION_CACHE_S3_SWEEP_SEC=inf で削除処理を止めてもよい。
+    """
+
+    sweep_interval_sec = S3_SWEEP_INTERVAL_SEC
+
+    def __init__(self, bucket: str, prefix: str = "cache/transcriptions/", s3_client=None):
+        """
+        初期化.
+
+        Args:
+            bucket: S3バケット名
+            prefix: キャッシュを保存するプレフィックス
+            s3_client: boto3 S3クライアント（省略時は共有クライアント）
+        """
+        if s3_client is None:
+            from .aws_clients import get_client
+
+            s3_client = get_client("s3")
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=self._key(key))
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def put(self, key: str, data: bytes) -> None:
+        self.s3_client.put_object(Bucket=self.bucket, Key=self._key(key), Body=data)
+
+    def entries(self) -> List[Tuple[str, int, float]]:
+        result = []
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for obj in page.get("Contents", []):
+                name = obj["Key"][len(self.prefix):]
+                if not name.endswith(".json"):
+                    continue
+                result.append((name[:-len(".json")], obj["Size"], obj["LastModified"].timestamp()))
+        return result
+
+    def delete(self, key: str) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+
+class TranscriptionCache:
+    """(音声ハッシュ, 言語コード, 書き起こし方式と設定) をキーにした書き起こし結果キャッシュ."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, max_bytes: int = CACHE_MAX_BYTES):
+        """
+        初期化.
+
+        Args:
+            backend: 保存先（省略時はローカルディレクトリ）
+            max_bytes: キャッシュ全体の上限サイズ（超えたら古いものから削除）
+        """
+        self.backend = backend if backend is not None else LocalDirectoryBackend()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._last_sweep: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        audio_hash: str,
+        language_code: str,
+        backend: str,
+        options: Optional[Dict] = None,
+    ) -> str:
+        """
+        キャッシュキーを生成.
+
+        方式が違えば結果も違うため、方式名と結果に影響する設定（モデル名・正規化等）を含める。
+        設定はファイル名に使える長さにするためハッシュにする。
+        """
+        key = f"{audio_hash}_{language_code}_{backend}"
+        if options:
+            encoded = json.dumps(options, sort_keys=True).encode("utf-8")
+            key += f"_{hashlib.sha256(encoded).hexdigest()[:16]}"
+        return key
+
+    def get(
+        self,
+        audio_hash: str,
+        language_code: str,
+        backend: str,
+        options: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """
+        キャッシュから書き起こし結果を取得.
+
+        Args:
+            audio_hash: 音声ファイルのSHA-256
+            language_code: 言語コード
+            backend: 書き起こし方式（"batch", "streaming", "local"等）
+            options: 書き起こし結果に影響する設定
+
+        Returns:
+            dict or None: 書き起こし結果（{"text", "segments", "duration"}）
+        """
+        data = self.backend.get(self.make_key(audio_hash, language_code, backend, options))
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(data)
+
+    def put(
+        self,
+        audio_hash: str,
+        language_code: str,
+        backend: str,
+        transcription: Dict,
+        options: Optional[Dict] = None,
+    ) -> None:
+        """
+        書き起こし結果をキャッシュに保存し、上限を超えていれば古いものから削除.
+
+        削除はバックエンドの sweep_interval_sec ごとに行う（S3では一覧の取得を間引く）。
+
+        Args:
+            audio_hash: 音声ファイルのSHA-256
+            language_code: 言語コード
+            backend: 書き起こし方式
+            transcription: 書き起こし結果
+            options: 書き起こし結果に影響する設定
+        """
+        data = json.dumps(transcription, ensure_ascii=False).encode("utf-8")
+        self.backend.put(self.make_key(audio_hash, language_code, backend, options), data)
+
+        now = time.monotonic()
+        with self._lock:
+            if self._last_sweep is not None and now - self._last_sweep < self.backend.sweep_interval_sec:
+                return
+            self._last_sweep = now
+        self._evict()
+
+    def _evict(self) -> None:
+        """最終アクセス（S3では保存）が古い順に上限サイズまで削除."""
+        entries = sorted(self.backend.entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            self.backend.delete(key)
+            total -= size
+
+    def get_stats(self) -> Dict:
+        """
+        ヒット率などの統計を取得.
+
+        Returns:
+            dict: {"hits": int, "misses": int, "hit_rate": float}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_default_cache: Optional[TranscriptionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[TranscriptionCache]:
+    """
+    プロセス共通のキャッシュを取得（TRANSCRIPTION_CACHE=0 の場合はNone）.
+
+    TRANSCRIPTION_CACHE_S3_PREFIX が設定されていればS3、なければローカルディレクトリに保存する。
+
+    Returns:
+        TranscriptionCache or None
+    """
+    global _default_cache
+    if not CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            s3_prefix = os.getenv("TRANSCRIPTION_CACHE_S3_PREFIX")
+            if s3_prefix:
+                backend = S3PrefixBackend(
+                    os.getenv("TRANSCRIBE_S3_BUCKET", "presentation-feedback"), s3_prefix
+                )
+            else:
+                backend = LocalDirectoryBackend()
+            _default_cache = TranscriptionCache(backend)
+        return _default_cache
@@ -0,0 +1,60 @@
+"""アップロードファイルの扱い（チャンク単位のコピー・メモリ計測）."""
+
+import os
+import shutil
+import sys
+import tempfile
+from typing import BinaryIO, Optional
+
+try:
+    import resource
+except ImportError:  # Windowsにはresourceモジュールがない
+    resource = None
+
+
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB
+
+
+def save_upload_to_temp(fileobj: BinaryIO, suffix: str = "", chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """
+    アップロードされたファイルを一時ファイルにチャンク単位でコピー.
+
+    read()で全体を読み込むと、アップロード元のバッファとは別に
+    ファイルサイズ分のbytesが確保されるため、一定サイズずつコピーする。
+
+    Args:
+        fileobj: ファイルオブジェクト（StreamlitのUploadedFile等）
+        suffix: 一時ファイルの拡張子
+        chunk_size: 1回にコピーするバイト数
+
+    Returns:
+        str: 一時ファイルのパス（呼び出し側で削除すること。コピーに失敗した場合はここで削除する）
+    """
+    fileobj.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+        try:
+            shutil.copyfileobj(fileobj, tmp_file, chunk_size)
+        except BaseException:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+        return tmp_file.name
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    """
+    プロセス起動以降のピークメモリ使用量（最大RSS）を取得.
+
+    プロセス全体の最大値のため、特定のアップロードや分析だけの使用量ではない
+    （同じプロセスで処理した他のセッション・過去の分析も含む）。
+
+    Returns:
+        float or None: MB（取得できない環境ではNone）
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linuxはキロバイト、macOSはバイト単位
+    if sys.platform == "darwin":
+        return peak / 1024 / 1024
+    return peak / 1024
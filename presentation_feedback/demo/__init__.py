@@ -13,6 +13,7 @@ from .agents import (
     create_speech_analyzer as create_speech_analyzer_demo,
     create_content_analyzer as create_content_analyzer_demo,
     create_orchestrator_agent as create_orchestrator_agent_demo,
+    create_single_pass_analyzer as create_single_pass_analyzer_demo,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "create_speech_analyzer_demo",
     "create_content_analyzer_demo",
     "create_orchestrator_agent_demo",
+    "create_single_pass_analyzer_demo",
 ]
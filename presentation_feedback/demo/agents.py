@@ -61,6 +61,24 @@ class OrchestratorAgentDemo:
         return get_demo_final_report()
 
 
+class SinglePassAnalyzerDemo:
+    """単一呼び出し分析エージェント（デモ）."""
+
+    def generate_feedback_report(self, transcription: Dict, audio_features: Dict) -> Dict:
+        """
+        最終フィードバックレポートを生成（ダミーデータを返す）.
+
+        Args:
+            transcription: 書き起こし結果（使用しない）
+            audio_features: 音声特徴量（使用しない）
+
+        Returns:
+            dict: ダミーの最終レポート
+        """
+        print("[DEMO] 1回の呼び出しでフィードバックを生成中（ダミーデータ）...")
+        return get_demo_final_report()
+
+
 def create_speech_analyzer() -> SpeechAnalyzerDemo:
     """話し方分析エージェント（デモ）を作成."""
     return SpeechAnalyzerDemo()
@@ -74,3 +92,8 @@ def create_content_analyzer() -> ContentAnalyzerDemo:
 def create_orchestrator_agent() -> OrchestratorAgentDemo:
     """監督者エージェント（デモ）を作成."""
     return OrchestratorAgentDemo()
+
+
+def create_single_pass_analyzer() -> SinglePassAnalyzerDemo:
+    """単一呼び出し分析エージェント（デモ）を作成."""
+    return SinglePassAnalyzerDemo()
@@ -0,0 +1,252 @@
+"""分析パイプライン（話し方分析・内容分析の並列実行 → 統合レポート生成）."""
+
+import asyncio
+import os
+import time
+from typing import AsyncIterator, Callable, Dict, Optional
+
+
+# 分析方式（"multi_agent": 話し方・内容・監督者の3エージェント / "single_pass": 1回の呼び出し）
+ANALYSIS_MODE = os.getenv("ANALYSIS_MODE", "multi_agent")
+ANALYSIS_MODES = ("multi_agent", "single_pass")
+
+
+def _default_factories() -> Dict[str, Callable]:
+    """本番用エージェントのファクトリを返す（strandsの読み込みを遅延させる）."""
+    from .agents import (
+        create_speech_analyzer,
+        create_content_analyzer,
+        create_orchestrator_agent,
+        create_single_pass_analyzer,
+    )
+
+    return {
+        "speech": create_speech_analyzer,
+        "content": create_content_analyzer,
+        "orchestrator": create_orchestrator_agent,
+        "single_pass": create_single_pass_analyzer,
+    }
+
+
+async def _timed(func: Callable, *args):
+    """同期関数を別スレッドで実行し、(結果, 経過秒) を返す."""
+    start = time.perf_counter()
+    result = await asyncio.to_thread(func, *args)
+    return result, time.perf_counter() - start
+
+
+async def _stream_report(events: AsyncIterator[Dict], on_report_event):
+    """
+    統合レポートのストリーミングイベントごとにコールバックを呼ぶ.
+
+    Args:
+        events: stream_feedback_report()の返り値
+
+    Returns:
+        tuple: (最終レポート, 最初の内容が確定するまでの秒)
+    """
+    first_content_time = None
+    report = None
+    start = time.perf_counter()
+    async for event in events:
+        if event["type"] in ("field", "item") and first_content_time is None:
+            first_content_time = time.perf_counter() - start
+        if event["type"] == "report":
+            report = event["report"]
+        on_report_event(event)
+    return report, first_content_time
+
+
+async def run_analysis_pipeline_async(
+    transcription: Dict,
+    audio_features: Dict,
+    speech_analyzer=None,
+    content_analyzer=None,
+    orchestrator=None,
+    on_stage: Optional[Callable[[str], None]] = None,
+    on_report_event: Optional[Callable[[Dict], None]] = None,
+    mode: Optional[str] = None,
+    single_pass_analyzer=None,
+) -> Dict:
+    """
+    話し方分析と内容分析を並列実行し、統合レポートを生成.
+
+    2つの分析は互いの結果を使わないため同時に実行し、
+    監督者エージェントは両方の完了後に実行する。
+    modeが"single_pass"の場合は、単一呼び出し分析エージェントが
+    1回の呼び出しで最終レポートを生成する（話し方・内容の個別の結果はNone）。
+
+    Args:
+        transcription: transcribe_audio()の返り値
+        audio_features: extract_audio_features()の返り値
+        speech_analyzer: 話し方分析エージェント（省略時は本番用を作成）
+        content_analyzer: 内容分析エージェント（省略時は本番用を作成）
+        orchestrator: 監督者エージェント（省略時は本番用を作成）
+        on_stage: ステージ開始時に呼ばれるコールバック（"analysis", "report"）
+        on_report_event: 指定した場合、統合レポートをストリーミング生成し、
+            OrchestratorAgent.stream_feedback_report()のイベントごとに呼ばれる
+            （監督者エージェントがストリーミングに対応していない場合は呼ばれない）
+        mode: 分析方式（"multi_agent", "single_pass"、省略時はANALYSIS_MODE）
+        single_pass_analyzer: 単一呼び出し分析エージェント（single_pass時、省略時は本番用を作成）
+
+    Returns:
+        dict: {
+            "mode": 分析方式,
+            "speech_result": 話し方分析結果,
+            "content_result": 内容分析結果,
+            "report": 最終レポート,
+            "timings": {
+                "speech_analysis": 秒,
+                "content_analysis": 秒,
+                "analysis": 並列分析全体の秒,
+                "report": 秒,
+                "report_first_content": 最初の内容が確定するまでの秒（ストリーミング時のみ）,
+                "total": 秒
+            }
+        }
+
+    Raises:
+        ValueError: 未対応の分析方式の場合
+    """
+    mode = mode or ANALYSIS_MODE
+    if mode not in ANALYSIS_MODES:
+        raise ValueError(f"未対応の分析方式です: {mode}（{' / '.join(ANALYSIS_MODES)}）")
+    if mode == "single_pass":
+        if single_pass_analyzer is None:
+            single_pass_analyzer = _default_factories()["single_pass"]()
+        return await _run_single_pass(
+            single_pass_analyzer, transcription, audio_features, on_stage, on_report_event
+        )
+
+    if speech_analyzer is None or content_analyzer is None or orchestrator is None:
+        factories = _default_factories()
+        speech_analyzer = speech_analyzer or factories["speech"]()
+        content_analyzer = content_analyzer or factories["content"]()
+        orchestrator = orchestrator or factories["orchestrator"]()
+
+    total_start = time.perf_counter()
+
+    # 1. 話し方分析・内容分析（並列）
+    if on_stage:
+        on_stage("analysis")
+    analysis_start = time.perf_counter()
+    (speech_result, speech_time), (content_result, content_time) = await asyncio.gather(
+        _timed(speech_analyzer.analyze_speech, transcription, audio_features),
+        _timed(content_analyzer.analyze_content, transcription),
+    )
+    analysis_time = time.perf_counter() - analysis_start
+
+    # 2. 統合レポート生成
+    if on_stage:
+        on_stage("report")
+    first_content_time = None
+    if on_report_event is not None and hasattr(orchestrator, "stream_feedback_report"):
+        report_start = time.perf_counter()
+        report, first_content_time = await _stream_report(
+            orchestrator.stream_feedback_report(speech_result, content_result), on_report_event
+        )
+        report_time = time.perf_counter() - report_start
+    else:
+        report, report_time = await _timed(
+            orchestrator.generate_feedback_report, speech_result, content_result
+        )
+
+    return {
+        "mode": "multi_agent",
+        "speech_result": speech_result,
+        "content_result": content_result,
+        "report": report,
+        "timings": {
+            "speech_analysis": speech_time,
+            "content_analysis": content_time,
+            "analysis": analysis_time,
+            "report": report_time,
+            "report_first_content": first_content_time,
+            "total": time.perf_counter() - total_start,
+        },
+    }
+
+
+async def _run_single_pass(
+    analyzer,
+    transcription: Dict,
+    audio_features: Dict,
+    on_stage: Optional[Callable[[str], None]],
+    on_report_event: Optional[Callable[[Dict], None]],
+) -> Dict:
+    """単一呼び出しで最終レポートを生成（返り値はrun_analysis_pipeline_async()と同じ形式）."""
+    total_start = time.perf_counter()
+    if on_stage:
+        on_stage("report")
+    first_content_time = None
+    if on_report_event is not None and hasattr(analyzer, "stream_feedback_report"):
+        report_start = time.perf_counter()
+        report, first_content_time = await _stream_report(
+            analyzer.stream_feedback_report(transcription, audio_features), on_report_event
+        )
+        report_time = time.perf_counter() - report_start
+    else:
+        report, report_time = await _timed(
+            analyzer.generate_feedback_report, transcription, audio_features
+        )
+
+    return {
+        "mode": "single_pass",
+        "speech_result": None,
+        "content_result": None,
+        "report": report,
+        "timings": {
+            "speech_analysis": 0.0,
+            "content_analysis": 0.0,
+            "analysis": 0.0,
+            "report": report_time,
+            "report_first_content": first_content_time,
+            "total": time.perf_counter() - total_start,
+        },
+    }
+
+
+def run_analysis_pipeline(
+    transcription: Dict,
+    audio_features: Dict,
+    speech_analyzer=None,
+    content_analyzer=None,
+    orchestrator=None,
+    on_stage: Optional[Callable[[str], None]] = None,
+    on_report_event: Optional[Callable[[Dict], None]] = None,
+    mode: Optional[str] = None,
+    single_pass_analyzer=None,
+) -> Dict:
+    """
+    run_analysis_pipeline_async() の同期ラッパー.
+
+    Streamlit や CLI など、イベントループを持たない呼び出し元から使用する。
+
+    Args:
+        transcription: transcribe_audio()の返り値
+        audio_features: extract_audio_features()の返り値
+        speech_analyzer: 話し方分析エージェント（省略時は本番用を作成）
+        content_analyzer: 内容分析エージェント（省略時は本番用を作成）
+        orchestrator: 監督者エージェント（省略時は本番用を作成）
+        on_stage: ステージ開始時に呼ばれるコールバック
+        on_report_event: 統合レポートのストリーミングイベントごとに呼ばれるコールバック
+            （イベントループと同じ、呼び出し元のスレッドで呼ばれる）
+        mode: 分析方式（"multi_agent", "single_pass"）
+        single_pass_analyzer: 単一呼び出し分析エージェント
+
+    Returns:
+        dict: run_analysis_pipeline_async() と同じ
+    """
+    return asyncio.run(
+        run_analysis_pipeline_async(
+            transcription,
+            audio_features,
+            speech_analyzer=speech_analyzer,
+            content_analyzer=content_analyzer,
+            orchestrator=orchestrator,
+            on_stage=on_stage,
+            on_report_event=on_report_event,
+            mode=mode,
+            single_pass_analyzer=single_pass_analyzer,
+        )
+    )
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""音声特徴量抽出のベンチマーク（旧ループ実装 vs 列指向ベクトル化実装）."""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# リポジトリルートをimportパスに追加（scripts/から直接実行するため）
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from presentation_feedback.core.audio_features import (
+    calculate_pause_stats,
+    calculate_speaking_rate,
+    segments_to_arrays,
+)
+from presentation_feedback.core.filler_words import detect_filler_words
+
+
+def make_transcription(n_segments: int, seed: int = 0) -> dict:
+    """ダミーの書き起こし結果を生成."""
+    rng = random.Random(seed)
+    segments = []
+    t = 0.0
+    for _ in range(n_segments):
+        duration = rng.uniform(1.0, 8.0)
+        segments.append({
+            "text": "あ" * rng.randint(5, 60),
+            "start_time": t,
+            "end_time": t + duration,
+            "confidence": rng.uniform(0.8, 1.0),
+        })
+        t += duration + rng.choice([0.1, 0.3, 0.6, 1.2, 3.5])
+    return {"text": "", "segments": segments, "duration": t}
+
+
+def legacy_extract(transcription: dict) -> dict:
+    """リファクタリング前の実装（特徴量ごとにdictのリストをループ）."""
+    segments = transcription["segments"]
+
+    total_chars = sum(len(seg["text"]) for seg in segments)
+    total_time = sum(seg["end_time"] - seg["start_time"] for seg in segments) / 60
+    speaking_rate = total_chars / total_time if total_time > 0 else 0.0
+
+    pauses = []
+    long_pauses = []
+    for i in range(len(segments) - 1):
+        pause_duration = segments[i + 1]["start_time"] - segments[i]["end_time"]
+        if pause_duration >= 0.5:
+            pauses.append(pause_duration)
+            if pause_duration >= 3.0:
+                long_pauses.append({"time": segments[i]["end_time"], "duration": pause_duration})
+    avg = sum(pauses) / len(pauses) if pauses else 0.0
+
+    return {
+        "speaking_rate": speaking_rate,
+        "pauses": {"total": len(pauses), "avg_duration": avg, "long_pauses": long_pauses},
+    }
+
+
+def vectorized_extract(transcription: dict) -> dict:
+    """新実装（extract_audio_features()のうち旧実装と同じ話速・ポーズの部分、列変換込み）."""
+    arrays = segments_to_arrays(transcription["segments"])
+    return {
+        "speaking_rate": calculate_speaking_rate(arrays),
+        "pauses": calculate_pause_stats(arrays),
+    }
+
+
+def best_of(func, arg, repeat: int = 7) -> float:
+    """repeat回実行した最短時間（秒、timeitと同じくGCを止めて計測）."""
+    return min(timeit.repeat(lambda: func(arg), number=1, repeat=repeat))
+
+
+def main():
+    """メイン処理."""
+    for n_segments in (10_000, 100_000):
+        transcription = make_transcription(n_segments)
+
+        legacy = legacy_extract(transcription)
+        new = vectorized_extract(transcription)
+        assert legacy["pauses"]["total"] == new["pauses"]["total"]
+        assert legacy["pauses"]["long_pauses"] == new["pauses"]["long_pauses"]
+        assert abs(legacy["speaking_rate"] - new["speaking_rate"]) < 1e-6
+
+        arrays = segments_to_arrays(transcription["segments"])
+        legacy_time = best_of(legacy_extract, transcription)
+        convert_time = best_of(segments_to_arrays, transcription["segments"])
+        compute_time = best_of(
+            lambda a: (calculate_speaking_rate(a), calculate_pause_stats(a)), arrays
+        )
+        new_time = best_of(vectorized_extract, transcription)
+        filler_time = best_of(detect_filler_words, transcription["segments"], repeat=1)
+
+        print(f"=== {n_segments:,} segments ===")
+        print(f"  旧実装:             {legacy_time * 1000:8.1f} ms")
+        print(f"  列変換:             {convert_time * 1000:8.1f} ms")
+        print(f"  ベクトル化計算:     {compute_time * 1000:8.1f} ms（{legacy_time / compute_time:.1f}x）")
+        print(f"  合計（列変換込み）: {new_time * 1000:8.1f} ms（{legacy_time / new_time:.1f}x）")
+        # extract_audio_features()はこの他にフィラー検出を行う（旧実装にはないため比較対象外）
+        print(f"  参考: フィラー検出: {filler_time * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
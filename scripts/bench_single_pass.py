@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""分析方式のベンチマーク（3エージェント vs 単一呼び出し、デモの書き起こしで実際にBedrockを呼ぶ）."""
+
+import argparse
+import os
+import statistics
+import sys
+from pathlib import Path
+
+# 応答キャッシュを使うと2回目以降がBedrockを呼ばなくなるため無効化（インポート前に設定）
+os.environ["AGENT_RESPONSE_CACHE"] = "0"
+
+# リポジトリルートをimportパスに追加（scripts/から直接実行するため）
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from presentation_feedback import run_analysis_pipeline
+from presentation_feedback.agents.utils import USAGE_TOKEN_KEYS, merge_usage
+from presentation_feedback.core.audio_features import extract_audio_features
+from presentation_feedback.demo import get_demo_transcription
+from presentation_feedback.pipeline import ANALYSIS_MODES
+
+
+def total_usage(pipeline_result: dict) -> dict:
+    """パイプラインの全呼び出しのトークン使用量を合計."""
+    results = [
+        pipeline_result["speech_result"],
+        pipeline_result["content_result"],
+        pipeline_result["report"],
+    ]
+    return merge_usage(result.get("usage", {}) for result in results if result is not None)
+
+
+def main():
+    """メイン処理."""
+    parser = argparse.ArgumentParser(description="分析方式のベンチマーク（要AWS認証情報）")
+    parser.add_argument("--runs", type=int, default=3, help="方式ごとの実行回数（デフォルト: 3）")
+    args = parser.parse_args()
+
+    transcription = get_demo_transcription()
+    audio_features = extract_audio_features(transcription)
+
+    summary = {}
+    for mode in ANALYSIS_MODES:
+        print(f"=== {mode} ===")
+        times, usages = [], []
+        for i in range(args.runs):
+            result = run_analysis_pipeline(transcription, audio_features, mode=mode)
+            usage = total_usage(result)
+            times.append(result["timings"]["total"])
+            usages.append(usage)
+            print(
+                f"  run {i + 1}: {result['timings']['total']:6.2f}秒, "
+                f"入力 {usage['input_tokens']:,} / 出力 {usage['output_tokens']:,}トークン / "
+                f"呼び出し {usage['calls']}回"
+            )
+        summary[mode] = {
+            "time": statistics.median(times),
+            **{key: statistics.median(u[key] for u in usages) for key in USAGE_TOKEN_KEYS},
+        }
+
+    print("\n=== 中央値 ===")
+    for mode, stats in summary.items():
+        print(
+            f"  {mode:12s}: {stats['time']:6.2f}秒, "
+            f"入力 {stats['input_tokens']:8,.0f} / 出力 {stats['output_tokens']:7,.0f}トークン"
+        )
+    base, fast = summary["multi_agent"], summary["single_pass"]
+    print(
+        f"\n  single_pass / multi_agent: 時間 {fast['time'] / base['time']:.0%}, "
+        f"入力 {fast['input_tokens'] / max(base['input_tokens'], 1):.0%}, "
+        f"出力 {fast['output_tokens'] / max(base['output_tokens'], 1):.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""書き起こし結果パーサーのベンチマーク（旧実装 vs ジェネレータ実装、JSON全体の読み込み vs ストリーミング）."""
+
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# リポジトリルートをimportパスに追加（scripts/から直接実行するため）
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from presentation_feedback.core.transcript_json import parse_transcript_stream
+from presentation_feedback.core.transcript_segments import iter_transcript_segments
+
+# requestsのiter_content()で読む断片の大きさ（transcriber.TRANSCRIPT_READ_CHUNK_BYTESと同じ）
+READ_CHUNK_BYTES = 64 * 1024
+
+
+def make_items(n_items: int, seed: int = 0) -> list:
+    """Transcribe結果JSONのitemsを模したダミーデータを生成（約8語ごとに句読点）."""
+    rng = random.Random(seed)
+    items = []
+    t = 0.0
+    for i in range(n_items):
+        if i % 8 == 7:
+            items.append({"type": "punctuation", "alternatives": [{"content": "。"}]})
+            continue
+        duration = rng.uniform(0.1, 0.5)
+        items.append({
+            "type": "pronunciation",
+            "start_time": f"{t:.3f}",
+            "end_time": f"{t + duration:.3f}",
+            "alternatives": [{"content": "単語" * rng.randint(1, 3), "confidence": "0.95"}],
+        })
+        t += duration + rng.uniform(0.0, 0.3)
+    return items
+
+
+def legacy_parse(items: list) -> list:
+    """リファクタリング前の実装（文字列連結 + copy）."""
+    segments = []
+    current_segment = {"text": "", "start_time": None, "end_time": None}
+    for item in items:
+        if item["type"] == "pronunciation":
+            word = item["alternatives"][0]["content"]
+            start_time = float(item["start_time"])
+            end_time = float(item["end_time"])
+            confidence = float(item["alternatives"][0]["confidence"])
+            if current_segment["start_time"] is None:
+                current_segment["start_time"] = start_time
+            current_segment["text"] += word
+            current_segment["end_time"] = end_time
+            current_segment["confidence"] = confidence
+        elif item["type"] == "punctuation":
+            current_segment["text"] += item["alternatives"][0]["content"]
+            if current_segment["text"]:
+                segments.append(current_segment.copy())
+                current_segment = {"text": "", "start_time": None, "end_time": None}
+    if current_segment["text"]:
+        segments.append(current_segment)
+    return segments
+
+
+def make_document(items: list) -> list:
+    """結果JSONを模したバイト列を、ダウンロード時と同じ大きさの断片に分けて返す."""
+    document = {
+        "jobName": "bench",
+        "results": {
+            "transcripts": [{"transcript": "".join(i["alternatives"][0]["content"] for i in items)}],
+            "items": items,
+            # 実際の結果JSONと同様、itemsと同程度の大きさのaudio_segmentsを付ける
+            "audio_segments": [{"id": n, "items": list(range(n * 8, n * 8 + 8))} for n in range(len(items) // 8)],
+        },
+        "status": "COMPLETED",
+    }
+    data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    return [data[i:i + READ_CHUNK_BYTES] for i in range(0, len(data), READ_CHUNK_BYTES)]
+
+
+def load_whole_document(chunks: list) -> list:
+    """旧実装の取得方法（response.json() と同じく全体を結合してからパース）."""
+    data = json.loads(b"".join(chunks))
+    return list(iter_transcript_segments(data["results"]["items"]))
+
+
+def measure(func, arg):
+    """実行時間（秒）とピークメモリ（MB）を計測."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(arg)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def main():
+    """メイン処理."""
+    for n_items in (10_000, 100_000):
+        items = make_items(n_items)
+        legacy, legacy_time, legacy_peak = measure(legacy_parse, items)
+        new, new_time, new_peak = measure(lambda it: list(iter_transcript_segments(it)), items)
+        # ストリーミング消費時（セグメントを保持しない）のピークメモリ
+        _, stream_time, stream_peak = measure(
+            lambda it: sum(1 for _ in iter_transcript_segments(it)), items
+        )
+
+        assert [s["text"] for s in legacy] == [s["text"] for s in new]
+
+        print(f"=== {n_items:,} items ({len(new):,} segments) ===")
+        print(f"  旧実装:           {legacy_time * 1000:8.1f} ms, peak {legacy_peak:6.2f} MB")
+        print(f"  ジェネレータ(list): {new_time * 1000:8.1f} ms, peak {new_peak:6.2f} MB")
+        print(f"  ジェネレータ(逐次): {stream_time * 1000:8.1f} ms, peak {stream_peak:6.2f} MB")
+
+        # 結果JSONのバイト列から: 全体を読み込む場合とストリーミングでパースする場合
+        chunks = make_document(items)
+        size_mb = sum(len(c) for c in chunks) / 1024 / 1024
+        whole, whole_time, whole_peak = measure(load_whole_document, chunks)
+        streamed, streamed_time, streamed_peak = measure(
+            lambda c: parse_transcript_stream(iter(c))["segments"], chunks
+        )
+        assert whole == streamed
+        print(f"  JSON {size_mb:.1f} MB 全体読み込み: {whole_time * 1000:8.1f} ms, peak {whole_peak:6.2f} MB")
+        print(f"  JSON {size_mb:.1f} MB ストリーミング: {streamed_time * 1000:8.1f} ms, peak {streamed_peak:6.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
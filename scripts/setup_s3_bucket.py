@@ -3,10 +3,15 @@
 
 import os
 import sys
+from pathlib import Path
 
-import boto3
 from botocore.exceptions import ClientError
 
+# リポジトリルートをimportパスに追加（scripts/から直接実行するため）
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from presentation_feedback.core.aws_clients import get_client
+
 
 def setup_s3_bucket(bucket_name: str, region: str = "us-west-2"):
     """
@@ -16,7 +21,7 @@ def setup_s3_bucket(bucket_name: str, region: str = "us-west-2"):
         bucket_name: バケット名
         region: AWSリージョン
     """
-    s3_client = boto3.client("s3", region_name=region)
+    s3_client = get_client("s3", region_name=region)
 
     try:
         # バケットの存在確認
@@ -0,0 +1,85 @@
+"""テスト用のTranscribe Streamingフェイクサーバー（SDKのクライアントと同じインターフェース）."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+
+# 16kHz/16bit/モノラルPCMの1秒あたりのバイト数
+BYTES_PER_SEC = 16000 * 2
+
+
+def _item(item_type: str, content: str, start: float, end: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        item_type=item_type, content=content, start_time=start, end_time=end, confidence=0.9
+    )
+
+
+def _result(utterance: Dict, is_partial: bool) -> SimpleNamespace:
+    items = [_item("pronunciation", *word) for word in utterance["words"]]
+    if not is_partial and utterance.get("punctuation"):
+        end = utterance["words"][-1][2]
+        items.append(_item("punctuation", utterance["punctuation"], end, end))
+    return SimpleNamespace(
+        is_partial=is_partial,
+        alternatives=[SimpleNamespace(transcript=utterance["transcript"], items=items)],
+    )
+
+
+class _InputStream:
+    def __init__(self, server: "FakeTranscribeStreamingServer"):
+        self._server = server
+
+    async def send_audio_event(self, audio_chunk: bytes) -> None:
+        if self._server.fail_after_chunks is not None and (
+            self._server.chunks_received >= self._server.fail_after_chunks
+        ):
+            raise ConnectionResetError("fake server closed the stream")
+        self._server.chunks_received += 1
+        await self._server._audio.put(audio_chunk)
+
+    async def end_stream(self) -> None:
+        await self._server._audio.put(None)
+
+
+class FakeTranscribeStreamingServer:
+    """
+    受け取った音声の長さに応じて、台本の発話を途中結果→確定結果の順に返すフェイクサーバー.
+
+    transcribe_audio_streaming_async(client=...) に渡して使う。
+    """
+
+    def __init__(self, utterances: List[Dict], fail_after_chunks: Optional[int] = None):
+        """
+        初期化.
+
+        Args:
+            utterances: [{"transcript": str, "words": [(単語, 開始, 終了), ...], "punctuation": str}, ...]
+            fail_after_chunks: この数のチャンクを受け取った後の送信をエラーにする
+        """
+        self.utterances = utterances
+        self.fail_after_chunks = fail_after_chunks
+        self.chunks_received = 0
+        self.bytes_received = 0
+        self.request: Dict = {}
+        self._audio: asyncio.Queue = asyncio.Queue()
+
+    async def start_stream_transcription(self, **kwargs) -> SimpleNamespace:
+        self.request = kwargs
+        return SimpleNamespace(input_stream=_InputStream(self), output_stream=self._events())
+
+    async def _events(self):
+        pending = list(self.utterances)
+        while True:
+            chunk = await self._audio.get()
+            if chunk is None:
+                break
+            self.bytes_received += len(chunk)
+            received_sec = self.bytes_received / BYTES_PER_SEC
+            # 発話の終わりまで音声が届いたら確定結果を返す（それまでは途中結果）
+            while pending and pending[0]["words"][-1][2] <= received_sec:
+                utterance = pending.pop(0)
+                yield SimpleNamespace(transcript=SimpleNamespace(results=[_result(utterance, True)]))
+                yield SimpleNamespace(transcript=SimpleNamespace(results=[_result(utterance, False)]))
+        for utterance in pending:
+            yield SimpleNamespace(transcript=SimpleNamespace(results=[_result(utterance, False)]))
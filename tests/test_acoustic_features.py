@@ -0,0 +1,95 @@
+"""acoustic_features（波形からの音量・無音区間・ピッチ）のテスト（合成信号で検証）."""
+
+import numpy as np
+import pytest
+
+from presentation_feedback.core.acoustic_features import HOP_SEC, analyze_pcm_chunks
+
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds, hz, amplitude=0.5):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return amplitude * np.sin(2 * np.pi * hz * t)
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE))
+
+
+def to_pcm(signal):
+    return (signal * 32767).astype(np.int16)
+
+
+# 無音1秒 → 200Hz 2秒 → 無音0.5秒 → 150Hz 1秒 → 無音0.2秒（最短の無音区間0.3秒未満）
+SIGNAL = to_pcm(np.concatenate([
+    silence(1.0), tone(2.0, 200), silence(0.5), tone(1.0, 150), silence(0.2),
+]))
+
+
+def test_rms_of_sine_wave():
+    result = analyze_pcm_chunks([to_pcm(tone(1.0, 200, amplitude=0.5))], SAMPLE_RATE)
+    # 振幅0.5の正弦波のRMSは0.5/√2 → 約-9.03 dBFS
+    expected_db = 20 * np.log10(0.5 / np.sqrt(2))
+    assert result["energy"]["mean_db"] == pytest.approx(expected_db, abs=0.1)
+    assert result["energy"]["variation_db"] < 0.1
+    assert result["silences"]["total"] == 0
+
+
+def test_silence_detection_and_speech_range():
+    result = analyze_pcm_chunks([SIGNAL], SAMPLE_RATE)
+
+    assert result["duration"] == pytest.approx(4.7)
+    # フレーム（32ms）の一部でも音があれば有音になるため、境界はフレーム長の範囲でずれる
+    assert result["speech_start"] == pytest.approx(1.0, abs=0.04)
+    assert result["speech_end"] == pytest.approx(4.5, abs=HOP_SEC)
+
+    segments = result["silences"]["segments"]
+    assert len(segments) == 2  # 末尾の0.2秒は短いため数えない
+    assert segments[0]["start"] == 0.0
+    assert segments[0]["duration"] == pytest.approx(1.0, abs=0.04)
+    assert segments[1]["start"] == pytest.approx(3.0, abs=HOP_SEC)
+    assert segments[1]["duration"] == pytest.approx(0.5, abs=0.04)
+    assert result["silences"]["long_silences"] == []
+
+
+def test_long_silence():
+    signal = to_pcm(np.concatenate([tone(0.5, 200), silence(3.5), tone(0.5, 200)]))
+    long_silences = analyze_pcm_chunks([signal], SAMPLE_RATE)["silences"]["long_silences"]
+    assert len(long_silences) == 1
+    assert long_silences[0]["duration"] == pytest.approx(3.5, abs=0.04)
+
+
+@pytest.mark.parametrize("hz", [120.0, 200.0, 300.0])
+def test_known_pitch(hz):
+    pitch = analyze_pcm_chunks([to_pcm(tone(1.0, hz))], SAMPLE_RATE)["pitch"]
+    assert pitch["mean_hz"] == pytest.approx(hz, rel=0.03)
+    assert pitch["voiced_ratio"] == 1.0
+
+
+def test_silence_only_has_no_pitch_or_speech():
+    result = analyze_pcm_chunks([to_pcm(silence(1.0))], SAMPLE_RATE)
+    assert result["pitch"]["voiced_ratio"] == 0.0
+    assert result["pitch"]["mean_hz"] == 0.0
+    assert result["speech_end"] == 0.0
+    assert result["energy"]["max_db"] == 0.0
+
+
+def test_result_does_not_depend_on_chunk_size():
+    whole = analyze_pcm_chunks([SIGNAL], SAMPLE_RATE)
+    split = analyze_pcm_chunks(np.array_split(SIGNAL, 37), SAMPLE_RATE)
+
+    assert split["silences"] == whole["silences"]
+    assert (split["speech_start"], split["speech_end"]) == (whole["speech_start"], whole["speech_end"])
+    assert split["pitch"]["mean_hz"] == pytest.approx(whole["pitch"]["mean_hz"])
+    assert split["energy"]["mean_db"] == pytest.approx(whole["energy"]["mean_db"])
+
+
+def test_without_pitch_matches_full_analysis():
+    full = analyze_pcm_chunks([SIGNAL], SAMPLE_RATE)
+    silences_only = analyze_pcm_chunks([SIGNAL], SAMPLE_RATE, with_pitch=False)
+
+    assert "pitch" not in silences_only
+    assert silences_only["silences"] == full["silences"]
+    assert (silences_only["speech_start"], silences_only["speech_end"]) == (full["speech_start"], full["speech_end"])
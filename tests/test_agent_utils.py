@@ -0,0 +1,49 @@
+"""エージェント共通ユーティリティ（応答テキストの取り出し・パース・使用量）のテスト."""
+
+from types import SimpleNamespace
+
+from presentation_feedback.agents.orchestrator import parse_report
+from presentation_feedback.agents.utils import get_response_text, merge_usage, parse_agent_response
+
+
+REASONING = {"reasoningContent": {"reasoningText": {"text": "考え中"}}}
+
+
+def make_result(*blocks, cached=False):
+    return SimpleNamespace(
+        message={"role": "assistant", "content": list(blocks)},
+        metrics=SimpleNamespace(accumulated_usage={"inputTokens": 10, "outputTokens": 5}),
+        cached=cached,
+    )
+
+
+def test_text_blocks_are_joined_and_other_blocks_ignored():
+    result = make_result(REASONING, {"text": '{"summary": '}, {"toolUse": {"name": "calc"}}, {"text": '"ok"}'})
+    assert get_response_text(result) == '{"summary": "ok"}'
+    assert get_response_text(make_result(REASONING)) == ""
+
+
+def test_parse_agent_response_when_first_block_is_not_text():
+    parsed = parse_agent_response(make_result(REASONING, {"text": '```json\n{"summary": "ok"}\n```'}))
+    assert parsed["summary"] == "ok"
+    assert parsed["usage"]["calls"] == 1
+    assert parsed["usage"]["cached_calls"] == 0
+
+
+def test_report_fallback_uses_text_blocks():
+    report = parse_report(make_result(REASONING, {"text": "JSONではない講評"}))
+    assert report["summary"] == "JSONではない講評"
+    assert report["detailed_feedback"] == "JSONではない講評"
+
+
+def test_merge_usage():
+    usages = [
+        parse_agent_response(make_result({"text": "{}"}))["usage"],
+        parse_agent_response(make_result({"text": "{}"}, cached=True))["usage"],
+    ]
+    merged = merge_usage(usages)
+    assert (merged["input_tokens"], merged["output_tokens"]) == (20, 10)
+    assert (merged["calls"], merged["cached_calls"]) == (2, 1)
+    assert merge_usage([]) == {
+        "input_tokens": 0, "output_tokens": 0, "calls": 0, "cached_calls": 0,
+    }
@@ -0,0 +1,70 @@
+"""audio_features（話速・ポーズ統計）の回帰テスト.
+
+期待値はNumPy化する前の実装（セグメントをPythonのループで走査していた版）で
+同じ入力を計算した値に固定している。
+"""
+
+import pytest
+
+from presentation_feedback.core.audio_features import (
+    calculate_pause_stats,
+    calculate_speaking_rate,
+    extract_audio_features,
+    segments_to_arrays,
+)
+
+
+def make_segment(start, end, text):
+    return {"start_time": start, "end_time": end, "text": text, "speaker": "spk_0"}
+
+
+SEGMENTS = [
+    make_segment(0.0, 2.0, "今日はクラウドの話をします"),
+    make_segment(2.3, 5.0, "まず背景から説明します"),   # 間0.3秒: ポーズではない
+    make_segment(5.8, 9.0, "えーと、次に構成です"),      # 間0.8秒
+    make_segment(12.5, 15.0, "最後にまとめます"),        # 間3.5秒: 長いポーズ
+    make_segment(15.5, 17.0, "以上です"),                # 間0.5秒: 閾値ちょうど
+]
+
+
+def test_speaking_rate_matches_baseline():
+    # 46文字 / 11.9秒
+    assert calculate_speaking_rate(SEGMENTS) == pytest.approx(231.93277310924370)
+
+
+def test_pause_stats_match_baseline():
+    stats = calculate_pause_stats(SEGMENTS)
+
+    assert stats["total"] == 3
+    assert stats["avg_duration"] == pytest.approx(1.6)
+    assert stats["long_pauses"] == [{"time": 9.0, "duration": pytest.approx(3.5)}]
+    assert stats["percentiles"]["p50"] == pytest.approx(0.8)
+    assert stats["percentiles"]["p90"] == pytest.approx(2.96)
+
+
+def test_list_and_arrays_give_the_same_result():
+    arrays = segments_to_arrays(SEGMENTS)
+    assert calculate_speaking_rate(arrays) == calculate_speaking_rate(SEGMENTS)
+    assert calculate_pause_stats(arrays) == calculate_pause_stats(SEGMENTS)
+    assert arrays["chars"].tolist() == [13, 11, 10, 8, 4]
+
+
+def test_empty_and_single_segment():
+    assert calculate_speaking_rate([]) == 0.0
+    assert calculate_pause_stats([]) == {
+        "total": 0,
+        "avg_duration": 0.0,
+        "long_pauses": [],
+        "percentiles": {"p50": 0.0, "p90": 0.0},
+    }
+
+    single = [make_segment(1.0, 4.0, "こんにちは")]
+    assert calculate_speaking_rate(single) == pytest.approx(100.0)
+    assert calculate_pause_stats(single)["total"] == 0
+
+
+def test_extract_audio_features_keys():
+    features = extract_audio_features({"segments": SEGMENTS, "language_code": "ja-JP"})
+    assert set(features) == {"speaking_rate", "filler_words", "pauses"}
+    assert features["speaking_rate"] == pytest.approx(231.93277310924370)
+    assert features["pauses"]["total"] == 3
@@ -0,0 +1,186 @@
+"""audio_normalizer（16kHzモノラル変換・前後の無音除去・保存先の上限）のテスト."""
+
+import os
+import shutil
+import sys
+import wave
+
+import numpy as np
+import pytest
+
+from presentation_feedback.core import audio_decoder, audio_normalizer
+from presentation_feedback.core.audio_normalizer import _ffmpeg_command, normalize_audio
+from presentation_feedback.core.media_probe import probe_media
+
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds, hz=200.0, amplitude=0.5, sample_rate=SAMPLE_RATE):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return amplitude * np.sin(2 * np.pi * hz * t)
+
+
+def silence(seconds, sample_rate=SAMPLE_RATE):
+    return np.zeros(int(seconds * sample_rate))
+
+
+# 無音2秒 → 発話3秒 → 無音1.5秒
+SIGNAL = np.concatenate([silence(2.0), tone(3.0), silence(1.5)])
+
+
+def write_wav(path, signal, sample_rate=SAMPLE_RATE, channels=1):
+    pcm = (signal * 32767).astype(np.int16)
+    if channels == 2:
+        pcm = np.repeat(pcm, 2)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch, tmp_path):
+    """
+    ffmpegの代わりのPythonプロセスを使う.
+
+    デコード（無音区間の解析）は用意したPCMをそのまま出力し、
+    変換は出力先に固定のバイト列を書き、切り出し範囲を記録する。
+    """
+    pcm_path = tmp_path / "signal.pcm"
+    pcm_path.write_bytes((SIGNAL * 32767).astype(np.int16).tobytes())
+    decode_script = f"import shutil, sys; shutil.copyfileobj(open({str(pcm_path)!r}, 'rb'), sys.stdout.buffer)"
+    monkeypatch.setattr(audio_decoder, "_ffmpeg_command", lambda path, rate: [sys.executable, "-c", decode_script])
+
+    conversions = []
+
+    def convert_command(audio_file_path, output_path, codec, start, duration):
+        conversions.append({"codec": codec, "start": start, "duration": duration})
+        script = f"open({output_path!r}, 'wb').write(b'x' * 100)"
+        return [sys.executable, "-c", script]
+
+    monkeypatch.setattr(audio_normalizer, "_ffmpeg_command", convert_command)
+    return conversions
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "talk.wav"
+    write_wav(path, SIGNAL)
+    return str(path)
+
+
+def test_ffmpeg_command_outputs_16khz_mono_flac_with_trim():
+    command = _ffmpeg_command("in.mp3", "out.flac", "flac", start=1.75, duration=3.5)
+
+    assert command[command.index("-ss") + 1] == "1.750"
+    assert command.index("-ss") < command.index("-i")  # 入力側のシーク（先頭をデコードしない）
+    assert command[command.index("-t") + 1] == "3.500"
+    assert command[command.index("-ac") + 1] == "1"
+    assert command[command.index("-ar") + 1] == "16000"
+    assert command[command.index("-c:a") + 1] == "flac"
+    assert command[-1] == "out.flac"
+
+
+def test_ffmpeg_command_opus_without_trim():
+    command = _ffmpeg_command("in.mp3", "out.ogg", "opus", start=0.0, duration=None)
+
+    assert "-ss" not in command and "-t" not in command
+    assert command[command.index("-c:a") + 1] == "libopus"
+    assert command[command.index("-b:a") + 1] == audio_normalizer.OPUS_BITRATE
+
+
+def test_leading_and_trailing_silence_is_trimmed(fake_ffmpeg, source, tmp_path):
+    result = normalize_audio(source, codec="flac", cache_dir=str(tmp_path / "normalized"))
+
+    # 発話（2.0〜5.0秒）の前後に余白を残す
+    padding = audio_normalizer.TRIM_PADDING_SEC
+    assert fake_ffmpeg[0]["start"] == pytest.approx(2.0 - padding, abs=0.05)
+    assert fake_ffmpeg[0]["duration"] == pytest.approx(3.0 + 2 * padding, abs=0.05)
+    assert result["trim_offset"] == fake_ffmpeg[0]["start"]
+    assert result["path"].endswith(".flac")
+    assert result["output_bytes"] == 100
+    assert result["bytes_saved"] == os.path.getsize(source) - 100
+    assert not result["cached"]
+
+
+def test_precomputed_analysis_is_reused(fake_ffmpeg, source, tmp_path, monkeypatch):
+    def fail(path):
+        raise AssertionError("音声を再度解析しないこと")
+
+    monkeypatch.setattr(audio_normalizer, "extract_silences", fail)
+    acoustic = {"duration": 10.0, "speech_start": 4.0, "speech_end": 6.0}
+
+    result = normalize_audio(source, acoustic=acoustic, cache_dir=str(tmp_path / "normalized"))
+
+    assert result["trim_offset"] == pytest.approx(4.0 - audio_normalizer.TRIM_PADDING_SEC)
+
+
+def test_no_speech_is_not_trimmed(fake_ffmpeg, source, tmp_path):
+    acoustic = {"duration": 10.0, "speech_start": 0.0, "speech_end": 0.0}
+    result = normalize_audio(source, acoustic=acoustic, cache_dir=str(tmp_path / "normalized"))
+
+    assert fake_ffmpeg[0]["start"] == 0.0 and fake_ffmpeg[0]["duration"] is None
+    assert result["trim_offset"] == 0.0
+
+
+def test_converted_file_is_reused(fake_ffmpeg, source, tmp_path):
+    cache_dir = str(tmp_path / "normalized")
+    first = normalize_audio(source, cache_dir=cache_dir)
+    second = normalize_audio(source, cache_dir=cache_dir)
+
+    assert len(fake_ffmpeg) == 1
+    assert second["cached"]
+    assert second["path"] == first["path"]
+    assert second["trim_offset"] == first["trim_offset"]
+
+
+def test_unknown_codec_raises_value_error(source, tmp_path):
+    with pytest.raises(ValueError):
+        normalize_audio(source, codec="mp3", cache_dir=str(tmp_path))
+
+
+def test_oldest_results_are_evicted(fake_ffmpeg, tmp_path):
+    cache_dir = tmp_path / "normalized"
+    acoustic = {"duration": 10.0, "speech_start": 1.0, "speech_end": 9.0}
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"talk{index}.wav"
+        write_wav(path, tone(0.1, hz=100 + index))
+        paths.append(normalize_audio(str(path), acoustic=acoustic, cache_dir=str(cache_dir))["path"])
+        os.utime(paths[-1], (index, index))
+    # 変換途中の一時ファイル（メタデータなし）は削除しない
+    in_progress = cache_dir / "tmpabcd.flac"
+    in_progress.write_bytes(b"y" * 1000)
+    entry_bytes = os.path.getsize(paths[0]) + os.path.getsize(paths[0][:-len(".flac")] + ".json")
+
+    path = tmp_path / "talk3.wav"
+    write_wav(path, tone(0.1, hz=300))
+    newest = normalize_audio(str(path), acoustic=acoustic, cache_dir=str(cache_dir), max_bytes=2 * entry_bytes)
+
+    assert not os.path.exists(paths[0])
+    assert not os.path.exists(paths[0][:-len(".flac")] + ".json")
+    assert not os.path.exists(paths[1])
+    assert os.path.exists(paths[2])
+    assert os.path.exists(newest["path"])
+    assert in_progress.exists()
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpegが必要")
+@pytest.mark.parametrize("codec, container", [("flac", "flac"), ("opus", "ogg")])
+def test_output_format_with_ffmpeg(tmp_path, codec, container):
+    # 44.1kHzステレオ: 無音1秒 → 発話2秒 → 無音1秒
+    source = tmp_path / "talk.wav"
+    signal = np.concatenate([silence(1.0, 44100), tone(2.0, sample_rate=44100), silence(1.0, 44100)])
+    write_wav(source, signal, sample_rate=44100, channels=2)
+
+    result = normalize_audio(str(source), codec=codec, cache_dir=str(tmp_path / "normalized"))
+    info = probe_media(result["path"])
+
+    assert info["container"] == container
+    assert info["channels"] == 1
+    if codec == "flac":
+        assert info["sample_rate"] == 16000
+    assert info["duration"] == pytest.approx(2.0 + 2 * audio_normalizer.TRIM_PADDING_SEC, abs=0.1)
+    assert result["trim_offset"] == pytest.approx(1.0 - audio_normalizer.TRIM_PADDING_SEC, abs=0.05)
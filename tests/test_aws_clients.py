@@ -0,0 +1,85 @@
+"""aws_clients（boto3クライアントの共有レジストリ）のテスト."""
+
+import threading
+
+import pytest
+
+from presentation_feedback.core import aws_clients
+from presentation_feedback.core.aws_clients import clear_clients, get_client
+
+
+class FakeSession:
+    def __init__(self):
+        self.created = []
+
+    def client(self, service_name, region_name=None, config=None):
+        client = object()
+        self.created.append((service_name, region_name, config))
+        return client
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession()
+    monkeypatch.setattr(aws_clients, "_clients", {})
+    monkeypatch.setattr(aws_clients, "_get_session", lambda: fake)
+    return fake
+
+
+def test_same_key_reuses_client(session):
+    first = get_client("s3", "us-west-2", max_pool_connections=10, max_attempts=3, retry_mode="standard")
+    second = get_client("s3", "us-west-2", max_pool_connections=10, max_attempts=3, retry_mode="standard")
+
+    assert first is second
+    assert len(session.created) == 1
+
+
+def test_default_region_is_part_of_the_key(session):
+    assert get_client("transcribe") is get_client("transcribe", aws_clients.AWS_REGION)
+    assert len(session.created) == 1
+
+
+@pytest.mark.parametrize("override", [
+    {"service_name": "transcribe"},
+    {"region_name": "ap-northeast-1"},
+    {"max_pool_connections": 20},
+    {"max_attempts": 10},
+    {"retry_mode": "adaptive"},
+])
+def test_different_keys_get_separate_clients(session, override):
+    params = {
+        "service_name": "s3",
+        "region_name": "us-west-2",
+        "max_pool_connections": 10,
+        "max_attempts": 3,
+        "retry_mode": "standard",
+    }
+    base = get_client(**params)
+    other = get_client(**{**params, **override})
+
+    assert other is not base
+    assert len(session.created) == 2
+
+
+def test_concurrent_first_calls_create_one_client(session):
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(get_client("s3", "us-west-2"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in results}) == 1
+    assert len(session.created) == 1
+
+
+def test_clear_clients(session):
+    first = get_client("s3", "us-west-2")
+    clear_clients()
+    assert get_client("s3", "us-west-2") is not first
@@ -0,0 +1,45 @@
+"""バッチ処理のBedrock同時実行数の制限のテスト."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from presentation_feedback.agents import invoker
+from presentation_feedback.batch import _limit_bedrock_concurrency
+
+
+def test_limit_bedrock_concurrency_covers_calls_inside_agents(monkeypatch):
+    monkeypatch.setattr(invoker, "_limiters", {})
+    agents = [
+        SimpleNamespace(model_id="model-a"),
+        SimpleNamespace(model_id="model-a"),
+        SimpleNamespace(model_id="model-b"),
+        SimpleNamespace(),  # デモのエージェント
+    ]
+    _limit_bedrock_concurrency(agents, max_concurrency=2)
+    assert sorted(invoker._limiters) == ["model-a", "model-b"]
+
+    lock = threading.Lock()
+    state = {"running": 0, "max_running": 0}
+
+    def call():
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+
+    # map-reduceの区間ごとの呼び出しのように、エージェント内部で並列に呼ぶ
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: invoker.invoke("model-a", call, 10), range(8)))
+
+    assert state["max_running"] == 2
+    assert invoker.get_invocation_metrics()["model-a"]["calls"] == 8
+
+
+def test_limit_bedrock_concurrency_ignores_demo_agents(monkeypatch):
+    monkeypatch.setattr(invoker, "_limiters", {})
+    _limit_bedrock_concurrency([SimpleNamespace(), SimpleNamespace()], max_concurrency=2)
+    assert invoker._limiters == {}
@@ -0,0 +1,221 @@
+"""分割書き起こし（結合・並列ジョブの実行と失敗時の後始末）のテスト."""
+
+import asyncio
+import random
+
+import pytest
+from botocore.exceptions import ClientError
+
+from presentation_feedback.core import chunked_transcriber
+from presentation_feedback.core.chunked_transcriber import (
+    _transcribe_chunks_async,
+    plan_chunks,
+    stitch_items,
+    transcribe_audio_chunked,
+)
+
+
+VOCABULARY = [
+    "today", "we", "will", "talk", "about", "the", "new", "release", "and", "its",
+    "performance", "so", "first", "let's", "look", "at", "numbers", "then", "next", "steps",
+]
+WORD_SEC = 0.4
+
+
+def make_words(n_words: int, rng: random.Random):
+    """正解の単語列（元の音声の時間軸、7単語ごとに句読点）."""
+    words = []
+    for i in range(n_words):
+        start = i * WORD_SEC
+        words.append({
+            "content": rng.choice(VOCABULARY),
+            "start": start,
+            "end": start + WORD_SEC * 0.8,
+            "punctuation": "." if i % 7 == 6 else None,
+        })
+    return words
+
+
+def chunk_items_for(words, chunk, rng: random.Random, jitter: float):
+    """
+    1チャンク分のTranscribe itemsを作る.
+
+    時刻はチャンク先頭からの秒で、チャンク全体のずれと単語ごとのずれを加える。
+    切り出し範囲の端にかかる単語は認識を誤った別の単語にする。
+    """
+    shift = rng.uniform(-jitter, jitter)
+    items = []
+    for word in words:
+        if word["end"] <= chunk["start"] or word["start"] >= chunk["end"]:
+            continue
+        content = word["content"]
+        if word["start"] < chunk["start"] or word["end"] > chunk["end"]:
+            content = "uh"
+        start = word["start"] - chunk["start"] + shift + rng.uniform(-jitter / 3, jitter / 3)
+        items.append({
+            "type": "pronunciation",
+            "alternatives": [{"content": content, "confidence": "0.9"}],
+            "start_time": f"{max(0.0, start):.3f}",
+            "end_time": f"{max(0.0, start) + WORD_SEC * 0.8:.3f}",
+        })
+        if word["punctuation"]:
+            items.append({
+                "type": "punctuation",
+                "alternatives": [{"content": word["punctuation"], "confidence": "0.0"}],
+            })
+    return items
+
+
+def contents(items):
+    return [item["alternatives"][0]["content"] for item in items]
+
+
+def expected_contents(words):
+    result = []
+    for word in words:
+        result.append(word["content"])
+        if word["punctuation"]:
+            result.append(word["punctuation"])
+    return result
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_stitch_items_with_jittered_overlap(seed):
+    rng = random.Random(seed)
+    words = make_words(300, rng)
+    duration = words[-1]["end"]
+    # 単語の途中で切る（無音が見つからず目安の位置で切った場合）
+    cuts = [40.13, 80.27]
+    chunks = plan_chunks(duration, cuts, overlap=2.0)
+    chunk_items = [chunk_items_for(words, chunk, rng, jitter=0.5) for chunk in chunks]
+
+    stitched = stitch_items(chunk_items, chunks)
+
+    assert contents(stitched) == expected_contents(words)
+    starts = [item["start_time"] for item in stitched if item["type"] == "pronunciation"]
+    assert all(isinstance(start, float) for start in starts)
+
+
+def test_stitch_items_falls_back_to_cut_without_matching_words():
+    chunks = plan_chunks(20.0, [10.0], overlap=2.0)
+
+    def item(content, start):
+        return {
+            "type": "pronunciation",
+            "alternatives": [{"content": content, "confidence": "0.9"}],
+            "start_time": str(start),
+            "end_time": str(start + 0.3),
+        }
+
+    # 重なり部分（8〜12秒）で2つのチャンクの認識結果が一致しない
+    first = [item("a", 7.0), item("b", 9.0), item("c", 11.0)]
+    second = [item("x", 1.0), item("y", 3.0), item("z", 5.0)]
+
+    stitched = stitch_items([first, second], chunks)
+
+    assert contents(stitched) == ["a", "b", "y", "z"]
+    assert [item["start_time"] for item in stitched] == [7.0, 9.0, 11.0, 13.0]
+
+
+class FakeS3:
+    def __init__(self):
+        self.deleted = []
+
+    def delete_object(self, Bucket, Key):
+        self.deleted.append(Key)
+
+
+class FakeTranscribe:
+    def __init__(self, fail_jobs=()):
+        self.fail_jobs = set(fail_jobs)
+        self.started = []
+        self.deleted = []
+
+    def start_transcription_job(self, TranscriptionJobName, **params):
+        if TranscriptionJobName[-3:] in self.fail_jobs:
+            raise ClientError({"Error": {"Code": "LimitExceededException"}}, "StartTranscriptionJob")
+        self.started.append(TranscriptionJobName)
+
+    def delete_transcription_job(self, TranscriptionJobName):
+        self.deleted.append(TranscriptionJobName)
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    """チャンクの切り出し・アップロード・ジョブの待機を偽物に置き換える."""
+    fake = {"s3": FakeS3(), "transcribe": FakeTranscribe(), "extracted": [], "wait_error": None}
+
+    def extract_chunk(audio_file_path, chunk, output_path):
+        fake["extracted"].append(chunk["start"])
+        with open(output_path, "wb") as f:
+            f.write(repr(chunk).encode())
+
+    def upload(path, s3_client, bucket, key, total_bytes, skip_if_exists=False):
+        return f"s3://{bucket}/{key}"
+
+    async def wait(client, job_names, durations):
+        if fake["wait_error"]:
+            raise fake["wait_error"]
+        return [{"TranscriptionJobName": name} for name in job_names]
+
+    monkeypatch.setattr(chunked_transcriber, "get_client", lambda name, region_name=None: fake[name])
+    monkeypatch.setattr(chunked_transcriber, "_extract_chunk", extract_chunk)
+    monkeypatch.setattr(chunked_transcriber, "upload_to_s3", upload)
+    monkeypatch.setattr(chunked_transcriber, "wait_for_transcription_jobs_async", wait)
+    monkeypatch.setattr(
+        chunked_transcriber, "fetch_transcript_items", lambda job: [job["TranscriptionJobName"]]
+    )
+    monkeypatch.setattr(chunked_transcriber, "CHUNK_MAX_PARALLEL", 1)
+    return fake
+
+
+CHUNKS = plan_chunks(40.0, [10.0, 20.0, 30.0])
+
+
+def run_chunks(tmp_path):
+    return asyncio.run(_transcribe_chunks_async("talk.mp3", CHUNKS, "en-US", str(tmp_path)))
+
+
+def test_chunk_results_keep_chunk_order(aws, tmp_path):
+    results = run_chunks(tmp_path)
+
+    assert [items[0][-3:] for items in results] == ["000", "001", "002", "003"]
+    assert aws["transcribe"].deleted == [] and aws["s3"].deleted == []
+
+
+def test_failed_start_removes_started_jobs_and_uploaded_chunks(aws, tmp_path):
+    aws["transcribe"].fail_jobs = {"001"}
+
+    with pytest.raises(RuntimeError, match="Transcriptionジョブ開始エラー"):
+        run_chunks(tmp_path)
+
+    # 失敗したチャンクより後のチャンクは切り出さない
+    assert aws["extracted"] == [CHUNKS[0]["start"], CHUNKS[1]["start"]]
+    assert aws["transcribe"].deleted == aws["transcribe"].started
+    assert len(aws["transcribe"].deleted) == 1
+    assert len(aws["s3"].deleted) == 2
+    assert all(key.startswith("input/sha256/") for key in aws["s3"].deleted)
+
+
+def test_failed_job_removes_all_jobs_and_chunks(aws, tmp_path):
+    aws["wait_error"] = RuntimeError("Transcription失敗: Unsupported media")
+
+    with pytest.raises(RuntimeError, match="Unsupported media"):
+        run_chunks(tmp_path)
+
+    assert sorted(aws["transcribe"].deleted) == sorted(aws["transcribe"].started)
+    assert len(aws["transcribe"].deleted) == len(CHUNKS)
+    assert len(aws["s3"].deleted) == len(CHUNKS)
+
+
+def test_cut_points_use_silence_only_analysis(monkeypatch):
+    calls = []
+    monkeypatch.setattr(chunked_transcriber, "probe_media", lambda path: {"duration": None})
+    monkeypatch.setattr(
+        chunked_transcriber, "extract_silences",
+        lambda path: calls.append(path) or {"duration": 30.0, "silences": {"segments": []}},
+    )
+    monkeypatch.setattr(chunked_transcriber, "transcribe_batch", lambda path, language_code: "batch")
+
+    assert transcribe_audio_chunked("talk.mp4", "en-US", target_sec=600.0) == "batch"
+    assert calls == ["talk.mp4"]
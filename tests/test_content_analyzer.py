@@ -0,0 +1,99 @@
+"""ContentAnalyzer（区間の分割・モード・map-reduceの使用量の合算）のテスト."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from presentation_feedback.agents import content_analyzer
+from presentation_feedback.agents.content_analyzer import _split_windows, create_content_analyzer
+
+
+def segment(start, end, text="発話。"):
+    return {"text": text, "start_time": start, "end_time": end}
+
+
+def window_starts(windows):
+    return [[seg["start_time"] for seg in window["segments"]] for window in windows]
+
+
+def test_split_windows_at_boundaries():
+    segments = [segment(0.0, 5.0), segment(9.0, 10.0), segment(10.0, 12.0), segment(19.9, 20.0), segment(20.0, 21.0)]
+    windows = _split_windows({"segments": segments}, window_sec=10.0)
+
+    # 境界ちょうどに始まるセグメントは次の区間
+    assert window_starts(windows) == [[0.0, 9.0], [10.0, 19.9], [20.0]]
+    assert windows[0]["text"] == "発話。発話。"
+    assert windows[1]["duration"] == pytest.approx(10.0)
+
+
+def test_split_windows_skips_gaps_longer_than_a_window():
+    segments = [segment(1.0, 2.0), segment(35.0, 36.0), segment(38.0, 39.0), segment(41.0, 42.0)]
+    windows = _split_windows({"segments": segments}, window_sec=10.0)
+
+    # 10〜30秒の発話のない区間は含めず、35秒と38秒は同じ区間（30〜40秒）
+    assert window_starts(windows) == [[1.0], [35.0, 38.0], [41.0]]
+
+
+def test_split_windows_first_segment_after_first_window():
+    windows = _split_windows({"segments": [segment(25.0, 26.0), segment(27.0, 28.0)]}, window_sec=10.0)
+    assert window_starts(windows) == [[25.0, 27.0]]
+
+
+def test_split_windows_empty():
+    assert _split_windows({"segments": []}, window_sec=10.0) == []
+
+
+def test_split_windows_rejects_non_positive_window():
+    with pytest.raises(ValueError):
+        _split_windows({"segments": [segment(0.0, 1.0)]}, window_sec=0.0)
+
+
+def test_unknown_mode_raises_value_error():
+    with pytest.raises(ValueError, match="mapreduce"):
+        create_content_analyzer(mode="mapreduce")
+
+
+def test_map_reduce_without_segments_uses_single_call(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        content_analyzer, "run_agent",
+        lambda model_id, system_prompt, prompt, region_name=None: calls.append(system_prompt) or agent_result(),
+    )
+
+    create_content_analyzer(mode="map_reduce").analyze_content({"text": "本日は", "segments": [], "duration": 3.0})
+
+    assert calls == [content_analyzer.SYSTEM_PROMPT]
+
+
+def agent_result(cached=False):
+    return SimpleNamespace(
+        message={"role": "assistant", "content": [{"text": '{"summary": "要約"}'}]},
+        metrics=SimpleNamespace(accumulated_usage={"inputTokens": 10, "outputTokens": 5}),
+        cached=cached,
+    )
+
+
+def test_map_reduce_counts_cached_calls(monkeypatch):
+    # 3区間のうち2区間は応答キャッシュから返し、統合は新たに呼び出す
+    cached_windows = iter([True, False, True])
+
+    def run_agent(model_id, system_prompt, prompt, region_name=None):
+        if system_prompt == content_analyzer.MAP_SYSTEM_PROMPT:
+            return agent_result(cached=next(cached_windows))
+        return agent_result()
+
+    monkeypatch.setattr(content_analyzer, "run_agent", run_agent)
+    monkeypatch.setattr(content_analyzer, "MAP_CONCURRENCY", 1)
+    monkeypatch.setattr(content_analyzer, "MAP_WINDOW_SEC", 10.0)
+    transcription = {
+        "text": "発話。" * 3,
+        "segments": [segment(0.0, 1.0), segment(10.0, 11.0), segment(20.0, 21.0)],
+        "duration": 21.0,
+    }
+
+    usage = create_content_analyzer(mode="map_reduce").analyze_content(transcription)["usage"]
+
+    assert usage["calls"] == 4
+    assert usage["cached_calls"] == 2
+    assert usage["input_tokens"] == 40
+    assert usage["output_tokens"] == 20
@@ -0,0 +1,87 @@
+"""フィラーワード検出のテスト（AWS Transcribeと同じ形式のアイテムから組み立てたセグメントで検証）."""
+
+import json
+
+from presentation_feedback.core.filler_words import FillerWordMatcher, detect_filler_words
+from presentation_feedback.core.transcript_json import parse_transcript_stream
+from presentation_feedback.core.transcript_segments import iter_transcript_segments, word_separator
+
+
+def _items(tokens):
+    """[(単語, 開始, 終了) または 句読点] からTranscribe結果JSONのitemsを作る."""
+    items = []
+    for token in tokens:
+        if isinstance(token, str):
+            items.append({"type": "punctuation", "alternatives": [{"confidence": "0.0", "content": token}]})
+        else:
+            content, start, end = token
+            items.append({
+                "type": "pronunciation",
+                "start_time": f"{start:.3f}",
+                "end_time": f"{end:.3f}",
+                "alternatives": [{"confidence": "0.99", "content": content}],
+            })
+    return items
+
+
+ENGLISH_ITEMS = _items([
+    ("So", 0.0, 0.3), ("um", 0.4, 0.6), ("I", 0.7, 0.8), ("think", 0.8, 1.0),
+    ("you", 1.1, 1.2), ("know", 1.2, 1.4), ("this", 1.5, 1.7), ("is", 1.7, 1.8),
+    ("like", 1.9, 2.1), ("good", 2.2, 2.5), ".",
+    ("Also", 3.0, 3.3), ("the", 3.3, 3.4), ("soul", 3.5, 3.8), ("likes", 3.9, 4.2), ("it", 4.2, 4.3), ".",
+])
+
+JAPANESE_ITEMS = _items([
+    ("その", 0.0, 0.3), ("後", 0.3, 0.5), "、", ("その", 0.6, 0.9), ("結果", 0.9, 1.3), ("を", 1.3, 1.4),
+    ("見", 1.4, 1.6), ("ます", 1.6, 1.9), "。",
+    ("えー", 2.5, 3.0), "、", ("その", 3.2, 3.5), "、", ("まあ", 3.6, 3.9), ("まあ", 3.9, 4.2),
+    ("です", 4.2, 4.5), "。",
+    ("そのー", 5.0, 5.6), ("結論", 5.7, 6.1), ("です", 6.1, 6.4), "。",
+])
+
+
+def _segments(items, language_code):
+    return list(iter_transcript_segments(items, word_separator(language_code)))
+
+
+def test_english_segments_keep_spaces_between_words():
+    segments = _segments(ENGLISH_ITEMS, "en-US")
+    assert [seg["text"] for seg in segments] == [
+        "So um I think you know this is like good.",
+        "Also the soul likes it.",
+    ]
+
+
+def test_english_fillers_are_found_in_aws_items():
+    fillers = detect_filler_words(_segments(ENGLISH_ITEMS, "en-US"))
+    assert {word: data["count"] for word, data in fillers.items()} == {"um": 1, "you know": 1}
+    assert fillers["um"]["timestamps"] == [0.18]  # セグメント内の文字位置から補間
+
+
+def test_english_like_and_so_are_not_counted_by_default():
+    matcher = FillerWordMatcher()
+    assert matcher.find_all("It looks like so much work, so that we can ship it like that.") == []
+
+
+def test_japanese_segments_have_no_spaces():
+    segments = _segments(JAPANESE_ITEMS, "ja-JP")
+    assert segments[0]["text"] == "その後、"
+    assert segments[1]["text"] == "その結果を見ます。"
+
+
+def test_japanese_ambiguous_words_count_only_filler_use():
+    fillers = detect_filler_words(_segments(JAPANESE_ITEMS, "ja-JP"))
+    counts = {word: data["count"] for word, data in fillers.items()}
+    # 「その後」「その結果」「まあまあ」は数えず、単独の「その」と長音付きの「そのー」を数える
+    assert counts == {"えー": 1, "その": 2}
+
+
+def test_streamed_transcript_uses_language_separator():
+    document = {"results": {"transcripts": [{"transcript": ""}], "items": ENGLISH_ITEMS}}
+    result = parse_transcript_stream([json.dumps(document).encode("utf-8")], "en-US")
+    assert result["segments"][0]["text"].startswith("So um I think")
+
+
+def test_matcher_prefers_leftmost_longest_and_word_boundaries():
+    matcher = FillerWordMatcher(["so", "so to speak", "えー"], standalone_words=[])
+    assert matcher.find_all("So to speak, also えーーー") == [(0, 11, "so to speak"), (18, 20, "えー")]
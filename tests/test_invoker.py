@@ -0,0 +1,145 @@
+"""invoker（TokenBucket・実行枠・レート制限付きの呼び出し）のテスト."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from presentation_feedback.agents import invoker
+from presentation_feedback.agents.invoker import ModelLimiter, TokenBucket
+
+
+class FakeClock:
+    """time.monotonic() / time.sleep() の代わり（sleepで時刻を進める）."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(invoker, "time", fake)
+    return fake
+
+
+def test_acquire_within_capacity_does_not_wait(clock):
+    bucket = TokenBucket(per_minute=60)
+    for _ in range(60):
+        bucket.acquire()
+    assert clock.slept == []
+
+
+def test_acquire_waits_for_refill(clock):
+    bucket = TokenBucket(per_minute=60)  # 1秒に1つ補充
+    bucket.acquire(60)
+    bucket.acquire(3)
+    assert sum(clock.slept) == pytest.approx(3.0)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(per_minute=60)
+    clock.now += 3600
+    bucket.acquire(60)
+    bucket.acquire(1)
+    assert sum(clock.slept) == pytest.approx(1.0)
+
+
+def test_amount_above_capacity_is_truncated(clock):
+    bucket = TokenBucket(per_minute=10)
+    bucket.acquire(1000)
+    assert clock.slept == []
+
+
+def test_adjust_returns_and_consumes(clock):
+    bucket = TokenBucket(per_minute=60)
+    bucket.acquire(60)
+    # 見込みより20少なかった → 返却分はすぐ使える
+    bucket.adjust(-20)
+    bucket.acquire(20)
+    assert clock.slept == []
+
+    # 見込みより30多かった → 残量が負になり、その分も待つ
+    bucket.adjust(30)
+    bucket.acquire(10)
+    assert sum(clock.slept) == pytest.approx(40.0)
+
+
+def test_invoke_retries_throttling_and_records_metrics(clock, monkeypatch, caplog):
+    monkeypatch.setattr(invoker, "_limiters", {})
+    monkeypatch.setattr(invoker, "is_throttling_error", lambda e: isinstance(e, TimeoutError))
+    monkeypatch.setattr(invoker, "retry_delay", lambda attempt: 0.5)
+    calls = []
+
+    def call():
+        calls.append(len(calls))
+        if len(calls) < 3:
+            raise TimeoutError("throttled")
+        return "ok"
+
+    with caplog.at_level(logging.WARNING, logger=invoker.__name__):
+        assert invoker.invoke("model", call, estimated_tokens=100) == "ok"
+    metrics = invoker.get_invocation_metrics()["model"]
+    assert (metrics["calls"], metrics["throttled"], metrics["retries"], metrics["failures"]) == (3, 2, 2, 0)
+    assert metrics["in_flight"] == 0
+    assert [record.levelno for record in caplog.records] == [logging.WARNING] * 2
+    assert "再試行（1/" in caplog.records[0].getMessage()
+
+
+def test_invoke_does_not_retry_other_errors(clock, monkeypatch):
+    monkeypatch.setattr(invoker, "_limiters", {})
+
+    def call():
+        raise KeyError("bug")
+
+    with pytest.raises(KeyError):
+        invoker.invoke("model", call, estimated_tokens=100)
+    assert invoker.get_invocation_metrics()["model"]["calls"] == 1
+
+
+def test_waiting_for_a_slot_does_not_consume_rate_limits():
+    limiter = ModelLimiter(max_concurrency=1, requests_per_minute=60, tokens_per_minute=6000)
+    limiter.acquire(1000)
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire(1000)
+        acquired.set()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    time.sleep(0.05)
+    # 同時実行数の空きを待つ間は、リクエスト数・トークン数を消費しない
+    assert not acquired.is_set()
+    assert limiter._requests._tokens == pytest.approx(59, abs=0.1)
+    assert limiter._tokens._tokens == pytest.approx(5000, abs=10)
+    assert limiter.metrics()["queue_depth"] == 1
+
+    limiter.release(1000)
+    thread.join(timeout=5)
+    assert acquired.is_set()
+    assert limiter._tokens._tokens == pytest.approx(4000, abs=10)
+    assert limiter.metrics()["queue_depth"] == 0
+
+
+def test_failed_rate_limit_wait_returns_the_slot(monkeypatch):
+    limiter = ModelLimiter(max_concurrency=1)
+
+    def interrupted(amount):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(limiter._tokens, "acquire", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        limiter.acquire(100)
+
+    assert limiter._semaphore.acquire(blocking=False)
+    assert limiter.metrics()["queue_depth"] == 0
@@ -0,0 +1,149 @@
+"""job_waiter（Transcriptionジョブの適応的ポーリング）のテスト."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from presentation_feedback.core import job_waiter
+from presentation_feedback.core.job_waiter import (
+    compute_poll_schedule,
+    iter_poll_delays,
+    wait_for_transcription_job,
+    wait_for_transcription_job_async,
+    wait_for_transcription_jobs_async,
+)
+
+
+class FakeClock:
+    """time.monotonic() / time.sleep() の代わり（sleepで時刻を進める）."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class FakeTranscribe:
+    """ジョブごとに状態の列を返す偽のTranscribeクライアント（最後の状態を繰り返す）."""
+
+    def __init__(self, statuses):
+        self.statuses = {name: iter(states) for name, states in statuses.items()}
+        self.last = {}
+        self.calls = []
+
+    def get_transcription_job(self, TranscriptionJobName):
+        self.calls.append(TranscriptionJobName)
+        status = next(self.statuses[TranscriptionJobName], self.last.get(TranscriptionJobName))
+        self.last[TranscriptionJobName] = status
+        job = {"TranscriptionJobName": TranscriptionJobName, "TranscriptionJobStatus": status}
+        if status == "FAILED":
+            job["FailureReason"] = "Unsupported media"
+        return {"TranscriptionJob": job}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(job_waiter, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def no_delay(monkeypatch):
+    """非同期の待機を実時間で短くする."""
+    monkeypatch.setattr(job_waiter, "iter_poll_delays", lambda schedule: itertools.repeat(0.001))
+
+
+def test_unknown_duration_uses_five_minute_default():
+    assert compute_poll_schedule(None) == compute_poll_schedule(300.0)
+    assert compute_poll_schedule(0) == compute_poll_schedule(300.0)
+
+
+def test_schedule_scales_with_duration_within_limits():
+    short = compute_poll_schedule(10.0)
+    long = compute_poll_schedule(3 * 3600.0)
+
+    assert short["initial_delay"] == pytest.approx(6.25)
+    assert short["base_interval"] == job_waiter.MIN_INTERVAL_SEC
+    assert short["max_interval"] == 5.0
+    assert short["timeout"] == job_waiter.MIN_TIMEOUT_SEC
+
+    assert long["initial_delay"] == job_waiter.MAX_INTERVAL_SEC
+    assert long["base_interval"] == 10.0
+    assert long["max_interval"] == job_waiter.MAX_INTERVAL_SEC
+    assert long["timeout"] == 3 * 3600.0 * 4
+
+
+def test_delays_start_with_initial_delay_and_stay_below_max_interval():
+    schedule = {"initial_delay": 7.0, "base_interval": 2.0, "max_interval": 10.0, "timeout": 600.0}
+    delays = list(itertools.islice(iter_poll_delays(schedule), 30))
+
+    assert delays[0] == 7.0
+    # Equal jitter: 間隔の半分以上、間隔以下
+    assert 1.0 <= delays[1] <= 2.0
+    assert 1.5 <= delays[2] <= 3.0
+    assert all(delay <= schedule["max_interval"] for delay in delays[1:])
+    assert min(delays[10:]) >= schedule["max_interval"] / 2
+
+
+def test_sync_waiter_returns_completed_job(clock):
+    client = FakeTranscribe({"job": ["QUEUED", "IN_PROGRESS", "COMPLETED"]})
+
+    job = wait_for_transcription_job(client, "job", audio_duration=60.0)
+
+    assert job["TranscriptionJobStatus"] == "COMPLETED"
+    assert client.calls == ["job"] * 3
+    assert clock.slept[0] == compute_poll_schedule(60.0)["initial_delay"]
+
+
+def test_sync_waiter_raises_on_failure(clock):
+    client = FakeTranscribe({"job": ["IN_PROGRESS", "FAILED"]})
+    with pytest.raises(RuntimeError, match="Unsupported media"):
+        wait_for_transcription_job(client, "job", audio_duration=60.0)
+
+
+def test_sync_waiter_times_out_without_sleeping_past_deadline(clock):
+    client = FakeTranscribe({"job": ["IN_PROGRESS"]})
+    with pytest.raises(TimeoutError, match="job"):
+        wait_for_transcription_job(client, "job", audio_duration=60.0, timeout=100.0)
+    assert clock.now == pytest.approx(100.0)
+
+
+def test_async_waiter_completes_and_fails(no_delay):
+    client = FakeTranscribe({"ok": ["IN_PROGRESS", "COMPLETED"], "bad": ["FAILED"]})
+
+    job = asyncio.run(wait_for_transcription_job_async(client, "ok"))
+    assert job["TranscriptionJobName"] == "ok"
+
+    with pytest.raises(RuntimeError, match="Transcription失敗"):
+        asyncio.run(wait_for_transcription_job_async(client, "bad"))
+
+
+def test_async_waiter_times_out(no_delay):
+    client = FakeTranscribe({"job": ["IN_PROGRESS"]})
+    with pytest.raises(TimeoutError):
+        asyncio.run(wait_for_transcription_job_async(client, "job", timeout=0.05))
+
+
+def test_multi_job_waiter_keeps_order(no_delay):
+    client = FakeTranscribe({
+        "a": ["IN_PROGRESS", "IN_PROGRESS", "IN_PROGRESS", "COMPLETED"],
+        "b": ["COMPLETED"],
+    })
+
+    jobs = asyncio.run(wait_for_transcription_jobs_async(client, ["a", "b"], [600.0, 30.0]))
+
+    assert [job["TranscriptionJobName"] for job in jobs] == ["a", "b"]
+
+
+def test_multi_job_waiter_propagates_failure(no_delay):
+    client = FakeTranscribe({"a": ["IN_PROGRESS", "COMPLETED"], "b": ["FAILED"]})
+    with pytest.raises(RuntimeError, match="Unsupported media"):
+        asyncio.run(wait_for_transcription_jobs_async(client, ["a", "b"]))
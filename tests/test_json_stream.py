@@ -0,0 +1,89 @@
+"""IncrementalJSONParser（ストリーミング中のJSONの逐次パース）のテスト."""
+
+import json
+import random
+
+import pytest
+
+from presentation_feedback.agents.json_stream import IncrementalJSONParser
+
+
+REPORT = {
+    "summary": "全体として {構成} が明確で、\"結論\" も伝わりやすい発表でした。\n\\ 記号も含む",
+    "score": 0.85,
+    "strengths": [
+        {"category": "構成", "description": "導入→本題→まとめ", "evidence": "[00:12] まず"},
+        {"category": "話速", "description": "適切", "evidence": "320文字/分"},
+    ],
+    "improvements": [
+        {"category": "フィラー", "issue": "「えー」が多い", "suggestion": "間を取る", "priority": "high"},
+    ],
+    "tags": ["明瞭", "論理的", 3, True, None],
+    "usage": {"nested": [1, 2, {"deep": "}]"}]},
+    "empty": [],
+    "passed": False,
+    "detailed_feedback": "詳細",
+}
+
+
+def expected_events(document):
+    """トップレベルの配列は要素ごと、その後に各フィールドを1つずつ返す."""
+    events = []
+    for key, value in document.items():
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                events.append({"type": "item", "key": key, "index": index, "value": item})
+        events.append({"type": "field", "key": key, "value": value})
+    return events
+
+
+def feed_in_pieces(text, rng):
+    parser = IncrementalJSONParser()
+    events = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 12)
+        events.extend(parser.feed(text[pos:pos + size]))
+        pos += size
+    return parser, events
+
+
+@pytest.mark.parametrize("seed", range(50))
+@pytest.mark.parametrize("indent", [None, 2])
+def test_random_splits_yield_same_events(seed, indent):
+    rng = random.Random(seed)
+    text = "```json\n" + json.dumps(REPORT, ensure_ascii=False, indent=indent) + "\n```"
+
+    parser, events = feed_in_pieces(text, rng)
+
+    assert events == expected_events(REPORT)
+    assert parser.done
+
+
+def test_feed_whole_text_at_once():
+    parser = IncrementalJSONParser()
+    assert parser.feed(json.dumps(REPORT, ensure_ascii=False)) == expected_events(REPORT)
+
+
+def test_values_are_emitted_as_soon_as_they_close():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"summary": "ok", "strengths": [{"a": 1}') == [
+        {"type": "field", "key": "summary", "value": "ok"},
+        {"type": "item", "key": "strengths", "index": 0, "value": {"a": 1}},
+    ]
+    # 数値は区切り文字が来るまで確定しない
+    assert parser.feed(', 12') == []
+    assert parser.feed(']') == [
+        {"type": "item", "key": "strengths", "index": 1, "value": 12},
+        {"type": "field", "key": "strengths", "value": [{"a": 1}, 12]},
+    ]
+    assert not parser.done
+    assert parser.feed('}') == []
+    assert parser.done
+
+
+def test_text_after_the_object_is_ignored():
+    parser = IncrementalJSONParser()
+    events = parser.feed('説明文 {"a": 1} {"b": 2}')
+    assert events == [{"type": "field", "key": "a", "value": 1}]
+    assert parser.feed('{"c": 3}') == []
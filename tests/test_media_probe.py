@@ -0,0 +1,225 @@
+"""media_probe（音声ファイルのヘッダ解析）のテスト."""
+
+import io
+import struct
+import wave
+
+import pytest
+
+from presentation_feedback.core.media_probe import (
+    MAX_DURATION_SEC,
+    probe_fileobj,
+    probe_media,
+    validate_for_transcribe,
+)
+
+
+def make_wav(seconds=2.0, sample_rate=16000, channels=1):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * channels * int(seconds * sample_rate))
+    return buffer.getvalue()
+
+
+def make_flac(sample_rate=44100, channels=2, total_samples=44100 * 3):
+    packed = (sample_rate << 44) | ((channels - 1) << 41) | (15 << 36) | total_samples
+    streaminfo = b"\x10\x00\x10\x00" + b"\x00" * 6 + packed.to_bytes(8, "big") + b"\x00" * 16
+    return b"fLaC" + b"\x80" + len(streaminfo).to_bytes(3, "big") + streaminfo
+
+
+# MPEG1 Layer III, 128kbps, 44.1kHz, joint stereo（1フレーム417バイト）
+MP3_FRAME_HEADER = b"\xff\xfb\x90\x44"
+MP3_FRAME_LENGTH = 417
+
+
+def make_mp3(n_frames=100, xing_frames=None, id3=False):
+    frames = []
+    for _ in range(n_frames):
+        frames.append(MP3_FRAME_HEADER + b"\x00" * (MP3_FRAME_LENGTH - 4))
+    if xing_frames is not None:
+        # Xingヘッダはサイド情報（ステレオは32バイト）の後ろ
+        first = bytearray(frames[0])
+        first[36:48] = b"Xing" + struct.pack(">II", 1, xing_frames)
+        frames[0] = bytes(first)
+    data = b"".join(frames)
+    if id3:
+        tag = b"\x00" * 300
+        size = bytes([(len(tag) >> 21) & 0x7F, (len(tag) >> 14) & 0x7F, (len(tag) >> 7) & 0x7F, len(tag) & 0x7F])
+        data = b"ID3\x04\x00\x00" + size + tag + data
+    return data
+
+
+def ogg_page(packet, granule):
+    return (
+        b"OggS" + b"\x00\x00" + struct.pack("<q", granule) + b"\x00" * 12
+        + bytes([1, len(packet)]) + packet
+    )
+
+
+def make_opus(seconds=3.0, pre_skip=312, channels=1, input_sample_rate=16000):
+    head = b"OpusHead" + bytes([1, channels]) + struct.pack("<HIhB", pre_skip, input_sample_rate, 0, 0)
+    return ogg_page(head, 0) + ogg_page(b"\x00" * 10, int(seconds * 48000) + pre_skip)
+
+
+def box(box_type, payload):
+    return struct.pack(">I", 8 + len(payload)) + box_type + payload
+
+
+def sound_entry(version, channels, sample_rate):
+    """stsdの音声サンプルエントリ（v0: ISO / v1・v2: QuickTime）."""
+    if version == 2:
+        # 固定部分は無効値（チャンネル3・16bit・レート1.0）、実際の値は後ろに続く
+        fields = struct.pack(">HHHH", 3, 16, 0xFFFE, 0) + struct.pack(">I", 1 << 16)
+        extension = struct.pack(">IdII", 72, float(sample_rate), channels, 0x7F000000) + b"\x00" * 16
+    else:
+        fields = struct.pack(">HHHH", channels, 16, 0, 0) + struct.pack(">I", sample_rate << 16)
+        extension = b"\x00" * 16 if version == 1 else b""
+    body = b"mp4a" + b"\x00" * 6 + b"\x00\x01" + struct.pack(">HH", version, 0) + b"\x00" * 4 + fields + extension
+    return struct.pack(">I", 4 + len(body)) + body
+
+
+def make_m4a(seconds=5.0, sample_rate=44100, channels=2, entry_version=0):
+    mdhd = box(b"mdhd", b"\x00" * 12 + struct.pack(">II", sample_rate, int(seconds * sample_rate)) + b"\x00" * 4)
+    hdlr = box(b"hdlr", b"\x00" * 8 + b"soun" + b"\x00" * 12)
+    entry = sound_entry(entry_version, channels, sample_rate)
+    stsd = box(b"stsd", b"\x00" * 4 + struct.pack(">I", 1) + entry)
+    stbl = box(b"stbl", stsd)
+    minf = box(b"minf", stbl)
+    mdia = box(b"mdia", mdhd + hdlr + minf)
+    moov = box(b"moov", box(b"trak", mdia))
+    ftyp = box(b"ftyp", b"M4A " + b"\x00" * 4 + b"isom")
+    return ftyp + moov + box(b"mdat", b"\x00" * 100)
+
+
+def test_wav():
+    info = probe_fileobj(io.BytesIO(make_wav(seconds=2.0, sample_rate=16000)))
+    assert info["container"] == "wav"
+    assert info["codec"] == "pcm_s16le"
+    assert info["media_format"] == "wav"
+    assert info["sample_rate"] == 16000
+    assert info["channels"] == 1
+    assert info["duration"] == pytest.approx(2.0)
+
+
+def test_wav_with_unknown_data_size():
+    data = bytearray(make_wav(seconds=1.0))
+    # ストリーミング録音のようにdataチャンクのサイズが未確定
+    data[40:44] = b"\xff\xff\xff\xff"
+    assert probe_fileobj(io.BytesIO(bytes(data)))["duration"] == pytest.approx(1.0)
+
+
+def test_flac():
+    info = probe_fileobj(io.BytesIO(make_flac(sample_rate=44100, channels=2, total_samples=44100 * 3)))
+    assert (info["container"], info["sample_rate"], info["channels"]) == ("flac", 44100, 2)
+    assert info["duration"] == pytest.approx(3.0)
+
+
+def test_mp3_cbr_duration_from_bitrate():
+    data = make_mp3(n_frames=100)
+    info = probe_fileobj(io.BytesIO(data))
+    assert (info["codec"], info["sample_rate"], info["channels"]) == ("mp3", 44100, 2)
+    assert info["duration"] == pytest.approx(len(data) * 8 / 128000)
+
+
+def test_mp3_xing_frame_count_after_id3_tag():
+    info = probe_fileobj(io.BytesIO(make_mp3(n_frames=20, xing_frames=1000, id3=True)))
+    assert info["duration"] == pytest.approx(1000 * 1152 / 44100)
+
+
+def test_ogg_opus_reports_input_sample_rate():
+    info = probe_fileobj(io.BytesIO(make_opus(seconds=3.0, input_sample_rate=16000)))
+    assert (info["container"], info["codec"], info["sample_rate"]) == ("ogg", "opus", 16000)
+    # granule positionは48kHz単位
+    assert info["duration"] == pytest.approx(3.0)
+
+
+def test_ogg_opus_without_input_sample_rate():
+    info = probe_fileobj(io.BytesIO(make_opus(seconds=2.0, input_sample_rate=0)))
+    assert info["sample_rate"] == 48000
+    assert info["duration"] == pytest.approx(2.0)
+
+
+def test_m4a():
+    info = probe_fileobj(io.BytesIO(make_m4a(seconds=5.0, sample_rate=44100, channels=2)))
+    assert info["container"] == "mp4"
+    assert info["media_format"] == "m4a"
+    assert (info["codec"], info["sample_rate"], info["channels"]) == ("aac", 44100, 2)
+    assert info["duration"] == pytest.approx(5.0)
+
+
+@pytest.mark.parametrize("version", [1, 2])
+def test_m4a_quicktime_sound_entry_versions(version):
+    info = probe_fileobj(io.BytesIO(make_m4a(sample_rate=48000, channels=1, entry_version=version)))
+    assert (info["codec"], info["sample_rate"], info["channels"]) == ("aac", 48000, 1)
+
+
+def test_probe_media_reads_path_and_size(tmp_path):
+    path = tmp_path / "talk.wav"
+    path.write_bytes(make_wav(seconds=1.0))
+    info = probe_media(str(path))
+    assert info["size_bytes"] == path.stat().st_size
+    assert info["duration"] == pytest.approx(1.0)
+
+
+def test_probe_fileobj_rewinds():
+    fileobj = io.BytesIO(make_flac())
+    probe_fileobj(fileobj)
+    assert fileobj.tell() == 0
+
+
+@pytest.mark.parametrize("data", [b"not audio at all", b"", b"OggS" + b"\x00" * 40])
+def test_unsupported_or_broken_files_raise_value_error(data):
+    with pytest.raises(ValueError):
+        probe_fileobj(io.BytesIO(data))
+
+
+def test_truncated_header_raises_value_error():
+    with pytest.raises(ValueError):
+        probe_fileobj(io.BytesIO(make_m4a()[:40]))
+
+
+def test_validate_for_transcribe_accepts_normal_audio():
+    validate_for_transcribe(probe_fileobj(io.BytesIO(make_wav())))
+
+
+@pytest.mark.parametrize("override", [
+    {"sample_rate": 4000},
+    {"sample_rate": 96000},
+    {"channels": None},
+    {"duration": 0.0},
+    {"duration": MAX_DURATION_SEC + 1},
+    {"size_bytes": 3 * 1024 ** 3},
+])
+def test_validate_for_transcribe_rejects(override):
+    info = {**probe_fileobj(io.BytesIO(make_wav())), **override}
+    with pytest.raises(ValueError):
+        validate_for_transcribe(info)
+
+
+class FakeTranscribe:
+    def __init__(self):
+        self.params = None
+
+    def start_transcription_job(self, **params):
+        self.params = params
+
+
+@pytest.mark.parametrize("data, expected_rate", [
+    (make_wav(sample_rate=16000), 16000),
+    (make_flac(sample_rate=44100), 44100),
+    (make_mp3(), None),
+    (make_opus(), None),
+    (make_m4a(), None),
+])
+def test_sample_rate_is_passed_to_transcribe_only_for_wav_and_flac(data, expected_rate):
+    from presentation_feedback.core.transcriber import start_transcription_job
+
+    client = FakeTranscribe()
+    media_info = probe_fileobj(io.BytesIO(data))
+    start_transcription_job(client, "job", "s3://bucket/key", "ja-JP", media_info)
+
+    assert client.params["MediaFormat"] == media_info["media_format"]
+    assert client.params.get("MediaSampleRateHertz") == expected_rate
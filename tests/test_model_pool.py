@@ -0,0 +1,123 @@
+"""stream_agent（ストリーミング実行とスロットリング時の再試行）のテスト."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from presentation_feedback.agents import invoker, model_pool
+
+
+class Throttled(Exception):
+    pass
+
+
+def make_result():
+    return SimpleNamespace(
+        message={"role": "assistant", "content": [{"text": "{}"}]},
+        metrics=SimpleNamespace(accumulated_usage={"inputTokens": 10, "outputTokens": 5}),
+        stop_reason="end_turn",
+    )
+
+
+@pytest.fixture
+def fake_agent(monkeypatch):
+    """呼び出しごとにscriptsの先頭の台本で動く偽のAgent."""
+    scripts = []
+    created = []
+
+    class FakeAgent:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            self.script = scripts.pop(0)
+
+        async def stream_async(self, prompt):
+            for step in self.script:
+                if isinstance(step, Exception):
+                    raise step
+                yield step
+
+    monkeypatch.setattr(model_pool, "Agent", FakeAgent)
+    monkeypatch.setattr(model_pool, "get_bedrock_model", lambda *args, **kwargs: object())
+    monkeypatch.setattr(model_pool, "get_response_cache", lambda: None)
+    monkeypatch.setattr(model_pool, "is_throttling_error", lambda e: isinstance(e, Throttled))
+    monkeypatch.setattr(model_pool, "retry_delay", lambda attempt: 0.0)
+    monkeypatch.setattr(invoker, "_limiters", {})
+    return SimpleNamespace(scripts=scripts, created=created)
+
+
+def collect():
+    async def run():
+        return [event async for event in model_pool.stream_agent("model", "system", "prompt")]
+
+    return asyncio.run(run())
+
+
+def test_retries_throttling_before_first_text(fake_agent):
+    result = make_result()
+    fake_agent.scripts.extend([
+        [{"init_event_loop": True}, Throttled()],
+        [{"init_event_loop": True}, {"data": "{}"}, {"result": result}],
+    ])
+
+    events = collect()
+
+    assert events[-2:] == [{"data": "{}"}, {"result": result}]
+    metrics = invoker.get_invocation_metrics()["model"]
+    assert (metrics["calls"], metrics["retries"], metrics["in_flight"]) == (2, 1, 0)
+
+
+def test_does_not_retry_after_text_was_returned(fake_agent):
+    fake_agent.scripts.append([{"data": "{"}, Throttled()])
+
+    with pytest.raises(Throttled):
+        collect()
+    assert invoker.get_invocation_metrics()["model"]["retries"] == 0
+
+
+def test_failed_acquire_does_not_release(fake_agent, monkeypatch):
+    limiter = invoker.get_model_limiter("model")
+
+    def failing_acquire(estimated_tokens):
+        raise RuntimeError("acquire failed")
+
+    monkeypatch.setattr(limiter, "acquire", failing_acquire)
+    # BoundedSemaphoreは取得していない枠を返却するとValueErrorになる
+    with pytest.raises(RuntimeError, match="acquire failed"):
+        collect()
+    assert invoker.get_invocation_metrics()["model"]["in_flight"] == 0
+
+
+def test_slot_acquired_after_cancellation_is_returned(fake_agent):
+    invoker.configure_model_limits("model", max_concurrency=1)
+    limiter = invoker.get_model_limiter("model")
+    limiter.acquire(100)  # 実行枠を埋めておく
+    fake_agent.scripts.append([{"data": "{}"}, {"result": make_result()}])
+
+    async def run():
+        async def consume():
+            return [event async for event in model_pool.stream_agent("model", "system", "prompt")]
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # キャンセル後にスレッドが実行枠を取得しても、すぐに返却される
+        limiter.release(100)
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if limiter.metrics()["in_flight"] == 0:
+                break
+
+    asyncio.run(run())
+
+    assert limiter.metrics()["in_flight"] == 0
+    assert limiter.metrics()["calls"] == 2
+    assert fake_agent.created == []
+
+
+def test_strands_retries_are_disabled(fake_agent):
+    fake_agent.scripts.append([{"data": "{}"}, {"result": make_result()}])
+    collect()
+    assert fake_agent.created[0]["retry_strategy"]._max_attempts == 1
@@ -0,0 +1,65 @@
+"""stream_report_events（最終レポートのストリーミング生成）のテスト."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from presentation_feedback.agents import orchestrator
+
+
+REPORT = {
+    "summary": "わかりやすい発表でした。",
+    "strengths": [{"category": "構成", "description": "導入が明確", "evidence": "[00:05]"}],
+    "improvements": [],
+    "detailed_feedback": "詳細",
+}
+
+
+def make_result(text):
+    return SimpleNamespace(
+        message={"role": "assistant", "content": [{"text": text}]},
+        metrics=SimpleNamespace(accumulated_usage={"inputTokens": 10, "outputTokens": 5}),
+        stop_reason="end_turn",
+    )
+
+
+def fake_stream_agent(events):
+    async def stream_agent(model_id, system_prompt, prompt, region_name=None):
+        for event in events:
+            yield event
+
+    return stream_agent
+
+
+def collect(monkeypatch, events):
+    monkeypatch.setattr(orchestrator, "stream_agent", fake_stream_agent(events))
+
+    async def run():
+        return [event async for event in orchestrator.stream_report_events("model", "system", "prompt")]
+
+    return asyncio.run(run())
+
+
+def test_streams_fields_then_final_report(monkeypatch):
+    text = json.dumps(REPORT, ensure_ascii=False)
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+    events = collect(monkeypatch, [{"data": chunk} for chunk in chunks] + [{"result": make_result(text)}])
+
+    assert "".join(e["text"] for e in events if e["type"] == "text") == text
+    fields = [e["key"] for e in events if e["type"] == "field"]
+    assert fields == ["summary", "strengths", "improvements", "detailed_feedback"]
+    items = [e for e in events if e["type"] == "item"]
+    assert items == [{"type": "item", "key": "strengths", "index": 0, "value": REPORT["strengths"][0]}]
+
+    report = events[-1]
+    assert report["type"] == "report"
+    assert report["report"]["summary"] == REPORT["summary"]
+    assert report["report"]["usage"]["output_tokens"] == 5
+
+
+def test_stream_without_result_raises_clear_error(monkeypatch):
+    with pytest.raises(RuntimeError, match="結果を返さずに終了"):
+        collect(monkeypatch, [{"data": '{"summary": "途中'}])
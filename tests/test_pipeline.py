@@ -0,0 +1,131 @@
+"""run_analysis_pipeline_async（話し方・内容分析の並列実行と統合レポート生成）のテスト."""
+
+import asyncio
+import threading
+
+import pytest
+
+from presentation_feedback.pipeline import run_analysis_pipeline, run_analysis_pipeline_async
+
+
+TRANSCRIPTION = {"full_text": "今日はAWSの話をします。", "segments": [], "duration": 60.0}
+FEATURES = {"speaking_rate": 300.0, "filler_words": {}, "pauses": {"total": 0}}
+
+
+class FakeSpeechAnalyzer:
+    def __init__(self, barrier=None, error=None):
+        self.barrier = barrier
+        self.error = error
+        self.calls = []
+
+    def analyze_speech(self, transcription, audio_features):
+        self.calls.append((transcription, audio_features))
+        if self.barrier:
+            self.barrier.wait()
+        if self.error:
+            raise self.error
+        return {"score": 0.8}
+
+
+class FakeContentAnalyzer:
+    def __init__(self, barrier=None, error=None):
+        self.barrier = barrier
+        self.error = error
+        self.calls = []
+
+    def analyze_content(self, transcription):
+        self.calls.append(transcription)
+        if self.barrier:
+            self.barrier.wait()
+        if self.error:
+            raise self.error
+        return {"score": 0.7}
+
+
+class FakeOrchestrator:
+    def __init__(self):
+        self.calls = []
+
+    def generate_feedback_report(self, speech_result, content_result):
+        self.calls.append((speech_result, content_result))
+        return {"summary": "ok"}
+
+
+def run(speech, content, orchestrator, on_stage=None):
+    return asyncio.run(
+        run_analysis_pipeline_async(
+            TRANSCRIPTION,
+            FEATURES,
+            speech_analyzer=speech,
+            content_analyzer=content,
+            orchestrator=orchestrator,
+            on_stage=on_stage,
+        )
+    )
+
+
+def test_stages_are_reported_in_order_and_results_are_combined():
+    stages = []
+    orchestrator = FakeOrchestrator()
+
+    result = run(FakeSpeechAnalyzer(), FakeContentAnalyzer(), orchestrator, on_stage=stages.append)
+
+    assert stages == ["analysis", "report"]
+    assert orchestrator.calls == [({"score": 0.8}, {"score": 0.7})]
+    assert result["mode"] == "multi_agent"
+    assert result["report"] == {"summary": "ok"}
+    assert result["speech_result"] == {"score": 0.8}
+    assert result["content_result"] == {"score": 0.7}
+    assert set(result["timings"]) == {
+        "speech_analysis", "content_analysis", "analysis", "report", "report_first_content", "total",
+    }
+
+
+def test_speech_and_content_analysis_run_concurrently():
+    # 両方の分析が同時に待たないと通過できない（順番に実行するとタイムアウトする）
+    barrier = threading.Barrier(2, timeout=5)
+    speech = FakeSpeechAnalyzer(barrier=barrier)
+    content = FakeContentAnalyzer(barrier=barrier)
+
+    result = run(speech, content, FakeOrchestrator())
+
+    assert not barrier.broken
+    assert speech.calls == [(TRANSCRIPTION, FEATURES)]
+    assert content.calls == [TRANSCRIPTION]
+    assert result["report"] == {"summary": "ok"}
+
+
+def test_analysis_error_propagates_and_skips_report():
+    stages = []
+    orchestrator = FakeOrchestrator()
+
+    with pytest.raises(RuntimeError, match="content failed"):
+        run(
+            FakeSpeechAnalyzer(),
+            FakeContentAnalyzer(error=RuntimeError("content failed")),
+            orchestrator,
+            on_stage=stages.append,
+        )
+
+    assert stages == ["analysis"]
+    assert orchestrator.calls == []
+
+
+def test_report_error_propagates():
+    class FailingOrchestrator(FakeOrchestrator):
+        def generate_feedback_report(self, speech_result, content_result):
+            raise ValueError("bad report")
+
+    with pytest.raises(ValueError, match="bad report"):
+        run(FakeSpeechAnalyzer(), FakeContentAnalyzer(), FailingOrchestrator())
+
+
+def test_sync_wrapper():
+    result = run_analysis_pipeline(
+        TRANSCRIPTION,
+        FEATURES,
+        speech_analyzer=FakeSpeechAnalyzer(),
+        content_analyzer=FakeContentAnalyzer(),
+        orchestrator=FakeOrchestrator(),
+    )
+    assert result["report"] == {"summary": "ok"}
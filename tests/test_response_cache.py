@@ -0,0 +1,132 @@
+"""ResponseCache（エージェント応答のキャッシュ）のテスト."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from presentation_feedback.agents import response_cache
+from presentation_feedback.agents.response_cache import CachedAgentResult, ResponseCache, normalize_prompt
+
+
+USAGE = {"inputTokens": 100, "outputTokens": 20}
+
+
+def make_result(text='{"summary": "ok"}', usage=USAGE, stop_reason="end_turn"):
+    return SimpleNamespace(
+        message={"role": "assistant", "content": [{"text": text}]},
+        metrics=SimpleNamespace(accumulated_usage=dict(usage)),
+        stop_reason=stop_reason,
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def cache(clock):
+    return ResponseCache(":memory:", ttl_sec=3600, max_entries=2)
+
+
+def test_round_trip(cache):
+    assert cache.get("model", "system", "prompt") is None
+    cache.put("model", "system", "prompt", make_result())
+
+    cached = cache.get("model", "system", "prompt")
+    assert isinstance(cached, CachedAgentResult)
+    assert str(cached) == '{"summary": "ok"}'
+    assert cached.metrics.accumulated_usage == USAGE
+    assert cached.cached
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["tokens_saved"] == 120
+
+
+def test_prompt_is_normalized_but_model_and_system_prompt_are_not(cache):
+    cache.put("model", "system", "発表の\n\n\n\n内容  です", make_result())
+    assert cache.get("model", "system", "  発表の\r\n\r\n内容 です ") is not None
+    # 全角英数字はNFKCで半角と同じ扱い
+    assert normalize_prompt("ＡＷＳ　１２３") == normalize_prompt("AWS 123")
+
+    assert cache.get("other-model", "system", "発表の\n\n内容 です") is None
+    assert cache.get("model", "other system", "発表の\n\n内容 です") is None
+
+
+def test_expired_entries_are_dropped(cache, clock):
+    cache.put("model", "system", "prompt", make_result())
+    clock.now += 3601
+    assert cache.get("model", "system", "prompt") is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    cache.put("model", "system", "a", make_result())
+    clock.now += 1
+    cache.put("model", "system", "b", make_result())
+    clock.now += 1
+    assert cache.get("model", "system", "a") is not None
+    clock.now += 1
+    cache.put("model", "system", "c", make_result())
+
+    assert cache.get("model", "system", "b") is None
+    assert cache.get("model", "system", "a") is not None
+    assert cache.get("model", "system", "c") is not None
+
+
+def test_cached_result_is_not_stored_again(cache):
+    cache.put("model", "system", "prompt", CachedAgentResult("text", USAGE))
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_clear(cache):
+    cache.put("model", "system", "prompt", make_result())
+    cache.clear()
+    assert cache.get("model", "system", "prompt") is None
+
+
+def test_persists_to_file(tmp_path, clock):
+    path = str(tmp_path / "cache" / "responses.sqlite3")
+    ResponseCache(path).put("model", "system", "prompt", make_result())
+    assert str(ResponseCache(path).get("model", "system", "prompt")) == '{"summary": "ok"}'
+
+
+def test_truncated_response_is_not_stored(cache):
+    cache.put("model", "system", "prompt", make_result('{"summary": "途中', stop_reason="max_tokens"))
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_response_that_is_not_json_is_not_stored(cache):
+    cache.put("model", "system", "prompt", make_result("申し訳ありませんが、分析できませんでした。"))
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_json_in_code_block_is_stored(cache):
+    cache.put("model", "system", "prompt", make_result('```json\n{"summary": "ok"}\n```'))
+    assert cache.get("model", "system", "prompt") is not None
+
+
+def test_non_text_blocks_are_ignored(cache):
+    result = make_result()
+    result.message["content"] = [
+        {"toolUse": {"toolUseId": "1", "name": "calc", "input": {}}},
+        {"text": '{"summary": "ok"}'},
+    ]
+    cache.put("model", "system", "prompt", result)
+    assert str(cache.get("model", "system", "prompt")) == '{"summary": "ok"}'
+
+    result.message["content"] = [{"toolUse": {"toolUseId": "2", "name": "calc", "input": {}}}]
+    cache.put("model", "system", "other", result)
+    assert cache.get("model", "system", "other") is None
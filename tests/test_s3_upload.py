@@ -0,0 +1,149 @@
+"""upload_to_s3（ハッシュをキーにしたS3アップロードと進捗通知）のテスト."""
+
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+
+from presentation_feedback.core import transcriber
+from presentation_feedback.core.transcriber import content_addressed_key, upload_to_s3
+from presentation_feedback.core.transcription_cache import compute_audio_hash
+
+
+class FakeS3:
+    def __init__(self, existing=(), head_error_code="404"):
+        self.objects = {key: b"" for key in existing}
+        self.head_error_code = head_error_code
+        self.calls = []
+
+    def head_object(self, Bucket, Key):
+        self.calls.append(("head_object", Key))
+        if Key in self.objects:
+            return {"ContentLength": len(self.objects[Key])}
+        raise ClientError({"Error": {"Code": self.head_error_code}}, "HeadObject")
+
+
+class FakeFuture:
+    def __init__(self, error=None):
+        self.error = error
+
+    def done(self):
+        return True
+
+    def result(self):
+        if self.error:
+            raise self.error
+
+
+class FakeTransferManager:
+    """s3transferの代わり: ソースを一定サイズずつ読み、購読者に進捗を通知する."""
+
+    def __init__(self, s3_client, part_size=4, error=None):
+        self.s3_client = s3_client
+        self.part_size = part_size
+        self.error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def upload(self, source, bucket, key, subscribers):
+        self.s3_client.calls.append(("upload", key))
+        fileobj = open(source, "rb") if isinstance(source, str) else source
+        data = b""
+        for chunk in iter(lambda: fileobj.read(self.part_size), b""):
+            data += chunk
+            for subscriber in subscribers:
+                subscriber.on_progress(bytes_transferred=len(chunk))
+        if isinstance(source, str):
+            fileobj.close()
+        self.s3_client.objects[key] = data
+        return FakeFuture(self.error)
+
+
+@pytest.fixture
+def transfer(monkeypatch):
+    options = {}
+
+    def create_transfer_manager(s3_client, config):
+        return FakeTransferManager(s3_client, **options)
+
+    monkeypatch.setattr(transcriber, "create_transfer_manager", create_transfer_manager)
+    monkeypatch.setattr(transcriber, "UPLOAD_PROGRESS_INTERVAL_SEC", 0)
+    return options
+
+
+def test_existing_object_is_not_uploaded_again(transfer):
+    s3 = FakeS3(existing=["input/sha256/abc.mp3"])
+    progress = []
+
+    uri = upload_to_s3(
+        "/does/not/matter.mp3", s3, "bucket", "input/sha256/abc.mp3",
+        total_bytes=1000, on_progress=lambda done, total: progress.append((done, total)),
+        skip_if_exists=True,
+    )
+
+    assert uri == "s3://bucket/input/sha256/abc.mp3"
+    assert s3.calls == [("head_object", "input/sha256/abc.mp3")]
+    assert progress == [(1000, 1000)]
+
+
+def test_missing_object_is_uploaded_with_progress(transfer, tmp_path):
+    path = tmp_path / "talk.mp3"
+    path.write_bytes(b"0123456789")
+    s3 = FakeS3()
+    progress = []
+
+    upload_to_s3(
+        str(path), s3, "bucket", "input/sha256/abc.mp3",
+        total_bytes=10, on_progress=lambda done, total: progress.append((done, total)),
+        skip_if_exists=True,
+    )
+
+    assert s3.calls == [("head_object", "input/sha256/abc.mp3"), ("upload", "input/sha256/abc.mp3")]
+    assert s3.objects["input/sha256/abc.mp3"] == b"0123456789"
+    assert progress[-1] == (10, 10)
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+def test_without_skip_does_not_check_existence(transfer):
+    s3 = FakeS3(existing=["key"])
+    upload_to_s3(io.BytesIO(b"data"), s3, "bucket", "key", total_bytes=4)
+    assert [name for name, _ in s3.calls] == ["upload"]
+
+
+def test_file_object_is_uploaded_from_the_start(transfer):
+    fileobj = io.BytesIO(b"abcdefgh")
+    fileobj.seek(6)
+    s3 = FakeS3()
+
+    upload_to_s3(fileobj, s3, "bucket", "key", total_bytes=8)
+
+    assert s3.objects["key"] == b"abcdefgh"
+
+
+def test_head_object_errors_other_than_not_found_are_raised(transfer):
+    s3 = FakeS3(head_error_code="403")
+    with pytest.raises(RuntimeError, match="S3オブジェクト確認エラー"):
+        upload_to_s3(io.BytesIO(b"data"), s3, "bucket", "key", total_bytes=4, skip_if_exists=True)
+
+
+def test_upload_error_is_wrapped(transfer):
+    transfer["error"] = ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+    with pytest.raises(RuntimeError, match="S3アップロードエラー"):
+        upload_to_s3(io.BytesIO(b"data"), FakeS3(), "bucket", "key", total_bytes=4)
+
+
+def test_key_depends_only_on_content_and_extension(tmp_path):
+    first = tmp_path / "Talk.MP3"
+    second = tmp_path / "renamed.mp3"
+    first.write_bytes(b"same audio")
+    second.write_bytes(b"same audio")
+
+    first_key = content_addressed_key(compute_audio_hash(str(first)), first.name)
+    second_key = content_addressed_key(compute_audio_hash(str(second)), second.name)
+
+    assert first_key == second_key
+    assert first_key == f"input/sha256/{compute_audio_hash(str(first))}.mp3"
@@ -0,0 +1,112 @@
+"""scoring（話し方のルールベース採点）のテスト."""
+
+import json
+
+import pytest
+
+from presentation_feedback.core import scoring
+from presentation_feedback.core.scoring import get_speech_thresholds, score_speech
+
+
+def make_features(rate=320.0, fillers=None, pauses_total=30, long_pauses=()):
+    return {
+        "speaking_rate": rate,
+        "filler_words": {word: {"count": count} for word, count in (fillers or {}).items()},
+        "pauses": {
+            "total": pauses_total,
+            "avg_duration": 0.8,
+            "long_pauses": [{"time": t, "duration": 4.0} for t in long_pauses],
+        },
+    }
+
+
+def test_good_speech_gets_full_marks():
+    # 5分間: フィラー1分あたり0.6回、ポーズ1分あたり6回
+    result = score_speech(make_features(fillers={"えー": 3}), duration=300)
+
+    assert result["scores"] == {"speaking_rate": 1.0, "filler_words": 1.0, "pauses": 1.0, "overall": 1.0}
+    assert len(result["strengths"]) == 3
+    assert result["improvements"] == []
+    assert result["metrics"]["fillers_per_min"] == pytest.approx(0.6)
+    assert result["metrics"]["pauses_per_min"] == pytest.approx(6.0)
+    assert result["feedback"].startswith("話し方の総合スコアは1.00です")
+
+
+def test_fast_speech_is_penalized_linearly():
+    # 目安の上限350から50超過（許容幅100）→ 0.5
+    result = score_speech(make_features(rate=400), duration=300)
+    assert result["scores"]["speaking_rate"] == 0.5
+    assert "速め" in result["improvements"][0]
+
+
+def test_slow_speech_beyond_tolerance_scores_zero():
+    result = score_speech(make_features(rate=150), duration=300)
+    assert result["scores"]["speaking_rate"] == 0.0
+    assert "遅め" in result["improvements"][0]
+
+
+def test_many_fillers_name_the_most_frequent_word():
+    result = score_speech(make_features(fillers={"えー": 10, "あの": 20}), duration=300)
+    # 1分あたり6回 → 0点
+    assert result["scores"]["filler_words"] == 0.0
+    assert any("「あの」20回" in text for text in result["improvements"])
+
+
+def test_long_pauses_are_penalized():
+    result = score_speech(make_features(long_pauses=(65.0, 200.0)), duration=300)
+    assert result["scores"]["pauses"] == pytest.approx(1.0 - 2 * scoring.LONG_PAUSE_PENALTY)
+    assert any("01:05" in text for text in result["improvements"])
+
+
+def test_too_few_pauses():
+    result = score_speech(make_features(pauses_total=5), duration=300)
+    assert result["scores"]["pauses"] == pytest.approx(1.0 / 3.0, abs=0.01)
+    assert any("間が少なめ" in text for text in result["improvements"])
+
+
+def test_overall_is_weighted_sum():
+    result = score_speech(make_features(rate=400, fillers={"えー": 30}), duration=300)
+    scores = result["scores"]
+    expected = sum(scores[name] * weight for name, weight in scoring.SCORE_WEIGHTS.items())
+    assert scores["overall"] == pytest.approx(expected, abs=0.01)
+
+
+def test_zero_duration_does_not_divide_by_zero():
+    result = score_speech(make_features(rate=0, pauses_total=0), duration=0)
+    assert result["metrics"]["fillers_per_min"] == 0.0
+    assert result["metrics"]["pauses_per_min"] == 0.0
+
+
+def test_thresholds_by_language():
+    assert get_speech_thresholds("ja-JP") == scoring.SPEECH_THRESHOLDS["ja"]
+    assert get_speech_thresholds("en-US") == scoring.SPEECH_THRESHOLDS["en"]
+    # 未対応の言語は日本語の閾値
+    assert get_speech_thresholds("fr-FR") == scoring.SPEECH_THRESHOLDS["ja"]
+
+    # 英語の適切な話速は日本語では速すぎる
+    features = make_features(rate=700)
+    assert score_speech(features, 300, "en-US")["scores"]["speaking_rate"] == 1.0
+    assert score_speech(features, 300, "ja-JP")["scores"]["speaking_rate"] == 0.0
+
+
+def test_english_filler_thresholds():
+    # 英語のフィラーはuh・um・you knowのみ数えるため、日本語と同じ閾値（1〜6回/分）
+    def filler_score(count):
+        features = make_features(rate=700, fillers={"um": count})
+        return score_speech(features, 300, "en-US")["scores"]["filler_words"]
+
+    assert filler_score(5) == 1.0  # 1回/分
+    assert filler_score(15) == pytest.approx(0.6)  # 3回/分
+    assert filler_score(30) == 0.0  # 6回/分
+
+
+def test_thresholds_file_overrides(tmp_path, monkeypatch):
+    path = tmp_path / "thresholds.json"
+    path.write_text(json.dumps({"ja": {"rate_min": 250, "rate_max": 280}}), encoding="utf-8")
+    monkeypatch.setattr(scoring, "THRESHOLDS_FILE", str(path))
+
+    thresholds = get_speech_thresholds("ja-JP")
+    assert (thresholds["rate_min"], thresholds["rate_max"]) == (250, 280)
+    assert thresholds["filler_per_min_bad"] == scoring.SPEECH_THRESHOLDS["ja"]["filler_per_min_bad"]
+    # 元の表は変更しない
+    assert scoring.SPEECH_THRESHOLDS["ja"]["rate_min"] == 300
@@ -0,0 +1,127 @@
+"""SinglePassAnalyzer（1回の呼び出しでのレポート生成）のテスト."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from presentation_feedback.agents import orchestrator, single_pass
+from presentation_feedback.agents.orchestrator import create_orchestrator_agent
+from presentation_feedback.agents.single_pass import create_single_pass_analyzer
+
+
+TRANSCRIPTION = {
+    "text": "本日は新機能についてお話しします。以上です。",
+    "segments": [
+        {"text": "本日は新機能についてお話しします。", "start_time": 0.0, "end_time": 30.0},
+        {"text": "以上です。", "start_time": 30.0, "end_time": 60.0},
+    ],
+    "duration": 60.0,
+}
+FEATURES = {
+    "speaking_rate": 320.0,
+    "filler_words": {"えー": {"count": 1}},
+    "pauses": {"total": 6, "avg_duration": 0.8, "long_pauses": []},
+}
+REPORT = {
+    "summary": "わかりやすい発表でした。",
+    "strengths": [{"category": "話し方", "description": "適切な話速", "evidence": "320文字/分"}],
+    "improvements": [
+        {"category": "構成", "issue": "まとめが短い", "suggestion": "要点を振り返る", "priority": "medium"},
+    ],
+    "detailed_feedback": "詳細",
+}
+REPLY = f"```json\n{json.dumps(REPORT, ensure_ascii=False)}\n```"
+
+
+def make_result(text):
+    return SimpleNamespace(
+        message={"role": "assistant", "content": [{"text": text}]},
+        metrics=SimpleNamespace(accumulated_usage={"inputTokens": 10, "outputTokens": 5}),
+        stop_reason="end_turn",
+    )
+
+
+@pytest.fixture
+def agent_calls(monkeypatch):
+    """run_agentを固定の応答を返す偽物に置き換え、呼び出しを記録する."""
+    calls = []
+    reply = {"text": REPLY}
+
+    def run_agent(model_id, system_prompt, prompt, region_name=None):
+        calls.append({"model_id": model_id, "system_prompt": system_prompt, "prompt": prompt})
+        return make_result(reply["text"])
+
+    monkeypatch.setattr(single_pass, "run_agent", run_agent)
+    monkeypatch.setattr(orchestrator, "run_agent", run_agent)
+    return SimpleNamespace(calls=calls, reply=reply)
+
+
+def shape(value):
+    """値の型の構造（キーと要素の型）."""
+    if isinstance(value, dict):
+        return {key: shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [shape(item) for item in value]
+    return type(value).__name__
+
+
+def test_report_has_the_same_shape_as_multi_agent(agent_calls):
+    report = create_single_pass_analyzer().generate_feedback_report(TRANSCRIPTION, FEATURES)
+    multi_agent = create_orchestrator_agent().generate_feedback_report({"feedback": "話し方"}, {"structure": {}})
+
+    assert shape(report) == shape(multi_agent)
+    assert {key: report[key] for key in REPORT} == REPORT
+    assert report["usage"]["input_tokens"] == 10
+    assert report["usage"]["calls"] == 1
+
+
+def test_one_call_with_scores_and_transcript(agent_calls):
+    create_single_pass_analyzer().generate_feedback_report(TRANSCRIPTION, FEATURES)
+
+    assert len(agent_calls.calls) == 1
+    call = agent_calls.calls[0]
+    assert call["system_prompt"] == single_pass.SYSTEM_PROMPT
+    assert call["model_id"] == single_pass.DEFAULT_MODEL_ID
+    # 採点結果と書き起こしを1つのプロンプトに入れる
+    assert '"scores"' in call["prompt"]
+    assert '"speaking_rate": 320.0' in call["prompt"]
+    assert TRANSCRIPTION["text"] in call["prompt"]
+
+
+def test_model_id_from_environment(agent_calls, monkeypatch):
+    monkeypatch.setenv("SINGLE_PASS_MODEL_ID", "us.anthropic.claude-sonnet-4-5-20250929-v1:0")
+    create_single_pass_analyzer().generate_feedback_report(TRANSCRIPTION, FEATURES)
+    assert agent_calls.calls[0]["model_id"] == "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
+
+
+def test_reply_that_is_not_json_falls_back_to_the_same_shape(agent_calls):
+    agent_calls.reply["text"] = "JSONではない講評です。"
+
+    report = create_single_pass_analyzer().generate_feedback_report(TRANSCRIPTION, FEATURES)
+    multi_agent = create_orchestrator_agent().generate_feedback_report({}, {})
+
+    assert shape(report) == shape(multi_agent)
+    assert report["detailed_feedback"] == "JSONではない講評です。"
+    assert report["strengths"] == [] and report["improvements"] == []
+
+
+def test_streamed_report_matches_the_non_streamed_report(agent_calls, monkeypatch):
+    async def stream_agent(model_id, system_prompt, prompt, region_name=None):
+        assert system_prompt == single_pass.SYSTEM_PROMPT
+        for i in range(0, len(REPLY), 9):
+            yield {"data": REPLY[i:i + 9]}
+        yield {"result": make_result(REPLY)}
+
+    monkeypatch.setattr(orchestrator, "stream_agent", stream_agent)
+    analyzer = create_single_pass_analyzer()
+
+    async def run():
+        return [event async for event in analyzer.stream_feedback_report(TRANSCRIPTION, FEATURES)]
+
+    events = asyncio.run(run())
+
+    assert events[-1]["type"] == "report"
+    assert events[-1]["report"] == analyzer.generate_feedback_report(TRANSCRIPTION, FEATURES)
+    assert [e["key"] for e in events if e["type"] == "field"] == list(REPORT)
@@ -0,0 +1,77 @@
+"""SpeechAnalyzer（話し方分析のモード）のテスト."""
+
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from presentation_feedback.agents import speech_analyzer
+from presentation_feedback.agents.speech_analyzer import create_speech_analyzer
+
+
+TRANSCRIPTION = {
+    "text": "本日は新機能についてお話しします。",
+    "segments": [{"text": "本日は新機能についてお話しします。", "start_time": 0.0, "end_time": 60.0}],
+    "duration": 60.0,
+}
+FEATURES = {
+    "speaking_rate": 320.0,
+    "filler_words": {"えー": {"count": 1}},
+    "pauses": {"total": 6, "avg_duration": 0.8, "long_pauses": []},
+}
+
+
+@pytest.fixture
+def agent_calls(monkeypatch):
+    calls = []
+
+    def run_agent(model_id, system_prompt, prompt, region_name=None):
+        calls.append(system_prompt)
+        return SimpleNamespace(
+            message={"role": "assistant", "content": [{"text": '{"feedback": "講評", "strengths": [], "improvements": []}'}]},
+            metrics=SimpleNamespace(accumulated_usage={"inputTokens": 10, "outputTokens": 5}),
+        )
+
+    monkeypatch.setattr(speech_analyzer, "run_agent", run_agent)
+    return calls
+
+
+def test_default_mode_is_llm(monkeypatch):
+    monkeypatch.delenv("SPEECH_ANALYSIS_MODE", raising=False)
+    try:
+        assert importlib.reload(speech_analyzer).SPEECH_ANALYSIS_MODE == "llm"
+    finally:
+        importlib.reload(speech_analyzer)
+
+
+def test_llm_mode_asks_the_model_and_attaches_rule_scores(agent_calls):
+    result = create_speech_analyzer(mode="llm").analyze_speech(TRANSCRIPTION, FEATURES)
+    assert agent_calls == [speech_analyzer.SYSTEM_PROMPT]
+    assert result["feedback"] == "講評"
+    assert result["scores"]["overall"] == 1.0
+
+
+def test_rules_mode_does_not_call_the_model(agent_calls):
+    result = create_speech_analyzer(mode="rules").analyze_speech(TRANSCRIPTION, FEATURES)
+    assert agent_calls == []
+    assert result["usage"]["input_tokens"] == 0
+    assert result["strengths"]
+
+
+def test_hybrid_mode_only_asks_for_the_narrative(agent_calls):
+    result = create_speech_analyzer(mode="hybrid").analyze_speech(TRANSCRIPTION, FEATURES)
+    assert agent_calls == [speech_analyzer.NARRATIVE_SYSTEM_PROMPT]
+    assert result["feedback"] == "講評"
+    # 強み・改善点はルールベースの採点結果のまま
+    assert result["strengths"] and result["improvements"] == []
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        create_speech_analyzer(mode="fast")
+
+
+def test_only_llm_mode_uses_acoustic_features():
+    assert create_speech_analyzer(mode="llm").uses_acoustic_features
+    assert not create_speech_analyzer(mode="rules").uses_acoustic_features
+    assert not create_speech_analyzer(mode="hybrid").uses_acoustic_features
@@ -0,0 +1,69 @@
+"""Transcribe Streaming連携のテスト（フェイクサーバーとffmpegの代わりのPCM生成プロセスを使う）."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from presentation_feedback.core import audio_decoder, streaming_transcriber
+from tests.fake_transcribe_streaming import BYTES_PER_SEC, FakeTranscribeStreamingServer
+
+
+UTTERANCES = [
+    {
+        "transcript": "皆さんこんにちは。",
+        "words": [("皆さん", 0.1, 0.5), ("こんにちは", 0.6, 1.2)],
+        "punctuation": "。",
+    },
+    {
+        "transcript": "始めます",
+        "words": [("始め", 1.8, 2.1), ("ます", 2.2, 2.6)],
+        "punctuation": None,
+    },
+]
+
+
+def _fake_decoder(monkeypatch, seconds=None, pid_file=None):
+    """ffmpegの代わりに無音PCMを書き出すPythonプロセスを起動させる（seconds=Noneは無限）."""
+    script = "import os, sys\n"
+    if pid_file:
+        script += f"open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+    if seconds is None:
+        script += "while True: sys.stdout.buffer.write(bytes(32000)); sys.stdout.flush()\n"
+    else:
+        script += f"sys.stdout.buffer.write(bytes({int(seconds * BYTES_PER_SEC)}))\n"
+    monkeypatch.setattr(
+        audio_decoder, "_ffmpeg_command", lambda path, rate: [sys.executable, "-c", script]
+    )
+
+
+def test_streaming_builds_segments_from_final_results(monkeypatch):
+    _fake_decoder(monkeypatch, seconds=3)
+    server = FakeTranscribeStreamingServer(UTTERANCES)
+
+    result = asyncio.run(
+        streaming_transcriber.transcribe_audio_streaming_async("talk.wav", "ja-JP", client=server)
+    )
+
+    assert server.request["media_encoding"] == "pcm"
+    assert server.bytes_received == 3 * BYTES_PER_SEC
+    assert result["text"] == "皆さんこんにちは。始めます"
+    assert [seg["text"] for seg in result["segments"]] == ["皆さんこんにちは。", "始めます"]
+    assert result["segments"][0]["start_time"] == 0.1
+    assert result["duration"] == 2.6
+
+
+def test_streaming_send_failure_kills_decoder(monkeypatch, tmp_path):
+    pid_file = tmp_path / "decoder.pid"
+    _fake_decoder(monkeypatch, pid_file=pid_file)
+    server = FakeTranscribeStreamingServer(UTTERANCES, fail_after_chunks=2)
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(
+            streaming_transcriber.transcribe_audio_streaming_async("talk.wav", "ja-JP", client=server)
+        )
+
+    pid = int(pid_file.read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
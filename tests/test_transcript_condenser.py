@@ -0,0 +1,145 @@
+"""transcript_condenser（トークン予算内の書き起こしの抜粋）のテスト."""
+
+import pytest
+
+from presentation_feedback.core.transcript_condenser import (
+    MAX_SEGMENT_TOKENS,
+    OMISSION_MARK,
+    _is_transition,
+    _starts_sentence,
+    condense_transcript,
+    estimate_tokens,
+    format_timestamp,
+)
+
+
+def make_transcription(texts, seconds_per_segment=5.0):
+    segments = [
+        {
+            "text": text,
+            "start_time": i * seconds_per_segment,
+            "end_time": (i + 1) * seconds_per_segment,
+        }
+        for i, text in enumerate(texts)
+    ]
+    return {"text": "".join(texts), "segments": segments, "duration": len(texts) * seconds_per_segment}
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("こんにちは") == 5
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+    assert estimate_tokens("今日はAWSの話") == 5 + 1
+
+
+def test_format_timestamp():
+    assert format_timestamp(0) == "00:00"
+    assert format_timestamp(125.9) == "02:05"
+    assert format_timestamp(3600) == "60:00"
+
+
+def test_short_transcript_is_returned_as_is():
+    transcription = make_transcription(["本日はお集まりいただきありがとうございます。", "以上です。"])
+    result = condense_transcript(transcription, token_budget=1000)
+    assert result["text"] == transcription["text"]
+    assert not result["is_condensed"]
+    assert result["kept_segments"] == result["total_segments"] == 2
+
+
+def test_long_transcript_fits_budget_and_keeps_key_parts():
+    texts = ["本日はクラウド移行についてお話しします。"]
+    texts += [f"本題の説明その{i}で、具体的な数値と事例を紹介していきます。" for i in range(1, 200)]
+    texts[100] = "次に、コストの話に移ります。"
+    texts.append("以上をまとめると、段階的な移行が重要です。")
+    transcription = make_transcription(texts)
+
+    result = condense_transcript(transcription, token_budget=600)
+
+    assert result["is_condensed"]
+    assert result["tokens"] <= 600
+    assert result["tokens"] == estimate_tokens(result["text"])
+    assert 0 < result["kept_segments"] < result["total_segments"] == len(texts)
+    lines = result["text"].split("\n")
+    # 導入・まとめ・話題の転換を残す
+    assert lines[0] == f"[00:00] {texts[0]}"
+    assert lines[-1] == f"[{format_timestamp(200 * 5.0)}] {texts[-1]}"
+    assert f"[{format_timestamp(100 * 5.0)}] {texts[100]}" in lines
+    assert OMISSION_MARK in lines
+    # 中略の印は連続しない
+    assert all(not (a == b == OMISSION_MARK) for a, b in zip(lines, lines[1:]))
+
+
+def test_kept_segments_are_in_time_order_and_spread_out():
+    texts = [f"セグメント{i:03d}の内容を詳しく説明します。" for i in range(300)]
+    result = condense_transcript(make_transcription(texts), token_budget=800)
+
+    kept = [int(line[line.index("セグメント") + 5:][:3]) for line in result["text"].split("\n") if line != OMISSION_MARK]
+    assert kept == sorted(kept)
+    # 本題（中央付近）からも抜き出す
+    assert any(120 <= index < 180 for index in kept)
+
+
+def test_long_segment_is_truncated():
+    long_text = "あ" * (MAX_SEGMENT_TOKENS * 3)
+    texts = ["導入です。"] + [long_text] * 50 + ["まとめです。"]
+    result = condense_transcript(make_transcription(texts), token_budget=1000)
+
+    assert result["is_condensed"]
+    for line in result["text"].split("\n"):
+        assert estimate_tokens(line) <= MAX_SEGMENT_TOKENS + len("[00:00] ")
+
+
+def test_empty_segments_are_returned_as_is():
+    transcription = {"text": "テキスト" * 1000, "segments": [], "duration": 0.0}
+    result = condense_transcript(transcription, token_budget=10)
+    assert not result["is_condensed"]
+    assert result["text"] == transcription["text"]
+
+
+@pytest.mark.parametrize("text", [
+    "次に、コストの話に移ります。",
+    "では始めましょう。",
+    "「また」別の事例です。",
+    "Now, let's look at the numbers.",
+    "  Moving on to the results.",
+    "FINALLY we get there.",
+])
+def test_transition_at_sentence_start(text):
+    assert _is_transition(text)
+
+
+@pytest.mark.parametrize("text", [
+    "I know this is hard.",        # "now"を"know"の一部として数えない
+    "Nowadays everyone uses it.",
+    "Anotherwise unrelated word.",
+    "Firstly is not a marker.",
+    "Thenceforth nothing changed.",
+    "これではうまくいきません。",  # 文中の「では」
+    "私もまた同じ意見です。",      # 文中の「また」
+    "The next step is testing.",
+])
+def test_marker_inside_a_sentence_is_not_a_transition(text):
+    assert not _is_transition(text)
+
+
+def test_segment_after_comma_is_not_a_sentence_start():
+    segments = [{"text": "今日は、"}, {"text": "また雨です。"}, {"text": "また明日。"}, {"text": "So, "}]
+    assert _starts_sentence(segments, 0)
+    assert not _starts_sentence(segments, 1)
+    assert _starts_sentence(segments, 2)
+    assert _starts_sentence(segments, 3)
+
+
+@pytest.mark.parametrize("previous, kept", [("この構成は安価で、", False), ("この構成は安価です。", True)])
+def test_only_sentence_initial_markers_are_preferred(previous, kept):
+    texts = ["本日はクラウド移行についてお話しします。"]
+    texts += [f"本題の説明その{i}で、具体的な数値と事例を紹介していきます。" for i in range(1, 200)]
+    # 111番目は均等な抜き出しでは選ばれない位置
+    texts[110] = previous
+    texts[111] = "また運用も容易です。"
+    texts.append("以上をまとめると、段階的な移行が重要です。")
+
+    lines = condense_transcript(make_transcription(texts), token_budget=600)["text"].split("\n")
+
+    assert (f"[{format_timestamp(111 * 5.0)}] {texts[111]}" in lines) is kept
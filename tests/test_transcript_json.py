@@ -0,0 +1,84 @@
+"""Transcribe結果JSONのストリーミング読み込みのテスト."""
+
+import json
+import random
+
+import pytest
+
+from presentation_feedback.core.transcript_json import (
+    iter_transcript_document,
+    parse_transcript_stream,
+)
+from presentation_feedback.core.transcript_segments import iter_transcript_segments
+
+
+def _word(content, start, end):
+    return {
+        "type": "pronunciation",
+        "start_time": str(start),
+        "end_time": str(end),
+        "alternatives": [{"confidence": "0.98", "content": content}],
+    }
+
+
+def _punct(mark):
+    return {"type": "punctuation", "alternatives": [{"confidence": "0.0", "content": mark}]}
+
+
+ITEMS = [
+    _word("皆さん", 0.1, 0.5), _word("こんにちは", 0.6, 1.2), _punct("。"),
+    _word("\"引用\"と\\記号", 1.5, 2.0), _word("です", 2.0, 2.4), _punct("。"),
+]
+
+DOCUMENT = {
+    "jobName": "job-1",
+    "accountId": "123",
+    "results": {
+        "transcripts": [{"transcript": "皆さんこんにちは。\"引用\"と\\記号です。"}],
+        "items": ITEMS,
+        # 読み飛ばす対象（入れ子・エスケープ・数値を含む）
+        "audio_segments": [{"id": 0, "transcript": "x}]\\\"{[", "items": [0, 1, 2], "end": 1.25e2}],
+    },
+    "status": "COMPLETED",
+    "extra": [True, None, -3],
+}
+
+
+def _split(data: bytes, rng: random.Random):
+    """ランダムな位置（UTF-8の文字の途中も含む）で分割."""
+    pos = 0
+    while pos < len(data):
+        size = rng.randint(1, 17)
+        yield data[pos:pos + size]
+        pos += size
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_random_chunk_splits_give_same_result(indent):
+    data = json.dumps(DOCUMENT, ensure_ascii=False, indent=indent).encode("utf-8")
+    expected = list(iter_transcript_segments(ITEMS))
+    for seed in range(50):
+        result = parse_transcript_stream(_split(data, random.Random(seed)))
+        assert result["text"] == DOCUMENT["results"]["transcripts"][0]["transcript"]
+        assert result["segments"] == expected
+        assert result["duration"] == 2.4
+
+
+def test_document_yields_only_transcripts_and_items():
+    data = json.dumps(DOCUMENT).encode("utf-8")
+    events = list(iter_transcript_document([data]))
+    assert [kind for kind, _ in events] == ["transcript"] + ["item"] * len(ITEMS)
+    assert [value for kind, value in events if kind == "item"] == ITEMS
+
+
+def test_results_key_order_does_not_matter():
+    document = {"results": {"audio_segments": [], "items": ITEMS, "transcripts": [{"transcript": "t"}]}}
+    result = parse_transcript_stream([json.dumps(document).encode("utf-8")])
+    assert result["text"] == "t"
+    assert len(result["segments"]) == 2
+
+
+def test_truncated_document_raises():
+    data = json.dumps(DOCUMENT).encode("utf-8")
+    with pytest.raises(ValueError):
+        parse_transcript_stream([data[: len(data) // 2]])
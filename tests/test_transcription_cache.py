@@ -0,0 +1,151 @@
+"""書き起こしキャッシュのテスト."""
+
+import io
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError
+
+from presentation_feedback.core import transcription_cache
+from presentation_feedback.core.transcriber_registry import get_transcriber_cache_options
+from presentation_feedback.core.transcription_cache import (
+    CacheBackend,
+    LocalDirectoryBackend,
+    S3PrefixBackend,
+    TranscriptionCache,
+)
+
+
+RESULT = {"text": "こんにちは。", "segments": [], "duration": 1.0}
+
+
+def _cache(tmp_path, max_bytes=10 * 1024 * 1024):
+    return TranscriptionCache(LocalDirectoryBackend(str(tmp_path)), max_bytes=max_bytes)
+
+
+def test_entries_are_separated_by_backend(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put("hash", "ja-JP", "batch", RESULT)
+
+    assert cache.get("hash", "ja-JP", "batch") == RESULT
+    assert cache.get("hash", "ja-JP", "streaming") is None
+    assert cache.get("hash", "ja-JP", "local") is None
+    assert cache.get("hash", "en-US", "batch") is None
+
+
+def test_entries_are_separated_by_options(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put("hash", "ja-JP", "local", RESULT, {"model": "small"})
+
+    assert cache.get("hash", "ja-JP", "local", {"model": "small"}) == RESULT
+    assert cache.get("hash", "ja-JP", "local", {"model": "large-v3"}) is None
+    assert cache.get("hash", "ja-JP", "local") is None
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_key_does_not_depend_on_option_order():
+    a = TranscriptionCache.make_key("h", "ja-JP", "local", {"model": "small", "compute_type": "int8"})
+    b = TranscriptionCache.make_key("h", "ja-JP", "local", {"compute_type": "int8", "model": "small"})
+    assert a == b
+
+
+def test_registered_backends_declare_output_options():
+    import presentation_feedback.core  # noqa: F401  バックエンドを登録
+
+    assert "model" in get_transcriber_cache_options("local")
+    assert "chunk_sec" in get_transcriber_cache_options("chunked")
+    assert get_transcriber_cache_options("batch") == {}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put("old", "ja-JP", "batch", RESULT)
+    cache.put("new", "ja-JP", "batch", RESULT)
+    old_path = tmp_path / f"{TranscriptionCache.make_key('old', 'ja-JP', 'batch')}.json"
+    os.utime(old_path, (0, 0))
+
+    cache.max_bytes = old_path.stat().st_size * 2
+    cache.put("newest", "ja-JP", "batch", RESULT)
+
+    assert cache.get("old", "ja-JP", "batch") is None
+    assert cache.get("new", "ja-JP", "batch") == RESULT
+    assert cache.get("newest", "ja-JP", "batch") == RESULT
+
+
+class FakeS3:
+    """put/get/list/deleteだけを持つ偽のS3クライアント（呼び出しを記録する）."""
+
+    def __init__(self):
+        self.objects = {}
+        self.calls = []
+
+    def put_object(self, Bucket, Key, Body):
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    def get_object(self, Bucket, Key):
+        self.calls.append("get_object")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def delete_object(self, Bucket, Key):
+        self.calls.append("delete_object")
+        self.objects.pop(Key, None)
+
+    def get_paginator(self, name):
+        self.calls.append(name)
+        contents = [
+            {"Key": key, "Size": len(body), "LastModified": datetime.fromtimestamp(i, timezone.utc)}
+            for i, (key, body) in enumerate(self.objects.items())
+        ]
+        return SimpleNamespace(paginate=lambda **kwargs: [{"Contents": contents}])
+
+
+def test_backend_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_s3_get_only_reads():
+    s3 = FakeS3()
+    backend = S3PrefixBackend("bucket", "cache/", s3_client=s3)
+    backend.put("key", b"{}")
+    s3.calls.clear()
+
+    assert backend.get("key") == b"{}"
+    assert s3.calls == ["get_object"]
+
+
+def test_s3_listing_is_limited_to_the_sweep_interval(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(transcription_cache.time, "monotonic", lambda: now[0])
+    s3 = FakeS3()
+    backend = S3PrefixBackend("bucket", "cache/", s3_client=s3)
+    backend.sweep_interval_sec = 3600
+    cache = TranscriptionCache(backend, max_bytes=10 * 1024 * 1024)
+
+    for name in ("a", "b", "c"):
+        cache.put(name, "ja-JP", "batch", RESULT)
+    assert s3.calls.count("list_objects_v2") == 1
+
+    now[0] += 3600
+    cache.put("d", "ja-JP", "batch", RESULT)
+    assert s3.calls.count("list_objects_v2") == 2
+
+
+def test_s3_sweep_deletes_oldest_writes():
+    s3 = FakeS3()
+    backend = S3PrefixBackend("bucket", "cache/", s3_client=s3)
+    backend.sweep_interval_sec = 0
+    cache = TranscriptionCache(backend, max_bytes=10 * 1024 * 1024)
+    cache.put("old", "ja-JP", "batch", RESULT)
+    cache.put("new", "ja-JP", "batch", RESULT)
+
+    cache.max_bytes = len(next(iter(s3.objects.values()))) * 2
+    cache.put("newest", "ja-JP", "batch", RESULT)
+
+    assert cache.get("old", "ja-JP", "batch") is None
+    assert cache.get("new", "ja-JP", "batch") == RESULT
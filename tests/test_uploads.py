@@ -0,0 +1,73 @@
+"""uploads（アップロードファイルの一時ファイルへのコピー）のテスト."""
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from presentation_feedback.core import uploads
+from presentation_feedback.core.uploads import get_peak_rss_mb, save_upload_to_temp
+
+
+class TrackingReader(io.RawIOBase):
+    """指定サイズのデータを返し、1回の読み込みサイズの最大値を記録するファイルオブジェクト."""
+
+    def __init__(self, size, fail_after=None):
+        self.size = size
+        self.position = 0
+        self.max_read = 0
+        self.fail_after = fail_after
+
+    def readable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self.position = offset
+        return offset
+
+    def read(self, size=-1):
+        if self.fail_after is not None and self.position >= self.fail_after:
+            raise ConnectionError("upload interrupted")
+        size = self.size - self.position if size < 0 else min(size, self.size - self.position)
+        self.max_read = max(self.max_read, size)
+        self.position += size
+        return b"\x01" * size
+
+
+def test_copies_from_the_start_and_keeps_suffix():
+    fileobj = io.BytesIO(b"RIFF....WAVE")
+    fileobj.seek(5)
+
+    path = save_upload_to_temp(fileobj, suffix=".wav")
+    try:
+        assert path.endswith(".wav")
+        assert Path(path).read_bytes() == b"RIFF....WAVE"
+    finally:
+        os.unlink(path)
+
+
+def test_large_upload_is_copied_in_bounded_chunks():
+    size = 64 * 1024 * 1024 + 123
+    fileobj = TrackingReader(size)
+
+    path = save_upload_to_temp(fileobj, suffix=".mp3", chunk_size=1024 * 1024)
+    try:
+        assert os.path.getsize(path) == size
+        assert fileobj.max_read <= 1024 * 1024
+    finally:
+        os.unlink(path)
+
+
+def test_temp_file_is_removed_when_copy_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads.tempfile, "tempdir", str(tmp_path))
+
+    with pytest.raises(ConnectionError):
+        save_upload_to_temp(TrackingReader(10 * 1024, fail_after=4096), suffix=".m4a", chunk_size=1024)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_peak_rss_is_positive_or_unavailable():
+    peak = get_peak_rss_mb()
+    assert peak is None or peak > 0